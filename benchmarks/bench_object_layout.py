@@ -0,0 +1,96 @@
+"""Benchmark: slotted vs. __dict__-based game object layout.
+
+Compares per-instance memory and attribute read/write speed of:
+- two plain classes with the falling-object attribute set, one with
+  ``__slots__`` and one with a per-instance ``__dict__``;
+- the real, detached ``Bubble`` and ``Power`` classes against subclasses
+  that add a per-instance ``__dict__``. Their hot fields are ``StoreField``
+  descriptors, so access cost is the descriptor's, not the layout's;
+- a ``Bubble`` attached to an ``ObjectStore``, whose fields read and write
+  numpy columns.
+
+Run from the repository root:
+    python -m benchmarks.bench_object_layout
+"""
+import sys
+import os
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from objects.bubble import Bubble
+from objects.object_store import ObjectStore
+from objects.power import Power
+
+INSTANCES = 10000
+# The attributes a Bubble exposes
+ATTRIBUTES = ('x', 'y', 'speed', 'radius', 'type', 'active', 'frozen', 'original_speed',
+              'handle', 'color', 'draw_radius')
+
+
+class DictObject:
+    def __init__(self):
+        for name in ATTRIBUTES:
+            setattr(self, name, 1.0)
+
+
+class SlottedObject:
+    __slots__ = ATTRIBUTES
+
+    def __init__(self):
+        for name in ATTRIBUTES:
+            setattr(self, name, 1.0)
+
+
+class DictBubble(Bubble):
+    """Bubble whose instances also get a ``__dict__``, as without slotting."""
+
+
+class DictPower(Power):
+    """Power whose instances also get a ``__dict__``, as without slotting."""
+
+
+def _bytes_per_instance(factory) -> float:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    keep = [factory() for _ in range(INSTANCES)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    used = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del keep
+    return used / INSTANCES
+
+
+def _access_ns(obj) -> float:
+    def touch():
+        obj.y = obj.y + obj.speed * 0.016
+        return obj.radius * 0.3 + obj.x
+    number = 200000
+    return min(timeit.repeat(touch, number=number, repeat=5)) / number * 1e9
+
+
+def _attached_bubble() -> Bubble:
+    bubble = Bubble(x=0.0, y=0.0)
+    ObjectStore().add(bubble)
+    return bubble
+
+
+def main() -> None:
+    rows = (
+        ('plain __dict__', DictObject, True),
+        ('plain __slots__', SlottedObject, True),
+        ('Bubble __slots__', lambda: Bubble(x=0.0, y=0.0), True),
+        ('Bubble __dict__', lambda: DictBubble(x=0.0, y=0.0), True),
+        ('Power __slots__', lambda: Power(x=0.0, y=0.0), True),
+        ('Power __dict__', lambda: DictPower(x=0.0, y=0.0), True),
+        ('Bubble attached', _attached_bubble, False),
+    )
+    print(f"{'layout':<22} {'bytes/instance':>15} {'read+write (ns)':>16}")
+    for name, factory, measure_memory in rows:
+        memory = f"{_bytes_per_instance(factory):>15.0f}" if measure_memory else f"{'-':>15}"
+        print(f"{name:<22} {memory} {_access_ns(factory()):>16.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark: uniform-grid spatial index vs. brute-force hit testing.
+
+Times one game tick (``update_all`` + ``check_hits`` for two fists) with and
+without the grid for a range of object counts and reports where the grid
+starts to pay off.
+
+Run from the repository root:
+    python -m benchmarks.bench_spatial_grid
+"""
+import sys
+import os
+import timeit
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from objects.object_manager import ObjectManager
+from config.game_config import config
+
+COUNTS = [10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+CELL_SIZES = [32, 64, 128]
+TICKS = 200
+
+
+def _populate(manager: ObjectManager, count: int, seed: int = 0) -> None:
+    rng = np.random.default_rng(seed)
+    for _ in range(count):
+        obj = manager.spawn_bubble()
+        obj.x = rng.uniform(0, config.WINDOW_WIDTH)
+        obj.y = rng.uniform(0, config.WINDOW_HEIGHT)
+        obj.speed = 0.0  # keep the population stable across ticks
+    manager.refresh_spatial_index()
+
+
+def _tick_time(manager: ObjectManager, fists: np.ndarray) -> float:
+    def tick():
+        manager.update_all(1.0 / 60.0)
+        manager.check_hits(fists)
+    return min(timeit.repeat(tick, number=TICKS, repeat=3)) / TICKS
+
+
+def main() -> None:
+    fists = np.array([[200.0, 300.0], [600.0, 300.0]])
+    header = f"{'objects':>8} {'brute (us)':>11}" + "".join(f" {f'grid {c} (us)':>14}" for c in CELL_SIZES)
+    print(header)
+    crossover = {}
+    for count in COUNTS:
+        brute = ObjectManager(max_objects=count, cell_size=None)
+        _populate(brute, count)
+        brute_t = _tick_time(brute, fists)
+        row = f"{count:>8} {brute_t * 1e6:>11.1f}"
+        for cell in CELL_SIZES:
+            grid = ObjectManager(max_objects=count, cell_size=cell)
+            _populate(grid, count)
+            grid_t = _tick_time(grid, fists)
+            row += f" {grid_t * 1e6:>14.1f}"
+            if grid_t < brute_t and cell not in crossover:
+                crossover[cell] = count
+        print(row)
+    for cell in CELL_SIZES:
+        where = crossover.get(cell)
+        print(f"cell {cell}px: grid faster from {where} objects" if where
+              else f"cell {cell}px: grid never faster in tested range")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark: 8-offset text outline vs. single-pass dilated outline.
+
+Times rasterizing an outlined string both ways (the cost of a text-cache
+miss) and reports how far the dilated outline's pixels are from the
+8-offset reference over the pixels the text touches.
+
+Run from the repository root:
+    python -m benchmarks.bench_text_outline
+"""
+import sys
+import os
+import timeit
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rendering.renderer import Renderer
+
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+TEXT = "Score: 12345"
+CASES = ((0.7, 2), (1.0, 2), (2.0, 4))
+OFFSETS = ((-1, -1), (-1, 1), (1, -1), (1, 1), (-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+def offset_outline(frame, scale, thickness):
+    for dx, dy in OFFSETS:
+        cv2.putText(frame, TEXT, (20 + dx, 90 + dy), FONT, scale, (0, 0, 0), thickness + 1)
+    cv2.putText(frame, TEXT, (20, 90), FONT, scale, (255, 255, 255), thickness)
+
+
+def main() -> None:
+    renderer = Renderer()
+    background = np.random.default_rng(0).integers(0, 256, (160, 640, 3), dtype=np.uint8)
+    number = 500
+
+    print(f"{'scale':>6} {'8-offset (us)':>14} {'dilation (us)':>14} {'speedup':>8} {'mean |diff|':>12}")
+    for scale, thickness in CASES:
+        frame = background.copy()
+        offset_us = min(timeit.repeat(lambda: offset_outline(frame, scale, thickness),
+                                      number=number, repeat=5)) / number * 1e6
+        dilate_us = min(timeit.repeat(
+            lambda: renderer._render_text(TEXT, scale, thickness, (255, 255, 255), True, (0, 0, 0), 1),
+            number=number, repeat=5)) / number * 1e6
+
+        expected = background.copy()
+        offset_outline(expected, scale, thickness)
+        drawn = background.copy()
+        renderer.draw_text(drawn, TEXT, (20, 90), color=(255, 255, 255), font_scale=scale,
+                           thickness=thickness, outline=True)
+        touched = np.any(expected != background, axis=2)
+        diff = np.abs(drawn.astype(int) - expected.astype(int))[touched].mean()
+
+        print(f"{scale:>6.1f} {offset_us:>14.1f} {dilate_us:>14.1f} "
+              f"{offset_us / dilate_us:>7.1f}x {diff:>12.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Tuple
+from typing import Optional, Tuple, Union
 
 
 class GameState(Enum):
@@ -15,6 +15,18 @@ class PowerType(Enum):
     HEALTH = 'H'     # Restore health
 
 
+class SpawnPolicy(Enum):
+    DROP = 'drop'        # Skip the spawn
+    DEFER = 'defer'      # Spawn as soon as an object leaves the screen
+    RECYCLE = 'recycle'  # Remove the oldest object to make room
+
+
+class DetectorBackend(Enum):
+    MEDIAPIPE = 'mediapipe'  # MediaPipe Hands landmark model
+    SKIN = 'skin'            # Skin-colour contours; cheap, for low-power devices
+    REPLAY = 'replay'        # Landmarks recorded to disk; no inference
+
+
 @dataclass
 class GameConfig:
     # Window settings
@@ -22,6 +34,11 @@ class GameConfig:
     WINDOW_HEIGHT: int = 600
     FPS: int = 60
     
+    # Camera settings
+    CAMERA_SOURCE: Union[int, str] = 0  # device index, or a video file path
+    CAMERA_FPS: int = 30  # frame rate requested from the device
+    CAMERA_LOW_LATENCY: bool = True  # ask for a 1-frame driver buffer and MJPG frames
+    
     # Game settings
     INITIAL_COUNTDOWN: int = 10  # seconds
     SCORE_PER_POP: int = 1
@@ -36,13 +53,39 @@ class GameConfig:
     # Power-up settings
     POWER_SPAWN_RATE: float = 0.002  # probability per frame
     POWER_DURATION: float = 5.0  # seconds
+    POWER_PULSE_FRAMES: int = 32  # pre-rendered phases per pulse cycle
     
     # Hand tracking
+    HAND_DETECTOR: DetectorBackend = DetectorBackend.MEDIAPIPE
+    HAND_REPLAY_PATH: Optional[str] = None  # .npz landmark recording for the replay detector
     HAND_DETECTION_CONFIDENCE: float = 0.7
+    SKIN_MIN_AREA: float = 0.02  # smallest skin blob taken as a hand, as a fraction of the image
+    SKIN_FIST_SOLIDITY: float = 0.85  # blob area / convex hull area above which it is a fist
+    HAND_TRACKING_ASYNC: bool = False  # run hand inference on a worker thread
+    HAND_INFERENCE_WIDTH: Optional[int] = None  # downscale to this width for inference; None = full
+    HAND_ROI_ENABLED: bool = False  # crop inference around the last hand boxes
+    HAND_ROI_MARGIN: float = 0.5  # ROI padding as a fraction of the hand box size
+    HAND_ROI_REACQUIRE_FRAMES: int = 10  # run on the full frame at least this often in ROI mode
     FIST_RADIUS: int = 20
+    HAND_SMOOTHING_MIN_CUTOFF: float = 1.0  # Hz; One-Euro cutoff at rest, lower removes more jitter
+    HAND_SMOOTHING_BETA: float = 0.01  # cutoff increase per px/s of hand speed, higher reduces lag
+    FIST_PREDICTION: bool = False  # extrapolate fists to the current time for collision; for HAND_TRACKING_ASYNC
+    FIST_PREDICTION_HORIZON: float = 0.1  # seconds; never extrapolate further than this
+    FIST_PREDICTION_ALPHA: float = 0.8  # position gain of the alpha-beta filter
+    FIST_PREDICTION_BETA: float = 0.4  # velocity gain of the alpha-beta filter
+    FIST_MEASUREMENT_NOISE: float = 4.0  # px; uncertainty of a fresh detection
+    FIST_ACCELERATION_NOISE: float = 20000.0  # px/s^2 of unmodelled acceleration
+    FIST_MAX_UNCERTAINTY: float = 10.0  # px; cap on how much prediction widens the fist radius
+    FIST_MATCH_DISTANCE: float = 150.0  # px; farther detections start a new track
+    
+    # Object pooling / admission control
+    MAX_OBJECTS: int = 100  # objects on screen at once
+    SPAWN_POLICY: SpawnPolicy = SpawnPolicy.DROP  # what to do when MAX_OBJECTS is reached
+    BUBBLE_POOL_PREWARM: int = 30  # bubbles allocated at startup
+    POWER_POOL_PREWARM: int = 5  # power-ups allocated at startup
     
-    # Collision
-    COLLISION_FRAME_INTERVAL: int = 5  # check collision every N frames
+    # Spatial index
+    SPATIAL_CELL_SIZE: Optional[int] = None  # grid cell size in px; None disables the grid (pays off from a few thousand objects)
     
     # Colors (BGR format)
     COLOR_BG: Tuple[int, int, int] = (0, 0, 0)  # Black
@@ -53,6 +96,15 @@ class GameConfig:
     COLOR_FIST: Tuple[int, int, int] = (0, 255, 255)  # Cyan
     COLOR_TEXT: Tuple[int, int, int] = (255, 255, 255)  # White
     
+    # Rendering
+    SPRITE_CACHE_SIZE: int = 64  # max cached bubble looks (radius x colour)
+    TEXT_CACHE_SIZE: int = 128  # max cached text bitmaps in the Renderer
+    TEXT_OUTLINE_WIDTH: int = 1  # pixels of outline around outlined text
+    UI_OPACITY: float = 0.8  # HUD and overlay text blended over the scene
+    GAME_OVER_DIM: float = 0.07  # scene brightness behind the game-over screen
+    DEBUG_OVERLAY: bool = False  # hand-tracking diagnostics on top of the game
+    DEBUG_OVERLAY_KEY: str = 'd'  # toggles the debug overlay while playing
+    
     # Font
     FONT_FACE: int = 0  # cv2.FONT_HERSHEY_SIMPLEX
     FONT_SCALE: float = 1.0
@@ -0,0 +1,99 @@
+from typing import List, Optional, Tuple
+import cv2
+import numpy as np
+
+from config.game_config import config
+
+
+class FrameRing:
+    """Fixed ring of preallocated frames handed out round-robin.
+
+    A frame returned by ``next`` stays valid until the ring wraps around,
+    i.e. for ``slots - 1`` further calls, so a consumer (display, another
+    thread) can hold the previous frame while the next one is being filled.
+    """
+
+    def __init__(self, shape: Tuple[int, ...], slots: int = 2, dtype=np.uint8):
+        if slots < 1:
+            raise ValueError("A frame ring needs at least one slot")
+        self.shape = tuple(shape)
+        self._frames: List[np.ndarray] = [np.empty(shape, dtype=dtype) for _ in range(slots)]
+        self._index = 0
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def next(self) -> np.ndarray:
+        """Return the next buffer of the ring; its previous contents are stale."""
+        frame = self._frames[self._index]
+        self._index = (self._index + 1) % len(self._frames)
+        return frame
+
+
+class FrameBuffers:
+    """Per-stage frame rings reused through ``dst=`` from a captured frame to output.
+
+    Stages: ``output`` (the mirrored frame the game draws on) and ``rgb``
+    (the mirrored RGB frame for hand inference, at ``inference_width`` when
+    set), both filled by ``prepare``. Captured frames are owned by
+    ``CameraCapture``.
+    """
+
+    def __init__(self, width: int, height: int, slots: int = 2,
+                 inference_width: Optional[int] = config.HAND_INFERENCE_WIDTH):
+        self.width = width
+        self.height = height
+        shape = (height, width, 3)
+        self.output = FrameRing(shape, slots)
+        self.rgb = FrameRing(self._inference_shape(width, height, inference_width), slots)
+        self._scaled: Optional[np.ndarray] = None
+        if self.rgb.shape != shape:
+            self._scaled = np.empty(self.rgb.shape, dtype=np.uint8)
+
+    @staticmethod
+    def _inference_shape(width: int, height: int, inference_width: Optional[int]) -> Tuple[int, int, int]:
+        if not inference_width or inference_width >= width:
+            return height, width, 3
+        scale = inference_width / width
+        return max(1, round(height * scale)), inference_width, 3
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        return self.height, self.width, 3
+
+    def prepare(self, frame: np.ndarray, mirror: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """Produce the display frame and the inference frame from a captured BGR frame.
+
+        Both are written into the next buffers of ``output`` and ``rgb``; the
+        captured frame is only read. With ``mirror`` the display frame is
+        flipped horizontally and the RGB frame shows the same mirrored image.
+
+        Returns:
+            tuple: (display, rgb) where display is BGR at full size and rgb is
+            the same picture in RGB, downscaled to the inference width if set
+        """
+        display = self.output.next()
+        rgb = self.rgb.next()
+        if mirror:
+            cv2.flip(frame, 1, dst=display)
+        else:
+            np.copyto(display, frame)
+
+        source = frame
+        if self._scaled is not None:
+            source = cv2.resize(frame, (rgb.shape[1], rgb.shape[0]), dst=self._scaled,
+                                interpolation=cv2.INTER_AREA)
+        if mirror:
+            # Reversing each row's bytes mirrors the pixels and turns BGR into
+            # RGB at once, so no separate colour conversion pass is needed
+            rows = source.shape[0]
+            cv2.flip(source.reshape(rows, -1), 1, dst=rgb.reshape(rows, -1))
+        else:
+            cv2.cvtColor(source, cv2.COLOR_BGR2RGB, dst=rgb)
+        return display, rgb
+
+    @classmethod
+    def for_frame(cls, frame: np.ndarray, slots: int = 2) -> 'FrameBuffers':
+        """Size the buffers from an existing frame."""
+        height, width = frame.shape[:2]
+        return cls(width, height, slots)
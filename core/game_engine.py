@@ -1,47 +1,92 @@
 import cv2
 import time
+from functools import partial
+from typing import Callable, List, Optional, Tuple
 import numpy as np
 
 from config.game_config import config, GameState
+from core.frame_buffers import FrameBuffers
+from input.fist_predictor import FistPredictor
 from input.hand_tracker import HandTracker
+from input.inference_worker import HandInferenceWorker, TrackingResult
 from objects.object_manager import ObjectManager
-from rendering.renderer import Renderer
+from rendering.renderer import Layer, Renderer
+from rendering.debug_overlay import DebugOverlay
+from rendering.hud import GameOverWidget, HudLayer
 from events.event_manager import EventManager, GameEvent, EventType
 
 
 class GameEngine:
-    def __init__(self):
+    def __init__(self, frame_buffers: Optional[FrameBuffers] = None, headless: bool = False,
+                 clock: Optional[Callable[[], float]] = None):
+        """Initialize the game engine.
+        
+        Args:
+            frame_buffers: Reused frame buffers; sized from the first frame when omitted
+            headless: Run the game rules only: no hand tracker, renderer or
+                sound, and events are dispatched synchronously by ``step``
+            clock: Source of game time in seconds; defaults to wall time
+        """
+        self.headless = headless
+        self.clock = clock
         self.state = GameState.INIT
         self.score = 0
         self.health = config.INITIAL_HEALTH
-        self.frame_count = 0
-        self.last_collision_check = 0
-        self.start_time = time.time()
+        self.start_time = self.now()
         self.freeze_until = 0
         self.is_frozen = False
         
         # Initialize components
-        self.hand_tracker = HandTracker()
+        self.hand_tracker = None if headless else HandTracker()
         self.object_manager = ObjectManager()
-        self.renderer = Renderer()
+        self.renderer = None if headless else Renderer()
+        
+        # Hand inference runs on a worker thread in async mode; the game reads
+        # the newest completed result instead of waiting for the model
+        self.hand_worker = None
+        if config.HAND_TRACKING_ASYNC and not headless:
+            self.hand_worker = HandInferenceWorker(self.hand_tracker)
+        self.tracking = TrackingResult()
+        if self.hand_worker is not None:
+            self.hand_worker.start()
+        # Extrapolates fists from the last detection to the time of collision
+        self.fist_predictor = FistPredictor()
+        
+        self.hud = None
+        self.game_over_layer = None
+        self.debug_overlay = None
+        if not headless:
+            self.hud = HudLayer(opacity=config.UI_OPACITY)
+            self.game_over_layer = HudLayer(widgets={'game_over': GameOverWidget()})
+            self.debug_overlay = DebugOverlay()
+        
+        # Reused frame buffers; sized from the first frame unless provided
+        self.frame_buffers = frame_buffers
         self.event_manager = EventManager()
         
         # Register event observers
         self._register_observers()
         
-        # Start event processing thread
-        self.event_manager.start_dispatch_loop()
+        # Start event processing thread; headless runs dispatch in ``step``
+        if not headless:
+            self.event_manager.start_dispatch_loop()
+    
+    def now(self) -> float:
+        """Current game time: the engine's clock if it has one, else wall time."""
+        return self.clock() if self.clock is not None else time.time()
     
     def _register_observers(self):
         from events.observers.score_observer import ScoreObserver
         from events.observers.health_observer import HealthObserver
-        from events.observers.sound_observer import SoundObserver
         from events.observers.freeze_observer import FreezeObserver
         from events.observers.destroy_observer import DestroyObserver
         from events.observers.power_health_observer import PowerHealthObserver
         
         self.event_manager.register_observer(EventType.BUBBLE_HIT, ScoreObserver(self))
-        self.event_manager.register_observer(EventType.BUBBLE_HIT, SoundObserver())
+        if not self.headless:
+            # Sound is the only observer with no effect on the game rules
+            from events.observers.sound_observer import SoundObserver
+            self.event_manager.register_observer(EventType.BUBBLE_HIT, SoundObserver())
         self.event_manager.register_observer(EventType.BUBBLE_MISSED, HealthObserver(self))
         self.event_manager.register_observer(EventType.POWER_ACTIVATED, FreezeObserver(self))
         self.event_manager.register_observer(EventType.POWER_ACTIVATED, DestroyObserver(self))
@@ -49,6 +94,9 @@ class GameEngine:
     
     def update(self, dt: float):
         """Update game state"""
+        # The countdown is over: start playing
+        if self.state == GameState.INIT and self.now() - self.start_time >= config.INITIAL_COUNTDOWN:
+            self.state = GameState.RUNNING
         if self.state != GameState.RUNNING:
             return
             
@@ -74,7 +122,7 @@ class GameEngine:
     
     def _update_freeze_state(self):
         """Checks if the freeze duration has expired and unfreezes objects."""
-        if self.is_frozen and time.time() >= self.freeze_until:
+        if self.is_frozen and self.now() >= self.freeze_until:
             self.is_frozen = False
             self.object_manager.freeze_all(False)
             self.event_manager.post(GameEvent(EventType.FREEZE_END))
@@ -89,35 +137,30 @@ class GameEngine:
     
     def _check_missed_objects(self):
         """Check for objects that reached the bottom of the screen"""
-        for obj in self.object_manager.get_objects():
-            if obj.y - obj.radius > config.WINDOW_HEIGHT:
-                if obj.type == "bubble":
-                    self.event_manager.post(GameEvent(
-                        EventType.BUBBLE_MISSED,
-                        {"object": obj}
-                    ))
-                self.object_manager.remove_object(obj)
+        for obj in self.object_manager.get_objects_below(config.WINDOW_HEIGHT):
+            if obj.type == "bubble":
+                self.event_manager.post(GameEvent(
+                    EventType.BUBBLE_MISSED,
+                    {"object": obj}
+                ))
+            self.object_manager.remove_object(obj)
     
     def _check_collisions(self):
-        self.frame_count += 1
-        
-        # Only check collisions every N frames for performance
-        if (self.frame_count - self.last_collision_check) < config.COLLISION_FRAME_INTERVAL:
-            return
-            
-        self.last_collision_check = self.frame_count
-        
         # Get current fist positions
-        fist_positions = self.hand_tracker.get_fist_positions()
+        fist_radius = config.FIST_RADIUS
+        if config.FIST_PREDICTION and not self.headless:
+            # Fists where they should be now, widened by how unsure that is
+            predicted = self.fist_predictor.predict(self.now())
+            fist_positions = [(fist.x, fist.y) for fist in predicted]
+            fist_radius = np.array([config.FIST_RADIUS + fist.uncertainty for fist in predicted])
+        else:
+            fist_positions = self.tracking.fist_positions
         if not fist_positions or len(fist_positions) < 1:
             return
             
-        # Check for hits
-        for obj in self.object_manager.get_objects():
-            for fist_pos in fist_positions:
-                if obj.is_hit(fist_pos):
-                    self._handle_hit(obj)
-                    break  # Object can only be hit once
+        # One batched test against every object; each object is hit at most once
+        for obj in self.object_manager.get_hit_objects(fist_positions, fist_radius):
+            self._handle_hit(obj)
     
     def _handle_hit(self, obj):
         event_type = EventType.BUBBLE_HIT if obj.type == "bubble" else EventType.POWER_ACTIVATED
@@ -129,102 +172,37 @@ class GameEngine:
         self.object_manager.remove_object(obj)
     
     def draw(self, frame):
-        """Draw the current game state on top of the camera frame"""
-        # Make a copy of the frame to draw on
-        frame_copy = frame.copy()
-        
-        # Draw all game objects
-        self.object_manager.draw_all(frame_copy)
-        
-        # Draw fists (hand tracking)
-        self.hand_tracker.draw_fists(frame_copy)
-        
-        # Create a semi-transparent overlay for UI elements
-        overlay = frame_copy.copy()
-        
-        # Draw UI elements on the overlay
-        self._draw_ui(overlay)
+        """Draw the current game state on top of the camera frame, in place"""
+        # Game objects, fists and UI submit draw commands to the renderer
+        self.object_manager.draw_all(self.renderer)
+        self.hand_tracker.draw_fists(self.renderer, self.tracking.raw_positions)
+        self._draw_ui()
         
         # Draw game state specific elements
         if self.state == GameState.INIT:
-            self._draw_countdown(overlay)
+            self._draw_countdown()
         elif self.state == GameState.GAME_OVER:
-            self._draw_game_over(overlay)
+            self.renderer.submit(Layer.OVERLAY, self._draw_game_over)
         
-        # Blend the overlay with the frame
-        alpha = 0.8  # Adjust this value to control transparency (0.0 to 1.0)
-        cv2.addWeighted(overlay, alpha, frame_copy, 1 - alpha, 0, frame_copy)
+        if self.debug_overlay.enabled:
+            self.debug_overlay.submit(self.renderer, self.tracking,
+                                      self.fist_predictor.predict(self.now()))
         
-        # Copy the result back to the original frame
-        frame[:] = frame_copy
+        # Execute the command list once for the whole frame
+        self.renderer.flush(frame)
     
-    def _draw_ui(self, frame):
-        self._draw_score(frame)
-        self._draw_health_bar(frame)
-        self._draw_freeze_indicator(frame)
+    def _draw_ui(self):
+        # Widgets are only re-rasterized when the value they display changes;
+        # the HUD sprites carry UI_OPACITY in their masks
+        now = self.now()
+        self.hud.set('score', self.score)
+        self.hud.set('health', self.health)
+        self.hud.set('freeze', int(self.freeze_until - now) if now < self.freeze_until else None)
+        for sprite, (x, y) in self.hud.sprites():
+            self.renderer.submit_sprite(Layer.HUD, sprite, x, y)
     
-    def _draw_score(self, frame):
-        score_text = f"Score: {self.score}"
-        cv2.putText(frame, score_text, (10, 30), 
-                   config.FONT_FACE, config.FONT_SCALE, 
-                   config.COLOR_TEXT, config.FONT_THICKNESS)
-        
-    def _draw_health_bar(self, frame):
-        health_bar_width = 200
-        health_bar_height = 20
-        health_bar_x = config.WINDOW_WIDTH - health_bar_width - 10
-        health_bar_y = 10
-        
-        # Background
-        cv2.rectangle(frame, 
-                     (health_bar_x, health_bar_y), 
-                     (health_bar_x + health_bar_width, health_bar_y + health_bar_height), 
-                     (100, 100, 100), -1)
-        
-        # Current health
-        health_width = int((self.health / 100.0) * health_bar_width)
-        health_color = (0, 255, 0)  # Green when full
-        if self.health < 30:
-            health_color = (0, 0, 255)  # Red when low
-        elif self.health < 60:
-            health_color = (0, 165, 255)  # Orange when medium
-            
-        cv2.rectangle(frame, 
-                     (health_bar_x, health_bar_y), 
-                     (health_bar_x + health_width, health_bar_y + health_bar_height), 
-                     health_color, -1)
-        
-        # Border
-        cv2.rectangle(frame, 
-                     (health_bar_x, health_bar_y), 
-                     (health_bar_x + health_bar_width, health_bar_y + health_bar_height), 
-                     (255, 255, 255), 1)
-        
-        # Health text
-        health_text = f"{int(self.health)}%"
-        text_size = cv2.getTextSize(health_text, config.FONT_FACE, 
-                                  config.FONT_SCALE * 0.7, config.FONT_THICKNESS)[0]
-        text_x = health_bar_x + (health_bar_width - text_size[0]) // 2
-        text_y = health_bar_y + (health_bar_height + text_size[1]) // 2
-        
-        cv2.putText(frame, health_text, (text_x, text_y), 
-                   config.FONT_FACE, config.FONT_SCALE * 0.7, 
-                   (0, 0, 0), config.FONT_THICKNESS)
-        
-    def _draw_freeze_indicator(self, frame):
-        if time.time() < self.freeze_until:
-            freeze_text = f"FREEZE! {int(self.freeze_until - time.time())}s"
-            text_size = cv2.getTextSize(freeze_text, config.FONT_FACE, 
-                                      config.FONT_SCALE, config.FONT_THICKNESS)[0]
-            text_x = (config.WINDOW_WIDTH - text_size[0]) // 2
-            text_y = config.WINDOW_HEIGHT - 30
-            
-            cv2.putText(frame, freeze_text, (text_x, text_y), 
-                       config.FONT_FACE, config.FONT_SCALE, 
-                       (255, 255, 255), config.FONT_THICKNESS + 1)
-    
-    def _draw_countdown(self, frame):
-        elapsed = time.time() - self.start_time
+    def _draw_countdown(self):
+        elapsed = self.now() - self.start_time
         if elapsed < config.INITIAL_COUNTDOWN:
             countdown = int(config.INITIAL_COUNTDOWN - elapsed) + 1
             text = str(countdown) if countdown > 0 else "GO!"
@@ -234,73 +212,66 @@ class GameEngine:
             text_x = (config.WINDOW_WIDTH - text_size[0]) // 2
             text_y = (config.WINDOW_HEIGHT + text_size[1]) // 2
             
-            # Shadow
-            cv2.putText(frame, text, (text_x + 3, text_y + 3), 
-                       config.FONT_FACE, config.FONT_SCALE * 4, 
-                       (100, 100, 100), config.FONT_THICKNESS * 2)
-            
-            # Main text
-            cv2.putText(frame, text, (text_x, text_y), 
-                       config.FONT_FACE, config.FONT_SCALE * 4, 
-                       (255, 255, 255), config.FONT_THICKNESS * 2)
-        else:
-            self.state = GameState.RUNNING
+            # Shadow offset and stroke thickness bound the text box
+            pad = 3 + config.FONT_THICKNESS * 2
+            box = (text_x - pad, text_y - text_size[1] - pad,
+                   text_size[0] + 2 * pad, text_size[1] * 3 // 2 + 2 * pad)
+            self.renderer.submit(Layer.OVERLAY,
+                                 partial(self._draw_countdown_text, text=text, position=(text_x, text_y)),
+                                 box, blend=True)
+    
+    def _draw_countdown_text(self, frame, text, position):
+        # Both strings come from the renderer's text cache, so each digit is
+        # rasterized once instead of every frame
+        text_x, text_y = position
+        style = dict(font_scale=config.FONT_SCALE * 4, thickness=config.FONT_THICKNESS * 2)
+        # Shadow
+        self.renderer.draw_text(frame, text, (text_x + 3, text_y + 3), color=(100, 100, 100), **style)
+        
+        # Main text
+        self.renderer.draw_text(frame, text, (text_x, text_y), color=(255, 255, 255), **style)
     
     def _draw_game_over(self, frame):
-        # Create a copy of the frame to work on
-        overlay = frame.copy()
-        
-        # Draw semi-transparent black overlay
-        cv2.rectangle(overlay, (0, 0), (config.WINDOW_WIDTH, config.WINDOW_HEIGHT), 
-                     (0, 0, 0), -1)
-        alpha = 0.8  # 80% opacity
-        cv2.addWeighted(overlay, alpha, frame, 1 - alpha, 0, frame)
-        
-        # Game Over text with shadow for better visibility
-        text = "GAME OVER"
-        text_scale = config.FONT_SCALE * 3
-        text_thickness = config.FONT_THICKNESS * 2
-        text_size = cv2.getTextSize(text, config.FONT_FACE, text_scale, text_thickness)[0]
-        text_x = (config.WINDOW_WIDTH - text_size[0]) // 2
-        text_y = config.WINDOW_HEIGHT // 3
-        
-        # Draw shadow
-        cv2.putText(frame, text, (text_x + 2, text_y + 2), 
-                   config.FONT_FACE, text_scale, 
-                   (0, 0, 0), text_thickness)
-        # Draw main text
-        cv2.putText(frame, text, (text_x, text_y), 
-                   config.FONT_FACE, text_scale, 
-                   (0, 0, 255), text_thickness)
-        
-        # Score with shadow
-        score_text = f"Final Score: {self.score}"
-        score_scale = config.FONT_SCALE * 1.5
-        score_size = cv2.getTextSize(score_text, config.FONT_FACE, 
-                                   score_scale, config.FONT_THICKNESS)[0]
-        score_x = (config.WINDOW_WIDTH - score_size[0]) // 2
-        score_y = text_y + 100
-        
-        # Draw shadow
-        cv2.putText(frame, score_text, (score_x + 1, score_y + 1), 
-                   config.FONT_FACE, score_scale, 
-                   (0, 0, 0), config.FONT_THICKNESS + 1)
-        # Draw main text
-        cv2.putText(frame, score_text, (score_x, score_y), 
-                   config.FONT_FACE, score_scale, 
-                   (255, 255, 255), config.FONT_THICKNESS)
-        
-        # Make sure to return the modified frame
+        # Darken the scene in place, then composite the cached text layer,
+        # which is only re-rendered when the final score changes
+        cv2.convertScaleAbs(frame, dst=frame, alpha=config.GAME_OVER_DIM)
+        self.game_over_layer.set('game_over', self.score)
+        self.game_over_layer.draw(frame)
         return frame
-
     
-    def process_frame(self, frame):
-        """Process a single frame - update hand tracking and game state"""
-        # Make a copy of the frame to prevent modifying the original
-        frame_copy = frame.copy()
+    def process_frame(self, frame, timestamp: Optional[float] = None, mirror: bool = False):
+        """Process a single frame - update hand tracking and game state
+        
+        ``frame_buffers.prepare`` writes the display frame, which is drawn on
+        in place and returned, and the RGB inference frame in one stage; the
+        caller's frame is left untouched. The returned buffer is reused once
+        the output ring wraps around.
+        
+        Args:
+            frame: Camera frame (BGR)
+            timestamp: Capture time of the frame; defaults to now
+            mirror: Flip the frame horizontally for a mirror view
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        if self.frame_buffers is None or self.frame_buffers.shape != frame.shape:
+            self.frame_buffers = FrameBuffers.for_frame(frame)
+        output, rgb = self.frame_buffers.prepare(frame, mirror)
         
         # Update hand tracking
-        self.hand_tracker.process_frame(frame_copy)
+        if self.hand_worker is not None:
+            self.hand_worker.frame_size = (self.frame_buffers.width, self.frame_buffers.height)
+            self.hand_worker.submit(rgb, timestamp)
+            self.tracking = self.hand_worker.latest()
+        else:
+            self.hand_tracker.process_frame(output, rgb=rgb, timestamp=timestamp)
+            self.tracking = TrackingResult(
+                fist_positions=self.hand_tracker.get_fist_positions(),
+                raw_positions=self.hand_tracker.fist_positions,
+                hands=self.hand_tracker.detections,
+                captured_at=timestamp,
+                completed_at=time.time())
+        self.fist_predictor.update(self.tracking.fist_positions, self.tracking.captured_at)
         
         # Update game state
         current_time = time.time()
@@ -312,11 +283,29 @@ class GameEngine:
         if self.state != GameState.GAME_OVER:
             self.update(dt)
         
-        # Draw the game on the frame copy
-        self.draw(frame_copy)
+        # Draw the game into the output buffer
+        self.draw(output)
         
-        # Return the modified frame
-        return frame_copy
+        return output
+    
+    def step(self, fist_positions: List[Tuple[float, float]], dt: float) -> None:
+        """Advance the game by ``dt`` seconds with fists at ``fist_positions``.
+        
+        The frame-free counterpart of ``process_frame`` used by headless
+        simulation: the positions stand in for hand tracking and are used
+        as given (no fist prediction), nothing is drawn, and in headless
+        mode the events posted this tick are dispatched before returning.
+        """
+        now = self.now()
+        self.tracking = TrackingResult(
+            fist_positions=list(fist_positions),
+            raw_positions=[(int(x), int(y)) for x, y in fist_positions],
+            captured_at=now,
+            completed_at=now)
+        if self.state != GameState.GAME_OVER:
+            self.update(dt)
+        if self.headless:
+            self.event_manager.dispatch_pending()
     
     def handle_key(self, key: int):
         """Handle keyboard input"""
@@ -324,6 +313,8 @@ class GameEngine:
             return False
         elif key == ord('r') and self.state == GameState.GAME_OVER:
             self.reset()
+        elif key == ord(config.DEBUG_OVERLAY_KEY) and self.debug_overlay is not None:
+            self.debug_overlay.toggle()
         return True
     
     def reset(self):
@@ -331,16 +322,18 @@ class GameEngine:
         self.state = GameState.INIT
         self.score = 0
         self.health = config.INITIAL_HEALTH
-        self.frame_count = 0
-        self.last_collision_check = 0
-        self.start_time = time.time()
+        self.start_time = self.now()
         self.freeze_until = 0
         self.is_frozen = False
         
         # Reset components
         self.object_manager.reset()
+        self.fist_predictor.clear()
     
     def cleanup(self):
         """Clean up resources"""
         self.event_manager.stop_dispatch_loop()
-        self.hand_tracker.cleanup()
+        if self.hand_worker is not None:
+            self.hand_worker.stop()
+        if self.hand_tracker is not None:
+            self.hand_tracker.cleanup()
@@ -0,0 +1,215 @@
+import argparse
+import random
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+from config.game_config import config, GameState, PowerType
+from core.game_engine import GameEngine
+from events.base_event import EventType
+from events.observers.stats_observer import StatsObserver
+from input.hand_detectors import ReplayDetector
+from input.hand_tracker import HandTracker
+
+Position = Tuple[float, float]
+
+
+class SimulatedClock:
+    """Game time that only moves when the simulation advances it."""
+
+    def __init__(self, start: float = 0.0):
+        self.time = start
+
+    def __call__(self) -> float:
+        return self.time
+
+    def advance(self, dt: float) -> float:
+        self.time += dt
+        return self.time
+
+
+class IFistSource(ABC):
+    """Interface for the fist positions fed to a headless game."""
+
+    @abstractmethod
+    def positions(self, now: float) -> List[Position]:
+        """Return the fist positions, in window pixels, at game time ``now``."""
+        pass
+
+
+class ScriptedFists(IFistSource):
+    """Fists following scripted paths.
+
+    Each path maps game time in seconds to an (x, y) position, or to None
+    while that hand is not making a fist.
+    """
+
+    def __init__(self, *paths: Callable[[float], Optional[Position]]):
+        self.paths = paths
+
+    @classmethod
+    def from_waypoints(cls, *tracks: Sequence[Tuple[float, float, float]]) -> 'ScriptedFists':
+        """Build linear paths through (t, x, y) waypoints.
+
+        A fist exists only between the first and last waypoint of its track.
+        """
+        def path(track):
+            t, x, y = np.asarray(track, dtype=np.float64).reshape(-1, 3).T
+
+            def position(now: float) -> Optional[Position]:
+                if not len(t) or now < t[0] or now > t[-1]:
+                    return None
+                return float(np.interp(now, t, x)), float(np.interp(now, t, y))
+            return position
+        return cls(*(path(track) for track in tracks))
+
+    def positions(self, now: float) -> List[Position]:
+        return [position for position in (path(now) for path in self.paths) if position is not None]
+
+
+class RecordedFists(IFistSource):
+    """Fists from a landmark recording made with ``RecordingDetector``.
+
+    The recording is replayed through a ``HandTracker``, so hand identity
+    and smoothing behave as in a live game, without a camera or a model.
+
+    Args:
+        path: ``.npz`` recording
+        frame_rate: Rate the recording was captured at, in frames per second
+        loop: Start over after the last frame; otherwise no fists remain
+    """
+
+    def __init__(self, path: str, frame_rate: float = config.CAMERA_FPS, loop: bool = True):
+        self.tracker = HandTracker(ReplayDetector(path, loop))
+        self.frame_interval = 1.0 / frame_rate
+        self._next_frame: Optional[float] = None
+
+    def positions(self, now: float) -> List[Position]:
+        # Step through the recording at its own rate, whatever the tick rate
+        if self._next_frame is None:
+            self._next_frame = now
+        while now >= self._next_frame:
+            self.tracker.process_rgb(None, (config.WINDOW_WIDTH, config.WINDOW_HEIGHT),
+                                     timestamp=self._next_frame)
+            self._next_frame += self.frame_interval
+        return self.tracker.get_fist_positions()
+
+
+@dataclass
+class SimulationStats:
+    """Outcome of a simulated run."""
+    ticks: int = 0
+    duration: float = 0.0  # simulated seconds
+    wall_time: float = 0.0  # real seconds spent
+    score: int = 0
+    health: float = 0.0
+    bubbles_hit: int = 0
+    bubbles_missed: int = 0
+    powers: Dict[PowerType, int] = field(default_factory=dict)
+    game_over_at: Optional[float] = None  # simulated seconds, None if still alive
+
+    @property
+    def ticks_per_second(self) -> float:
+        return self.ticks / self.wall_time if self.wall_time > 0 else 0.0
+
+
+class Simulation:
+    """Headless game: the full rule set driven by scripted or recorded fists.
+
+    The engine runs with no camera, window, model or sound, on a simulated
+    clock advanced by a fixed ``dt`` per tick, so runs are as fast as the
+    game rules allow and, with a ``seed``, reproducible.
+
+    Args:
+        source: Where the fists come from
+        dt: Simulated seconds per tick
+        seed: Seed for the spawn randomness; None leaves it unseeded
+        skip_countdown: Start playing at once instead of after the countdown
+    """
+
+    def __init__(self, source: IFistSource, dt: float = 1.0 / config.FPS,
+                 seed: Optional[int] = None, skip_countdown: bool = True):
+        if seed is not None:
+            random.seed(seed)
+            np.random.seed(seed)
+        self.source = source
+        self.dt = dt
+        self.clock = SimulatedClock()
+        self.engine = GameEngine(headless=True, clock=self.clock)
+        if skip_countdown:
+            self.engine.state = GameState.RUNNING
+        self.stats_observer = StatsObserver()
+        for event_type in StatsObserver.EVENT_TYPES:
+            self.engine.event_manager.register_observer(event_type, self.stats_observer)
+        self.ticks = 0
+        self._game_over_at: Optional[float] = None
+
+    def tick(self) -> None:
+        """Advance the game by one ``dt``."""
+        now = self.clock.advance(self.dt)
+        self.engine.step(self.source.positions(now), self.dt)
+        self.ticks += 1
+        if self._game_over_at is None and self.engine.state == GameState.GAME_OVER:
+            self._game_over_at = now
+
+    def run(self, ticks: Optional[int] = None, duration: Optional[float] = None,
+            until_game_over: bool = True) -> SimulationStats:
+        """Run for ``ticks`` ticks or ``duration`` simulated seconds.
+
+        Stops early at game over unless ``until_game_over`` is False, in which
+        case the remaining ticks run on the game-over screen.
+        """
+        if duration is not None:
+            ticks = int(round(duration / self.dt))
+        if ticks is None:
+            raise ValueError("Give the number of ticks or a duration to run for")
+        started = time.perf_counter()
+        for _ in range(ticks):
+            if until_game_over and self.engine.state == GameState.GAME_OVER:
+                break
+            self.tick()
+        return self.stats(time.perf_counter() - started)
+
+    def stats(self, wall_time: float = 0.0) -> SimulationStats:
+        """Summarize the run so far."""
+        events = self.stats_observer.events
+        return SimulationStats(
+            ticks=self.ticks,
+            duration=self.clock() - self.engine.start_time,
+            wall_time=wall_time,
+            score=self.engine.score,
+            health=self.engine.health,
+            bubbles_hit=events[EventType.BUBBLE_HIT],
+            bubbles_missed=events[EventType.BUBBLE_MISSED],
+            powers=dict(self.stats_observer.powers),
+            game_over_at=self._game_over_at)
+
+    def close(self) -> None:
+        """Release the engine."""
+        self.engine.cleanup()
+
+
+def main():
+    """Run a headless game from the command line and print its outcome."""
+    parser = argparse.ArgumentParser(description="Headless Bubble Pop simulation")
+    parser.add_argument('--recording', help="landmark recording (.npz) to play; default is no fists")
+    parser.add_argument('--seconds', type=float, default=60.0, help="simulated seconds to run")
+    parser.add_argument('--seed', type=int, default=None, help="seed for spawn randomness")
+    parser.add_argument('--keep-going', action='store_true', help="do not stop at game over")
+    args = parser.parse_args()
+
+    source = RecordedFists(args.recording) if args.recording else ScriptedFists()
+    simulation = Simulation(source, seed=args.seed)
+    try:
+        stats = simulation.run(duration=args.seconds, until_game_over=not args.keep_going)
+    finally:
+        simulation.close()
+    for name, value in vars(stats).items():
+        print(f"{name}: {value}")
+    print(f"ticks_per_second: {stats.ticks_per_second:.0f}")
+
+
+if __name__ == "__main__":
+    main()
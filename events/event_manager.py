@@ -47,16 +47,40 @@ class EventManager:
                 if event is None:  # Sentinel value check
                     break
 
-                if event.event_type in self._observers:
-                    for observer in self._observers[event.event_type]:
-                        observer.handle(event)
-
+                self._notify(event)
                 self._event_queue.task_done()
             except queue.Empty:
                 continue
             except Exception as e:
                 print(f"Error in event dispatch loop: {e}")
 
+    def dispatch_pending(self) -> int:
+        """
+        Notify observers of every queued event on the calling thread.
+        
+        For use without the dispatch loop, e.g. in headless simulation.
+        Events posted by observers meanwhile are dispatched too.
+        
+        Returns:
+            int: Number of events dispatched
+        """
+        dispatched = 0
+        while True:
+            try:
+                event = self._event_queue.get_nowait()
+            except queue.Empty:
+                return dispatched
+            try:
+                if event is not None:
+                    self._notify(event)
+                    dispatched += 1
+            finally:
+                self._event_queue.task_done()
+
+    def _notify(self, event: GameEvent) -> None:
+        for observer in self._observers.get(event.event_type, ()):
+            observer.handle(event)
+
     def wait_for_events(self, timeout: Optional[float] = None) -> bool:
         """
         Wait for all events to be processed.
@@ -1,5 +1,4 @@
 from __future__ import annotations
-import time
 from typing import TYPE_CHECKING
 
 from events.base_event import GameEvent, EventType, IObserver
@@ -22,7 +21,7 @@ class FreezeObserver(IObserver):
     def activate_freeze(self) -> None:
         """Activates the freeze effect in the game engine."""
         freeze_duration = config.POWER_DURATION
-        self.game_engine.freeze_until = time.time() + freeze_duration
+        self.game_engine.freeze_until = self.game_engine.now() + freeze_duration
         self.game_engine.is_frozen = True
         self.game_engine.object_manager.freeze_all(True)
         self.game_engine.event_manager.post(GameEvent(EventType.FREEZE_START, {"duration": freeze_duration}))
@@ -0,0 +1,23 @@
+from collections import Counter
+
+from events.base_event import GameEvent, EventType, IObserver
+
+
+class StatsObserver(IObserver):
+    """Counts game events, e.g. to summarize a simulated game."""
+
+    EVENT_TYPES = (EventType.BUBBLE_HIT, EventType.BUBBLE_MISSED,
+                   EventType.POWER_ACTIVATED, EventType.GAME_OVER)
+
+    def __init__(self):
+        self.events: Counter = Counter()
+        self.powers: Counter = Counter()
+
+    def handle(self, event: GameEvent) -> None:
+        self.events[event.event_type] += 1
+        if event.event_type == EventType.POWER_ACTIVATED and "power_type" in event.data:
+            self.powers[event.data["power_type"]] += 1
+
+    def reset(self) -> None:
+        self.events.clear()
+        self.powers.clear()
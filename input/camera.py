@@ -0,0 +1,187 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Tuple, Union
+import cv2
+import numpy as np
+
+from config.game_config import config
+
+
+@dataclass
+class CaptureSettings:
+    """What the capture backend actually negotiated, which may differ from the request."""
+    width: int
+    height: int
+    fps: float
+    fourcc: str
+    buffer_size: Optional[int]  # None when the backend does not report it
+
+    def __str__(self) -> str:
+        buffer = 'unknown' if self.buffer_size is None else self.buffer_size
+        return (f"{self.width}x{self.height} @ {self.fps:.1f} fps, "
+                f"fourcc {self.fourcc or 'unknown'}, driver buffer {buffer}")
+
+
+def _decode_fourcc(value: float) -> str:
+    code = int(value)
+    return ''.join(chr((code >> shift) & 0xFF) for shift in (0, 8, 16, 24)).strip('\x00 ')
+
+
+class CameraCapture:
+    """Camera or video file read on a background grabber thread.
+
+    The grabber reads frames as fast as the source delivers them and keeps
+    only the newest one in a single slot; a frame the game has not taken by
+    the time the next one arrives is dropped, so the game never works
+    through a backlog of stale frames. Each frame carries the time it was
+    grabbed.
+
+    Frames are read into three reused buffers: one being filled, one
+    waiting and one held by the consumer. A frame returned by ``read``
+    stays valid until the next ``read``.
+
+    Video files are paced at their own frame rate by default, so they
+    behave like a camera; with ``pace=False`` they are read as fast as
+    possible.
+
+    Args:
+        source: Device index, or a video file path
+        width, height: Resolution requested from a device
+        fps: Frame rate requested from a device
+        low_latency: Ask a device for a 1-frame driver buffer and MJPG frames
+        pace: Deliver file frames at the file's frame rate; defaults to True for files
+    """
+
+    def __init__(self, source: Union[int, str] = config.CAMERA_SOURCE,
+                 width: int = config.WINDOW_WIDTH, height: int = config.WINDOW_HEIGHT,
+                 fps: int = config.CAMERA_FPS, low_latency: bool = config.CAMERA_LOW_LATENCY,
+                 pace: Optional[bool] = None):
+        if isinstance(source, str) and source.isdigit():
+            source = int(source)
+        self.source = source
+        self.is_file = not isinstance(source, int)
+        self.pace = self.is_file if pace is None else pace
+        self.cap = cv2.VideoCapture(source)
+        self.settings: Optional[CaptureSettings] = None
+        if self.cap.isOpened():
+            if not self.is_file:
+                self._configure(width, height, fps, low_latency)
+            self.settings = self._negotiated()
+
+        self.grabbed = 0
+        self.dropped = 0  # frames overwritten before the consumer took them
+        self._cond = threading.Condition()
+        self._free: List[Optional[np.ndarray]] = []
+        if self.settings is not None:
+            shape = (self.settings.height, self.settings.width, 3)
+            self._free = [np.empty(shape, dtype=np.uint8) for _ in range(3)]
+        self._pending: Optional[np.ndarray] = None
+        self._timestamp = 0.0
+        self._held: Optional[np.ndarray] = None
+        self._finished = False
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def is_opened(self) -> bool:
+        return self.cap.isOpened()
+
+    @property
+    def finished(self) -> bool:
+        """True once no more frames will come: the source has ended and its
+        last frame was read, or it is not open."""
+        with self._cond:
+            return not self.is_opened() or (self._finished and self._pending is None)
+
+    def _configure(self, width: int, height: int, fps: int, low_latency: bool) -> None:
+        """Request device settings; backends silently ignore what they do not support."""
+        if low_latency:
+            # The FOURCC has to be set before the resolution on some backends
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        if fps:
+            self.cap.set(cv2.CAP_PROP_FPS, fps)
+
+    def _negotiated(self) -> CaptureSettings:
+        """Read back the settings in effect, falling back to the window size."""
+        buffer_size = int(self.cap.get(cv2.CAP_PROP_BUFFERSIZE))
+        return CaptureSettings(
+            width=int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or config.WINDOW_WIDTH,
+            height=int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) or config.WINDOW_HEIGHT,
+            fps=float(self.cap.get(cv2.CAP_PROP_FPS)),
+            fourcc=_decode_fourcc(self.cap.get(cv2.CAP_PROP_FOURCC)),
+            buffer_size=buffer_size if buffer_size > 0 else None)
+
+    def start(self) -> None:
+        """Start the grabber thread."""
+        if self._running or not self.is_opened():
+            return
+        self._running = True
+        self._finished = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the grabber thread, waiting for the frame being read."""
+        self._running = False
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def release(self) -> None:
+        """Stop grabbing and close the source."""
+        self.stop()
+        self.cap.release()
+
+    def read(self, timeout: Optional[float] = 1.0) -> Tuple[bool, Optional[np.ndarray], float]:
+        """Wait for a frame newer than the last one read.
+
+        Returns:
+            tuple: (ok, frame, captured_at); ok is False on timeout or once
+            the source has ended and its last frame was read, which
+            ``finished`` tells apart
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._pending is not None or self._finished, timeout):
+                return False, None, 0.0
+            if self._pending is None:
+                return False, None, 0.0
+            # The previously held frame can be filled again
+            if self._held is not None:
+                self._free.append(self._held)
+            self._held, self._pending = self._pending, None
+            return True, self._held, self._timestamp
+
+    def _run(self) -> None:
+        interval = 0.0
+        if self.pace and self.settings is not None and self.settings.fps > 0:
+            interval = 1.0 / self.settings.fps
+        next_due = time.perf_counter()
+        while self._running:
+            if interval:
+                delay = next_due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                # Falling behind resets the schedule instead of bursting to catch up
+                next_due = max(next_due, time.perf_counter()) + interval
+            if not self.cap.grab():
+                break
+            captured_at = time.time()
+            with self._cond:
+                buffer = self._free.pop() if self._free else None
+            ok, frame = self.cap.retrieve(buffer)
+            if not ok:
+                break
+            with self._cond:
+                if self._pending is not None:
+                    self.dropped += 1
+                    self._free.append(self._pending)
+                self._pending = frame
+                self._timestamp = captured_at
+                self.grabbed += 1
+                self._cond.notify()
+        with self._cond:
+            self._finished = True
+            self._cond.notify_all()
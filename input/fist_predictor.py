@@ -0,0 +1,109 @@
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+import numpy as np
+
+from config.game_config import config
+
+
+@dataclass
+class PredictedFist:
+    """A fist position extrapolated to a point in time.
+
+    ``uncertainty`` is a radius in pixels around (x, y) that the real fist
+    is expected to be within; collision widens the fist radius by it.
+    """
+    x: float
+    y: float
+    uncertainty: float
+
+
+class _Track:
+    """Constant-velocity state of one hand."""
+
+    __slots__ = ('position', 'velocity', 'timestamp')
+
+    def __init__(self, position: np.ndarray, timestamp: float):
+        self.position = position
+        self.velocity = np.zeros(2)
+        self.timestamp = timestamp
+
+
+class FistPredictor:
+    """Per-hand alpha-beta filter that extrapolates fists between detections.
+
+    An alpha-beta filter is the steady-state form of a constant-velocity
+    Kalman filter: each detection corrects the predicted position by
+    ``alpha`` of the residual and the velocity by ``beta`` of it. Detections
+    are matched to tracks by nearest neighbour; hands that disappear are
+    dropped, like the tracker's hand tracks.
+    """
+
+    def __init__(self,
+                 alpha: float = config.FIST_PREDICTION_ALPHA,
+                 beta: float = config.FIST_PREDICTION_BETA,
+                 match_distance: float = config.FIST_MATCH_DISTANCE,
+                 horizon: float = config.FIST_PREDICTION_HORIZON):
+        self.alpha = alpha
+        self.beta = beta
+        self.match_distance = match_distance
+        self.horizon = horizon
+        self.last_timestamp = float('-inf')
+        self._tracks: List[_Track] = []
+
+    def __len__(self) -> int:
+        return len(self._tracks)
+
+    def update(self, positions: Sequence[Tuple[float, float]], timestamp: float) -> None:
+        """Correct the tracks with the fists detected in a frame captured at ``timestamp``.
+
+        Results that are not newer than the last update are ignored, so the
+        same inference result may be fed every frame.
+        """
+        if timestamp <= self.last_timestamp:
+            return
+        self.last_timestamp = timestamp
+
+        detections = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        tracks = []
+        unmatched = list(range(len(detections)))
+        for track in self._tracks:
+            if not unmatched:
+                break
+            dt = timestamp - track.timestamp
+            predicted = track.position + track.velocity * dt
+            distances = np.hypot(*(detections[unmatched] - predicted).T)
+            best = int(np.argmin(distances))
+            if distances[best] > self.match_distance:
+                continue
+            residual = detections[unmatched.pop(best)] - predicted
+            track.position = predicted + self.alpha * residual
+            if dt > 0:
+                track.velocity = track.velocity + self.beta * residual / dt
+            track.timestamp = timestamp
+            tracks.append(track)
+        tracks.extend(_Track(detections[i].copy(), timestamp) for i in unmatched)
+        self._tracks = tracks
+
+    def predict(self, now: float) -> List[PredictedFist]:
+        """Extrapolate every tracked fist to ``now``.
+
+        Extrapolation stops at ``horizon`` seconds past the detection. The
+        uncertainty is the measurement noise plus the distance an unmodelled
+        acceleration of FIST_ACCELERATION_NOISE covers in the elapsed time,
+        capped at FIST_MAX_UNCERTAINTY so collision radii stay close to
+        FIST_RADIUS.
+        """
+        predicted = []
+        for track in self._tracks:
+            dt = min(max(now - track.timestamp, 0.0), self.horizon)
+            x, y = track.position + track.velocity * dt
+            uncertainty = min(config.FIST_MEASUREMENT_NOISE
+                              + 0.5 * config.FIST_ACCELERATION_NOISE * dt * dt,
+                              config.FIST_MAX_UNCERTAINTY)
+            predicted.append(PredictedFist(float(x), float(y), uncertainty))
+        return predicted
+
+    def clear(self) -> None:
+        """Forget all tracks."""
+        self._tracks = []
+        self.last_timestamp = float('-inf')
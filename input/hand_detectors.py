@@ -0,0 +1,312 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+import cv2
+import numpy as np
+
+from config.game_config import config, DetectorBackend
+
+# MediaPipe hand landmark indices
+NUM_LANDMARKS = 21
+WRIST = 0
+MIDDLE_FINGER_MCP = 9
+_THUMB_TIP = 4
+_INDEX_FINGER_MCP = 5
+# Finger tips then MCPs of the index, middle, ring and pinky fingers
+_CURL_LANDMARKS = np.array([8, 12, 16, 20, 5, 9, 13, 17])
+_THUMB_LANDMARKS = np.array([_THUMB_TIP, _INDEX_FINGER_MCP])
+
+# Fist confidence contributed by each curled finger and by the thumb
+_CURL_WEIGHTS = np.array([0.25, 0.25, 0.25, 0.15])
+_THUMB_WEIGHT = 0.1
+
+
+def classify_fist(points: np.ndarray) -> Tuple[bool, float]:
+    """
+    Check if a hand is making a fist.
+
+    Args:
+        points: (21, 3) array of normalized hand landmarks
+
+    Returns:
+        tuple: (is_fist, confidence) where confidence is a float between 0 and 1
+    """
+    # A finger is curled when its tip is closer to the wrist than its MCP;
+    # squared distances of all tips and MCPs in one pass
+    offsets = points[_CURL_LANDMARKS] - points[WRIST]
+    squared = (offsets * offsets).sum(axis=1)
+    curled = squared[:4] < squared[4:] * (0.9 * 0.9)
+
+    # Check if thumb is over the fingers
+    (thumb_x, thumb_y), (index_x, index_y) = points[_THUMB_LANDMARKS, :2].tolist()
+    thumb_over = thumb_x > index_x and thumb_y < index_y + 0.1
+
+    # Calculate confidence (0 to 1)
+    confidence = float(_CURL_WEIGHTS @ curled) + (_THUMB_WEIGHT if thumb_over else 0.0)
+
+    # Consider it a fist if confidence is above threshold
+    return confidence > 0.7, confidence
+
+
+def _classify_all(landmarks: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the (H,) fist flags and confidences of (H, 21, 3) landmarks."""
+    fists = [classify_fist(points) for points in landmarks]
+    return (np.array([is_fist for is_fist, _ in fists], dtype=bool),
+            np.array([confidence for _, confidence in fists]))
+
+
+@dataclass
+class HandDetections:
+    """Hands found in one image, in coordinates normalized to that image.
+
+    ``landmarks`` is only set by backends that locate the 21 hand landmarks.
+    """
+    centers: np.ndarray  # (H, 2) fist centre x, y
+    boxes: np.ndarray  # (H, 4) x0, y0, x1, y1
+    is_fist: np.ndarray  # (H,) bool
+    confidence: np.ndarray  # (H,) fist confidence between 0 and 1
+    handedness: List[Optional[str]] = field(default_factory=list)  # 'Left'/'Right' or None
+    landmarks: Optional[np.ndarray] = None  # (H, 21, 3)
+
+    def __len__(self) -> int:
+        return len(self.centers)
+
+    @classmethod
+    def empty(cls) -> 'HandDetections':
+        return cls(np.empty((0, 2)), np.empty((0, 4)), np.empty(0, dtype=bool), np.empty(0))
+
+    @classmethod
+    def from_landmarks(cls, landmarks: np.ndarray,
+                       handedness: Optional[Sequence[Optional[str]]] = None) -> 'HandDetections':
+        """Derive centres, boxes and fist state from (H, 21, 3) landmarks."""
+        landmarks = np.asarray(landmarks, dtype=np.float64).reshape(-1, NUM_LANDMARKS, 3)
+        count = len(landmarks)
+        if not count:
+            return cls.empty()
+        handedness = list(handedness or [])[:count]
+        # Fist centre: between the wrist and the middle finger MCP
+        centers = (landmarks[:, WRIST, :2] + landmarks[:, MIDDLE_FINGER_MCP, :2]) / 2
+        boxes = np.hstack([landmarks[..., :2].min(axis=1), landmarks[..., :2].max(axis=1)])
+        is_fist, confidence = _classify_all(landmarks)
+        return cls(centers, boxes, is_fist, confidence,
+                   handedness + [None] * (count - len(handedness)),
+                   landmarks)
+
+    def remap(self, roi: Tuple[float, float, float, float], width: int, height: int) -> None:
+        """Map coordinates normalized to the crop ``roi`` back to the full frame, in place.
+
+        Fist state is re-evaluated on the remapped landmarks: the crop is
+        scaled unevenly and ``classify_fist`` uses absolute margins, so it must
+        see the same coordinates as on a full-frame pass.
+        """
+        x0, y0, x1, y1 = roi
+        scale = np.array([(x1 - x0) / width, (y1 - y0) / height])
+        offset = np.array([x0 / width, y0 / height])
+        self.centers[:] = offset + self.centers * scale
+        self.boxes[:] = np.tile(offset, 2) + self.boxes * np.tile(scale, 2)
+        if self.landmarks is not None:
+            self.landmarks[..., :2] = offset + self.landmarks[..., :2] * scale
+            self.landmarks[..., 2] *= scale[0]  # z shares the x scale in MediaPipe
+            self.is_fist[:], self.confidence[:] = _classify_all(self.landmarks)
+
+
+class IHandDetector(ABC):
+    """Interface for fist-detector backends used by ``HandTracker``.
+
+    ``detect`` receives an RGB image and reports hands in coordinates
+    normalized to it. Backends with ``needs_image = False`` ignore the image,
+    so the tracker can skip preparing one.
+    """
+
+    needs_image = True
+
+    @abstractmethod
+    def detect(self, image: Optional[np.ndarray]) -> HandDetections:
+        """Find the hands in one RGB image."""
+        pass
+
+    def close(self) -> None:
+        """Release the backend's resources."""
+        pass
+
+
+class MediaPipeDetector(IHandDetector):
+    """MediaPipe Hands landmark model.
+
+    MediaPipe is imported, and the model built, on the first ``detect``, so
+    the other backends never load it.
+    """
+
+    def __init__(self, max_hands: int = 2,
+                 detection_confidence: float = config.HAND_DETECTION_CONFIDENCE,
+                 tracking_confidence: float = 0.5):
+        self.max_hands = max_hands
+        self.detection_confidence = detection_confidence
+        self.tracking_confidence = tracking_confidence
+        self.hands = None
+
+    def _build(self):
+        import mediapipe as mp
+        return mp.solutions.hands.Hands(
+            static_image_mode=False,
+            max_num_hands=self.max_hands,
+            min_detection_confidence=self.detection_confidence,
+            min_tracking_confidence=self.tracking_confidence
+        )
+
+    def detect(self, image: np.ndarray) -> HandDetections:
+        if self.hands is None:
+            self.hands = self._build()
+        results = self.hands.process(image)
+        hands = results.multi_hand_landmarks
+        if not hands:
+            return HandDetections.empty()
+        landmarks = np.array([[(landmark.x, landmark.y, landmark.z) for landmark in hand.landmark]
+                              for hand in hands], dtype=np.float64)
+        handedness = []
+        for classes in getattr(results, 'multi_handedness', None) or ():
+            handedness.append(classes.classification[0].label if classes.classification else None)
+        return HandDetections.from_landmarks(landmarks, handedness)
+
+    def close(self) -> None:
+        if self.hands is not None:
+            self.hands.close()
+            self.hands = None
+
+
+class SkinColorDetector(IHandDetector):
+    """Classical skin-colour blob detector for low-power devices.
+
+    Pixels inside a YCrCb skin range are grouped into contours; the largest
+    blobs are hands. A fist is a compact blob: its area fills most of its
+    convex hull (its solidity), while spread fingers leave gaps between them.
+    It needs even lighting and a background without skin tones, and cannot
+    tell left from right.
+    """
+
+    def __init__(self, max_hands: int = 2,
+                 min_area: float = config.SKIN_MIN_AREA,
+                 fist_solidity: float = config.SKIN_FIST_SOLIDITY,
+                 lower: Tuple[int, int, int] = (0, 133, 77),
+                 upper: Tuple[int, int, int] = (255, 173, 127)):
+        self.max_hands = max_hands
+        self.min_area = min_area
+        self.fist_solidity = fist_solidity
+        self.lower = np.array(lower, dtype=np.uint8)
+        self.upper = np.array(upper, dtype=np.uint8)
+        self._kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
+        self._ycrcb: Optional[np.ndarray] = None
+        self._mask: Optional[np.ndarray] = None
+
+    def detect(self, image: np.ndarray) -> HandDetections:
+        height, width = image.shape[:2]
+        if self._ycrcb is None or self._ycrcb.shape != image.shape:
+            self._ycrcb = np.empty_like(image)
+            self._mask = np.empty((height, width), dtype=np.uint8)
+        cv2.cvtColor(image, cv2.COLOR_RGB2YCrCb, dst=self._ycrcb)
+        cv2.inRange(self._ycrcb, self.lower, self.upper, dst=self._mask)
+        # Opening removes speckle noise, closing fills small holes in the hand
+        cv2.morphologyEx(self._mask, cv2.MORPH_OPEN, self._kernel, dst=self._mask)
+        cv2.morphologyEx(self._mask, cv2.MORPH_CLOSE, self._kernel, dst=self._mask)
+        contours, _ = cv2.findContours(self._mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+
+        min_area = self.min_area * width * height
+        blobs = sorted(((cv2.contourArea(contour), contour) for contour in contours),
+                       key=lambda blob: blob[0], reverse=True)
+        blobs = [blob for blob in blobs[:self.max_hands] if blob[0] >= min_area]
+        if not blobs:
+            return HandDetections.empty()
+
+        centers, boxes, confidence = [], [], []
+        for area, contour in blobs:
+            moments = cv2.moments(contour)
+            centers.append((moments['m10'] / moments['m00'], moments['m01'] / moments['m00']))
+            x, y, w, h = cv2.boundingRect(contour)
+            boxes.append((x, y, x + w, y + h))
+            hull_area = cv2.contourArea(cv2.convexHull(contour))
+            confidence.append(area / hull_area if hull_area else 0.0)
+        scale = np.array([width, height], dtype=np.float64)
+        confidence = np.array(confidence)
+        return HandDetections(np.array(centers) / scale,
+                              np.array(boxes, dtype=np.float64) / np.tile(scale, 2),
+                              confidence >= self.fist_solidity,
+                              confidence,
+                              [None] * len(blobs))
+
+
+class ReplayDetector(IHandDetector):
+    """Replays a landmark recording made with ``RecordingDetector``.
+
+    Each ``detect`` returns the next recorded frame whatever the image, so
+    runs are deterministic and free of inference cost.
+
+    Args:
+        path: ``.npz`` recording
+        loop: Start over after the last frame; otherwise report no hands
+    """
+
+    needs_image = False
+
+    def __init__(self, path: str, loop: bool = True):
+        with np.load(path) as recording:
+            landmarks = recording['landmarks']
+            counts = recording['counts']
+            handedness = [label or None for label in recording['handedness'].tolist()]
+        ends = np.cumsum(counts)
+        self.frames = [(landmarks[end - count:end], handedness[end - count:end])
+                       for count, end in zip(counts.tolist(), ends.tolist())]
+        self.loop = loop
+        self.position = 0
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def detect(self, image: Optional[np.ndarray] = None) -> HandDetections:
+        if self.position >= len(self.frames):
+            if not self.loop or not self.frames:
+                return HandDetections.empty()
+            self.position = 0
+        landmarks, handedness = self.frames[self.position]
+        self.position += 1
+        return HandDetections.from_landmarks(landmarks.copy(), handedness)
+
+
+class RecordingDetector(IHandDetector):
+    """Wraps a landmark backend and records what it detects for ``ReplayDetector``."""
+
+    def __init__(self, detector: IHandDetector):
+        self.detector = detector
+        self.needs_image = detector.needs_image
+        self.frames: List[Tuple[np.ndarray, List[Optional[str]]]] = []
+
+    def detect(self, image: Optional[np.ndarray]) -> HandDetections:
+        detections = self.detector.detect(image)
+        if detections.landmarks is None and len(detections):
+            raise ValueError("Only backends that report landmarks can be recorded")
+        landmarks = np.empty((0, NUM_LANDMARKS, 3)) if detections.landmarks is None else detections.landmarks
+        self.frames.append((landmarks.copy(), list(detections.handedness)))
+        return detections
+
+    def save(self, path: str) -> None:
+        """Write the frames recorded so far as an ``.npz`` file."""
+        landmarks = [frame for frame, _ in self.frames]
+        np.savez_compressed(
+            path,
+            landmarks=np.concatenate(landmarks) if landmarks else np.empty((0, NUM_LANDMARKS, 3)),
+            counts=np.array([len(frame) for frame in landmarks], dtype=np.int64),
+            handedness=np.array([label or '' for _, labels in self.frames for label in labels], dtype=str))
+
+    def close(self) -> None:
+        self.detector.close()
+
+
+def create_detector(backend: Optional[DetectorBackend] = None) -> IHandDetector:
+    """Build the detector backend selected in the config."""
+    backend = backend or config.HAND_DETECTOR
+    if backend == DetectorBackend.SKIN:
+        return SkinColorDetector()
+    if backend == DetectorBackend.REPLAY:
+        if not config.HAND_REPLAY_PATH:
+            raise ValueError("HAND_REPLAY_PATH must be set to use the replay detector")
+        return ReplayDetector(config.HAND_REPLAY_PATH)
+    return MediaPipeDetector()
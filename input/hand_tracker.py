@@ -1,228 +1,289 @@
+import time
 import cv2
 import numpy as np
-import mediapipe as mp
+from functools import partial
 from typing import List, Tuple, Optional, Dict, Any
 
 from config.game_config import config
+from input.hand_detectors import HandDetections, IHandDetector, create_detector
+from input.smoothing import OneEuroFilter
+from rendering.renderer import Layer, Renderer
+
+
+class HandTrack:
+    """One hand followed across frames.
+
+    ``center`` is the last raw fist centre, used to match the hand in the
+    next frame; ``smoothed`` is the One-Euro filtered centre reported as the
+    fist position.
+    """
+    
+    def __init__(self, hand_id: int, handedness: Optional[str]):
+        self.hand_id = hand_id
+        self.handedness = handedness
+        self.filter = OneEuroFilter(config.HAND_SMOOTHING_MIN_CUTOFF, config.HAND_SMOOTHING_BETA)
+        self.center = np.zeros(2)  # last raw centre in pixels
+        self.smoothed = np.zeros(2)
+        self.is_fist = False
+    
+    def add(self, center: np.ndarray, timestamp: float) -> None:
+        """Record this frame's raw centre and update the smoothed estimate."""
+        self.center = center
+        self.smoothed = self.filter(center, timestamp)
 
 
 class HandTracker:
-    """Hand tracking using MediaPipe."""
-    
-    def __init__(self):
-        """Initialize the hand tracker."""
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=2,
-            min_detection_confidence=config.HAND_DETECTION_CONFIDENCE,
-            min_tracking_confidence=0.5
-        )
+    """Fist tracking on top of a pluggable hand detector backend."""
+    
+    def __init__(self, detector: Optional[IHandDetector] = None):
+        """Initialize the hand tracker.
+        
+        Args:
+            detector: Detector backend; defaults to the one selected by
+                config.HAND_DETECTOR
+        """
+        self.detector = detector if detector is not None else create_detector()
+        
+        # Hands found in the last processed frame, normalized to the full frame
+        self.detections = HandDetections.empty()
         
         # Store the most recent fist positions (for each hand)
         self.fist_positions: List[Tuple[float, float]] = []
         
-        # For smoothing positions
-        self.position_history: Dict[int, List[Tuple[float, float]]] = {}
-        self.max_history = 5
+        # Hands followed across frames, keyed by a stable id
+        self.tracks: Dict[int, HandTrack] = {}
+        self._next_hand_id = 0
+        
+        # Reused inference input buffers, keyed by pipeline stage
+        self._input_buffers: Dict[str, np.ndarray] = {}
+        
+        # Last detected hands' pixel boxes (x0, y0, x1, y1), for ROI inference
+        self.hand_boxes: List[Tuple[float, float, float, float]] = []
+        self._frames_since_full = 0
     
-    def process_frame(self, frame: np.ndarray) -> None:
+    def process_frame(self, frame: np.ndarray, rgb: Optional[np.ndarray] = None,
+                      timestamp: Optional[float] = None) -> None:
         """
         Process a frame to detect hands and update fist positions.
         
+        The frame is not modified.
+        
         Args:
             frame: Input frame (BGR format)
+            rgb: The same frame already converted to RGB, possibly downscaled
+                (see ``FrameBuffers.prepare``); converted here when omitted
+            timestamp: Capture time of the frame, used for smoothing; defaults to now
+        """
+        height, width = frame.shape[:2]
+        if rgb is not None:
+            self.process_rgb(rgb, (width, height), timestamp)
+            return
+        # Convert BGR to RGB, cropped to the hand ROI and downscaled if configured
+        image, roi = None, None
+        if self.detector.needs_image:
+            image, roi = self._prepare_input(frame)
+        self._detect(image, roi, width, height, timestamp)
+    
+    def process_rgb(self, rgb: Optional[np.ndarray], frame_size: Tuple[int, int],
+                    timestamp: Optional[float] = None) -> None:
         """
-        # Convert BGR to RGB
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        Process an RGB inference frame prepared from a display frame.
+        
+        Args:
+            rgb: RGB image of the display frame, possibly downscaled; may be
+                None for backends that need no image
+            frame_size: (width, height) of the display frame; fist positions
+                are reported in its pixels
+            timestamp: Capture time of the frame, used for smoothing; defaults to now
+        """
+        width, height = frame_size
+        image, roi = None, None
+        if self.detector.needs_image:
+            image, roi = self._crop_input(rgb, width, height)
+        self._detect(image, roi, width, height, timestamp)
+    
+    def _detect(self, image: Optional[np.ndarray], roi, width: int, height: int,
+                timestamp: Optional[float]) -> None:
+        """Run the detector on ``image`` and update tracks for a width x height frame."""
+        if timestamp is None:
+            timestamp = time.time()
         
         # Process the frame
-        results = self.hands.process(rgb_frame)
+        detections = self.detector.detect(image)
+        if roi is not None and len(detections):
+            detections.remap(roi, width, height)
+        self.detections = detections
+        self._update_hand_boxes(detections.boxes, width, height)
         
         # Reset fist positions
         self.fist_positions = []
         
-        # Track which hands are currently visible
-        current_hand_ids = set()
-        
-        # Draw hand landmarks for debugging
-        if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
-                # Draw all landmarks (for debugging)
-                for landmark in hand_landmarks.landmark:
-                    height, width = frame.shape[:2]
-                    x = int(landmark.x * width)
-                    y = int(landmark.y * height)
-                    #cv2.circle(frame, (x, y), 3, (0, 255, 0), -1)
-                
-                # Get hand landmarks
-                landmarks = hand_landmarks.landmark
-                
-                # Check if hand is a fist (thumb over fingers)
-                is_fist, confidence = self._is_fist(landmarks)
-                
-                if is_fist:
-                    # Get center of the fist (using wrist and middle finger MCP)
-                    wrist = landmarks[self.mp_hands.HandLandmark.WRIST]
-                    mcp = landmarks[self.mp_hands.HandLandmark.MIDDLE_FINGER_MCP]
-                    
-                    # Calculate center between wrist and middle finger MCP
-                    x = (wrist.x + mcp.x) / 2
-                    y = (wrist.y + mcp.y) / 2
-                    
-                    # Convert to pixel coordinates
-                    height, width = frame.shape[:2]
-                    px = int(x * width)
-                    py = int(y * height)
-                    
-                    # Add to positions
-                    self.fist_positions.append((px, py))
-                    
-                    # Update position history for this hand
-                    hand_id = id(hand_landmarks)
-                    current_hand_ids.add(hand_id)
-                    
-                    if hand_id not in self.position_history:
-                        self.position_history[hand_id] = []
-                    
-                    self.position_history[hand_id].append((px, py))
-                    
-                    # Limit history size
-                    if len(self.position_history[hand_id]) > self.max_history:
-                        self.position_history[hand_id].pop(0)
-        
-        # Remove position history for hands that are no longer visible
-        # This prevents ghost positions from lingering after hands are removed
-        for hand_id in list(self.position_history.keys()):
-            if hand_id not in current_hand_ids:
-                del self.position_history[hand_id]
-        
-        # Draw debug info for visible hands
-        if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
-                landmarks = hand_landmarks.landmark
-                is_fist, confidence = self._is_fist(landmarks)
-                
-                if is_fist:
-                    # Get center of the fist (using wrist and middle finger MCP)
-                    wrist = landmarks[self.mp_hands.HandLandmark.WRIST]
-                    mcp = landmarks[self.mp_hands.HandLandmark.MIDDLE_FINGER_MCP]
-                    x = (wrist.x + mcp.x) / 2
-                    y = (wrist.y + mcp.y) / 2
-                    height, width = frame.shape[:2]
-                    px = int(x * width)
-                    py = int(y * height)
-                    
-                    # Draw debug info for fist
-                    cv2.circle(frame, (px, py), 10, (0, 0, 255), -1)
-                    cv2.putText(frame, f'Fist: {confidence:.2f}', (px + 15, py - 10),
-                              cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 255), 1)
-                else:
-                    # Draw why it's not a fist (for debugging)
-                    wrist = landmarks[self.mp_hands.HandLandmark.WRIST]
-                    height, width = frame.shape[:2]
-                    wx = int(wrist.x * width)
-                    wy = int(wrist.y * height)
-                    cv2.putText(frame, f'Not a fist: {confidence:.2f}', (wx, wy - 20),
-                              cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 1)
-    
-    def _is_fist(self, landmarks) -> tuple[bool, float]:
-        """
-        Check if the hand is making a fist.
+        pixel_scale = np.array([width, height], dtype=np.float64)
+        centers = detections.centers * pixel_scale
+        tracks = self._associate(centers, detections.handedness)
         
-        Args:
-            landmarks: Hand landmarks from MediaPipe
-            
-        Returns:
-            tuple: (is_fist, confidence) where confidence is a float between 0 and 1
-        """
-        # Get relevant landmarks
-        thumb_tip = landmarks[self.mp_hands.HandLandmark.THUMB_TIP]
-        
-        index_tip = landmarks[self.mp_hands.HandLandmark.INDEX_FINGER_TIP]
-        index_mcp = landmarks[self.mp_hands.HandLandmark.INDEX_FINGER_MCP]
-        
-        middle_tip = landmarks[self.mp_hands.HandLandmark.MIDDLE_FINGER_TIP]
-        middle_mcp = landmarks[self.mp_hands.HandLandmark.MIDDLE_FINGER_MCP]
+        # Fist state is evaluated once per hand by the detector; the frame is
+        # only read, diagnostics are drawn by the debug overlay
+        for track, center, is_fist in zip(tracks, centers, detections.is_fist.tolist()):
+            track.is_fist = is_fist
+            track.add(center, timestamp)
+            if is_fist:
+                px, py = center.astype(int).tolist()
+                self.fist_positions.append((px, py))
+    
+    def _associate(self, centers: np.ndarray, labels: List[Optional[str]]) -> List[HandTrack]:
+        """Match this frame's hands to the tracks of the previous frame.
         
-        ring_tip = landmarks[self.mp_hands.HandLandmark.RING_FINGER_TIP]
-        ring_mcp = landmarks[self.mp_hands.HandLandmark.RING_FINGER_MCP]
+        Pairs are taken closest first, within FIST_MATCH_DISTANCE pixels. Hands
+        of the same handedness are paired first; a second pass lets leftover
+        hands match across labels, since MediaPipe occasionally flips them (and
+        some backends report none).
+        Unmatched hands start new tracks; tracks left without a hand are dropped,
+        so no ghost fists linger after a hand leaves.
         
-        pinky_tip = landmarks[self.mp_hands.HandLandmark.PINKY_TIP]
-        pinky_mcp = landmarks[self.mp_hands.HandLandmark.PINKY_MCP]
+        Returns:
+            The track of each hand, in detection order
+        """
+        previous = list(self.tracks.values())
+        matched: List[Optional[HandTrack]] = [None] * len(centers)
+        if previous and len(centers):
+            last = np.array([track.center for track in previous])
+            distances = np.linalg.norm(centers[:, None] - last[None], axis=2)
+            pairs = [divmod(int(flat), len(previous)) for flat in np.argsort(distances, axis=None)
+                     if distances.flat[flat] <= config.FIST_MATCH_DISTANCE]
+            taken = set()
+            for same_hand_only in (True, False):
+                for hand, t in pairs:
+                    if matched[hand] is not None or t in taken:
+                        continue
+                    if same_hand_only and labels[hand] != previous[t].handedness:
+                        continue
+                    matched[hand] = previous[t]
+                    taken.add(t)
         
-        wrist = landmarks[self.mp_hands.HandLandmark.WRIST]
+        for hand, track in enumerate(matched):
+            if track is None:
+                track = matched[hand] = HandTrack(self._next_hand_id, labels[hand])
+                self._next_hand_id += 1
+            track.handedness = labels[hand]
         
-        # Calculate distances between finger tips and their MCPs
-        def distance(p1, p2):
-            return ((p1.x - p2.x)**2 + (p1.y - p2.y)**2 + (p1.z - p2.z)**2) ** 0.5
+        # Update the mapping in place: keep matched tracks, drop the rest
+        current = {track.hand_id for track in matched}
+        for hand_id in [hand_id for hand_id in self.tracks if hand_id not in current]:
+            del self.tracks[hand_id]
+        for track in matched:
+            self.tracks[track.hand_id] = track
+        return matched
+    
+    def _prepare_input(self, frame: np.ndarray):
+        """
+        Build the RGB image the detector runs on from a BGR frame.
         
-        # Check if fingers are curled (tip is close to palm)
-        index_curled = distance(index_tip, wrist) < distance(index_mcp, wrist) * 0.9
-        middle_curled = distance(middle_tip, wrist) < distance(middle_mcp, wrist) * 0.9
-        ring_curled = distance(ring_tip, wrist) < distance(ring_mcp, wrist) * 0.9
-        pinky_curled = distance(pinky_tip, wrist) < distance(pinky_mcp, wrist) * 0.9
+        Returns:
+            tuple: (rgb_image, roi) where roi is the (x0, y0, x1, y1) crop in
+            frame pixels, or None when the whole frame is used
+        """
+        height, width = frame.shape[:2]
+        roi = self._next_roi(width, height)
+        # Scale relative to the full frame, so crops keep the same pixel density
+        scale = 1.0
+        if config.HAND_INFERENCE_WIDTH:
+            scale = min(1.0, config.HAND_INFERENCE_WIDTH / width)
         
-        # Check if thumb is over the fingers
-        thumb_over = thumb_tip.x > index_mcp.x and thumb_tip.y < index_mcp.y + 0.1
+        source = frame if roi is None else frame[roi[1]:roi[3], roi[0]:roi[2]]
+        if scale < 1.0:
+            size = (max(1, round(source.shape[1] * scale)), max(1, round(source.shape[0] * scale)))
+            source = cv2.resize(source, size, dst=self._input_buffer('scaled', (size[1], size[0], 3)),
+                                interpolation=cv2.INTER_AREA)
+        rgb = cv2.cvtColor(source, cv2.COLOR_BGR2RGB,
+                           dst=self._input_buffer('rgb', source.shape))
+        return rgb, roi
+    
+    def _crop_input(self, rgb: np.ndarray, width: int, height: int):
+        """
+        Crop a prepared RGB frame to the hand ROI.
         
-        # Calculate confidence (0 to 1)
-        confidence = 0.0
-        if index_curled:
-            confidence += 0.25
-        if middle_curled:
-            confidence += 0.25
-        if ring_curled:
-            confidence += 0.25
-        if pinky_curled:
-            confidence += 0.15
-        if thumb_over:
-            confidence += 0.1
+        Returns:
+            tuple: (rgb_image, roi) where roi is the crop in display-frame
+            pixels, or None when the whole frame is used
+        """
+        roi = self._next_roi(width, height)
+        if roi is None:
+            return rgb, None
+        # The RGB frame may be downscaled: crop the same region at its scale
+        scale_x, scale_y = rgb.shape[1] / width, rgb.shape[0] / height
+        x0, y0 = int(roi[0] * scale_x), int(roi[1] * scale_y)
+        x1, y1 = max(x0 + 1, round(roi[2] * scale_x)), max(y0 + 1, round(roi[3] * scale_y))
+        crop = rgb[y0:y1, x0:x1]
+        # Detectors expect a contiguous image
+        image = self._input_buffer('crop', crop.shape)
+        np.copyto(image, crop)
+        return image, (x0 / scale_x, y0 / scale_y, x1 / scale_x, y1 / scale_y)
+    
+    def _input_buffer(self, name: str, shape) -> np.ndarray:
+        """Return a reused inference buffer, reallocated when its shape changes."""
+        buffer = self._input_buffers.get(name)
+        if buffer is None or buffer.shape != tuple(shape):
+            buffer = self._input_buffers[name] = np.empty(shape, dtype=np.uint8)
+        return buffer
+    
+    def _next_roi(self, width: int, height: int) -> Optional[Tuple[int, int, int, int]]:
+        """Crop around the last hand boxes, or None to run on the full frame.
         
-        # Consider it a fist if confidence is above threshold
-        is_fist = confidence > 0.7
+        The full frame is used when ROI mode is off, no hand was seen last
+        frame, or every HAND_ROI_REACQUIRE_FRAMES frames so new hands are found.
+        """
+        if (not config.HAND_ROI_ENABLED or not self.hand_boxes
+                or self._frames_since_full >= config.HAND_ROI_REACQUIRE_FRAMES):
+            self._frames_since_full = 0
+            return None
+        self._frames_since_full += 1
         
-        return is_fist, confidence
+        x0 = min(box[0] for box in self.hand_boxes)
+        y0 = min(box[1] for box in self.hand_boxes)
+        x1 = max(box[2] for box in self.hand_boxes)
+        y1 = max(box[3] for box in self.hand_boxes)
+        pad = config.HAND_ROI_MARGIN * max(x1 - x0, y1 - y0)
+        x0, y0 = max(0, int(x0 - pad)), max(0, int(y0 - pad))
+        x1, y1 = min(width, int(x1 + pad) + 1), min(height, int(y1 + pad) + 1)
+        if x0 >= x1 or y0 >= y1 or (x1 - x0) * (y1 - y0) >= width * height:
+            return None
+        return x0, y0, x1, y1
+    
+    def _update_hand_boxes(self, boxes: np.ndarray, width: int, height: int) -> None:
+        """Remember each detected hand's pixel bounding box for the next ROI."""
+        scale = np.array([width, height, width, height], dtype=np.float64)
+        self.hand_boxes = [tuple(box) for box in (boxes * scale).tolist()]
     
     def get_fist_positions(self) -> List[Tuple[float, float]]:
         """
         Get the current fist positions.
         
         Returns:
-            List of (x, y) positions for each detected fist
+            List of smoothed (x, y) positions for each hand currently making a fist
         """
-        # Apply smoothing by averaging recent positions
-        smoothed_positions = []
-        
-        for hand_id, positions in self.position_history.items():
-            if not positions:
-                continue
-                
-            # Simple moving average
-            avg_x = sum(p[0] for p in positions) / len(positions)
-            avg_y = sum(p[1] for p in positions) / len(positions)
-            smoothed_positions.append((avg_x, avg_y))
-        
-        return smoothed_positions
-    
-    def draw_fists(self, frame):
-        """Draw the detected fist positions on the frame with additional debug info."""
-        # Draw a larger circle for each fist position
-        for x, y in self.fist_positions:
-            # Draw outer circle
-            cv2.circle(frame, (x, y), 25, (0, 0, 255), 2)
-            # Draw inner circle
-            cv2.circle(frame, (x, y), 5, (0, 0, 255), -1)
-            # Draw crosshairs
-            cv2.line(frame, (x - 20, y), (x + 20, y), (0, 0, 255), 1)
-            cv2.line(frame, (x, y - 20), (x, y + 20), (0, 0, 255), 1)
-            # Add position text
-            cv2.putText(frame, f'({x}, {y})', (x + 25, y + 5), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.4, (0, 0, 255), 1)
-            # Draw a border
-            cv2.circle(frame, (int(x), int(y)), 
-                      config.FIST_RADIUS, (255, 255, 255), 1)
+        return [(float(track.smoothed[0]), float(track.smoothed[1]))
+                for track in self.tracks.values() if track.is_fist]
+    
+    def draw_fists(self, renderer: Renderer,
+                   positions: Optional[List[Tuple[int, int]]] = None) -> None:
+        """Submit a marker per detected fist.
+        
+        Args:
+            renderer: Renderer to submit to
+            positions: Fist positions to draw; defaults to the last processed frame's
+        """
+        if positions is None:
+            positions = self.fist_positions
+        reach = 25 + 2
+        for x, y in positions:
+            renderer.submit(Layer.FISTS, partial(self._draw_fist, x=x, y=y),
+                            (x - reach, y - reach, 2 * reach, 2 * reach))
+    
+    @staticmethod
+    def _draw_fist(frame, x: int, y: int) -> None:
+        cv2.circle(frame, (x, y), 25, (0, 0, 255), 2)
     
     def cleanup(self):
         """Release resources."""
-        self.hands.close()
+        self.detector.close()
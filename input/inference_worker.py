@@ -0,0 +1,163 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+import numpy as np
+
+from input.hand_detectors import HandDetections
+
+
+@dataclass
+class TrackingResult:
+    """Fist positions from one processed frame.
+
+    ``captured_at`` is the timestamp the frame was submitted with;
+    ``completed_at`` is when inference on it finished. ``hands`` holds every
+    detected hand, fist or not, for diagnostics.
+    """
+    fist_positions: List[Tuple[float, float]] = field(default_factory=list)
+    raw_positions: List[Tuple[int, int]] = field(default_factory=list)
+    hands: HandDetections = field(default_factory=HandDetections.empty)
+    captured_at: float = 0.0
+    completed_at: float = 0.0
+
+    @property
+    def latency(self) -> float:
+        return self.completed_at - self.captured_at
+
+
+class LatestFrameMailbox:
+    """Single-slot mailbox where a newer frame replaces one not yet taken.
+
+    Frames are copied into two owned buffers, so producers may reuse their
+    own frame right after ``put``: one buffer holds the pending frame, the
+    other is the one the consumer is working on until it calls ``release``.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._free: List[np.ndarray] = []
+        self._pending: Optional[np.ndarray] = None
+        self._timestamp = 0.0
+        self._shape = None
+        self._closed = False
+        self.dropped = 0  # frames overwritten before the consumer took them
+
+    def put(self, frame: np.ndarray, timestamp: float) -> None:
+        """Store a copy of ``frame``, replacing any frame still waiting."""
+        with self._cond:
+            if frame.shape != self._shape:
+                # New resolution: buffers of the old one are dropped on release
+                self._shape = frame.shape
+                self._free = [np.empty_like(frame), np.empty_like(frame)]
+                self._pending = None
+            if self._pending is not None:
+                self.dropped += 1
+                target = self._pending
+            elif self._free:
+                target = self._free.pop()
+            else:
+                target = np.empty_like(frame)
+            np.copyto(target, frame)
+            self._pending = target
+            self._timestamp = timestamp
+            self._cond.notify()
+
+    def take(self, timeout: Optional[float] = None) -> Optional[Tuple[np.ndarray, float]]:
+        """Wait for the newest frame; returns (frame, timestamp) or None on timeout/close."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._pending is not None or self._closed, timeout):
+                return None
+            if self._pending is None:
+                return None
+            frame, self._pending = self._pending, None
+            return frame, self._timestamp
+
+    def release(self, frame: np.ndarray) -> None:
+        """Hand a taken frame's buffer back for reuse."""
+        with self._cond:
+            if frame.shape == self._shape and len(self._free) < 2:
+                self._free.append(frame)
+
+    def close(self) -> None:
+        """Wake any waiting consumer; ``take`` returns None from now on."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class HandInferenceWorker:
+    """Runs ``HandTracker.process_frame`` on a dedicated thread.
+
+    The game submits frames without waiting; the worker always processes the
+    newest one (older unprocessed frames are dropped) and publishes a
+    ``TrackingResult`` that the game reads with ``latest``. MediaPipe
+    releases the GIL during inference, so a thread is enough to keep the
+    game loop running at display rate.
+
+    With ``frame_size`` set, submitted frames are RGB inference frames
+    prepared by ``FrameBuffers.prepare`` for a display frame of that
+    (width, height), and are passed to ``HandTracker.process_rgb``.
+    """
+
+    def __init__(self, tracker, frame_size: Optional[Tuple[int, int]] = None):
+        self.tracker = tracker
+        self.frame_size = frame_size
+        self.mailbox = LatestFrameMailbox()
+        self.processed = 0
+        self._result = TrackingResult()
+        self._result_lock = threading.Lock()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the inference thread."""
+        if self._running:
+            return
+        self._running = True
+        self.mailbox = LatestFrameMailbox()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the inference thread, waiting for the current frame to finish."""
+        self._running = False
+        self.mailbox.close()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def submit(self, frame: np.ndarray, timestamp: Optional[float] = None) -> None:
+        """Queue ``frame`` for inference, replacing any frame not yet started."""
+        self.mailbox.put(frame, time.time() if timestamp is None else timestamp)
+
+    def latest(self) -> TrackingResult:
+        """Return the most recently completed result."""
+        with self._result_lock:
+            return self._result
+
+    def _run(self) -> None:
+        while self._running:
+            item = self.mailbox.take(timeout=0.1)
+            if item is None:
+                continue
+            frame, captured_at = item
+            try:
+                if self.frame_size is not None:
+                    self.tracker.process_rgb(frame, self.frame_size, timestamp=captured_at)
+                else:
+                    self.tracker.process_frame(frame, timestamp=captured_at)
+                result = TrackingResult(
+                    fist_positions=self.tracker.get_fist_positions(),
+                    raw_positions=list(self.tracker.fist_positions),
+                    hands=self.tracker.detections,
+                    captured_at=captured_at,
+                    completed_at=time.time())
+            except Exception as e:
+                print(f"Error in hand inference worker: {e}")
+                continue
+            finally:
+                self.mailbox.release(frame)
+            with self._result_lock:
+                self._result = result
+                self.processed += 1
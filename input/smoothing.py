@@ -0,0 +1,54 @@
+import math
+from typing import Optional
+import numpy as np
+
+
+class OneEuroFilter:
+    """One-Euro low-pass filter for 2D positions (Casiez et al., CHI 2012).
+
+    The cutoff frequency rises with the speed of the signal: slow movements
+    are smoothed heavily to remove jitter, fast ones pass almost unfiltered so
+    the output does not lag behind the hand.
+
+    Args:
+        min_cutoff: Cutoff frequency in Hz at rest; lower removes more jitter
+        beta: Cutoff increase per px/s of speed; higher reduces lag
+        d_cutoff: Cutoff frequency in Hz of the speed estimate
+    """
+
+    def __init__(self, min_cutoff: float, beta: float, d_cutoff: float = 1.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.value: Optional[np.ndarray] = None
+        self._speed = np.zeros(2)
+        self._timestamp = 0.0
+
+    @staticmethod
+    def _alpha(dt: float, cutoff: float) -> float:
+        tau = 1.0 / (2 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def __call__(self, position, timestamp: float) -> np.ndarray:
+        """Filter a new sample and return the smoothed position."""
+        position = np.asarray(position, dtype=np.float64)
+        if self.value is None:
+            self.value = position.copy()
+            self._timestamp = timestamp
+            return self.value
+        dt = timestamp - self._timestamp
+        if dt <= 0:
+            return self.value
+        self._timestamp = timestamp
+
+        alpha_d = self._alpha(dt, self.d_cutoff)
+        self._speed = alpha_d * (position - self.value) / dt + (1 - alpha_d) * self._speed
+        cutoff = self.min_cutoff + self.beta * math.hypot(*self._speed)
+        alpha = self._alpha(dt, cutoff)
+        self.value = alpha * position + (1 - alpha) * self.value
+        return self.value
+
+    def reset(self) -> None:
+        """Forget the filter state; the next sample passes through unchanged."""
+        self.value = None
+        self._speed = np.zeros(2)
@@ -9,32 +9,37 @@ from typing import Tuple, Optional
 pygame.mixer.init()
 
 from core.game_engine import GameEngine
+from core.frame_buffers import FrameBuffers
 from config.game_config import config, GameState
 from input.hand_tracker import HandTracker
+from input.camera import CameraCapture
 
 
 def main():
     """Main entry point for the Bubble Pop game."""
-    # Initialize video capture
-    cap = cv2.VideoCapture(0)
-    if not cap.isOpened():
+    # Initialize video capture: a camera index or a video file, read on a
+    # background thread that keeps only the newest frame
+    source = sys.argv[1] if len(sys.argv) > 1 else config.CAMERA_SOURCE
+    camera = CameraCapture(source)
+    if not camera.is_opened():
         print("Error: Could not open camera.")
         return
-    
-    # Set camera resolution
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, config.WINDOW_WIDTH)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, config.WINDOW_HEIGHT)
+    print(f"Camera: {camera.settings}")
     
     # Create window
     cv2.namedWindow('Bubble Pop', cv2.WINDOW_NORMAL)
     cv2.setWindowProperty('Bubble Pop', cv2.WND_PROP_FULLSCREEN, cv2.WINDOW_FULLSCREEN)
     
+    # Frame buffers reused every frame, sized from the negotiated resolution
+    frame_buffers = FrameBuffers(camera.settings.width, camera.settings.height)
+    
     # Create game engine
-    game_engine = GameEngine()
+    game_engine = GameEngine(frame_buffers=frame_buffers)
     
     # Game loop
     last_time = time.time()
     running = True
+    camera.start()
     
     try:
         while running:
@@ -43,17 +48,18 @@ def main():
             dt = current_time - last_time
             last_time = current_time
             
-            # Read frame from camera
-            ret, frame = cap.read()
+            # Newest frame from the grabber thread, timestamped when grabbed
+            ret, frame, captured_at = camera.read()
             if not ret:
-                print("Error: Failed to capture frame.")
-                break
+                if camera.finished:
+                    print("Error: Failed to capture frame.")
+                    break
+                # A slow or stalled frame: keep the window responsive and wait
+                cv2.waitKey(1)
+                continue
             
-            # Flip frame horizontally for mirror effect
-            frame = cv2.flip(frame, 1)
-            
-            # Process frame through game engine
-            modified_frame = game_engine.process_frame(frame)
+            # Process frame through game engine, flipped horizontally for mirror effect
+            modified_frame = game_engine.process_frame(frame, timestamp=captured_at, mirror=True)
             
             # Display the frame
             cv2.imshow('Bubble Pop', modified_frame)
@@ -63,36 +69,13 @@ def main():
             if not game_engine.handle_key(key):
                 running = False
                 
-            # Check for game over
+            # Restart/quit keys on the game-over screen (drawn by the engine)
             if game_engine.state == GameState.GAME_OVER:
-                # Get the frame with game over overlay and text
-                modified_frame = game_engine._draw_game_over(modified_frame)
-                
-                # Add restart/quit instructions with shadow for better visibility
-                instruction_text = "Press 'R' to restart or 'Q' to quit"
-                instruction_pos = (config.WINDOW_WIDTH // 2 - 200, config.WINDOW_HEIGHT // 2 + 100)
-                
-                # Draw shadow
-                cv2.putText(modified_frame, instruction_text, 
-                           (instruction_pos[0] + 1, instruction_pos[1] + 1),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 0), 3, cv2.LINE_AA)
-                # Draw main text
-                cv2.putText(modified_frame, instruction_text, 
-                           instruction_pos,
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.8, 
-                           (255, 255, 255), 2, cv2.LINE_AA)
-                
-                # Display the updated frame with game over and instructions
-                cv2.imshow('Bubble Pop', modified_frame)
-                
-                # Check for restart/quit keys
-                key = cv2.waitKey(1) & 0xFF
-                if key == ord('r') or key == ord('R'):
+                if key == ord('R'):
                     game_engine.reset()
                     last_time = time.time()
-                elif key == ord('q') or key == 27:  # 'q' or ESC
+                elif key == ord('q'):
                     running = False
-                continue  # Skip the rest of the loop to prevent overwriting
     
     except KeyboardInterrupt:
         print("Game stopped by user.")
@@ -101,7 +84,7 @@ def main():
     finally:
         # Clean up
         game_engine.cleanup()
-        cap.release()
+        camera.release()
         cv2.destroyAllWindows()
         pygame.quit()
 
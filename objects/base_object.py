@@ -1,12 +1,44 @@
 from abc import ABC, abstractmethod
-from typing import Tuple
+from typing import Any, Callable, Tuple
 import numpy as np
 import cv2
 
 
+class StoreField:
+    """Attribute that lives in an ``ObjectStore`` column while the object is attached.
+
+    Detached objects (freshly constructed or sitting in a pool) keep the value
+    in a private instance attribute, so they behave like plain Python objects.
+    """
+
+    def __init__(self, cast: Callable[[Any], Any] = float):
+        self.cast = cast
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+        self.local = '_' + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        store = obj._store
+        if store is None:
+            return getattr(obj, self.local)
+        return self.cast(getattr(store, self.name)[obj._slot])
+
+    def __set__(self, obj, value) -> None:
+        store = obj._store
+        if store is None:
+            setattr(obj, self.local, value)
+        else:
+            getattr(store, self.name)[obj._slot] = value
+
+
 class IGameObject(ABC):
     """Interface for any object that can be updated and drawn."""
 
+    __slots__ = ()
+
     @abstractmethod
     def update(self, dt: float) -> None:
         pass
@@ -17,9 +49,30 @@ class IGameObject(ABC):
 
 
 class AbstractFallingObject(IGameObject, ABC):
-    """Abstract base class for objects that fall from the top of the screen."""
+    """Abstract base class for objects that fall from the top of the screen.
+
+    Instances are slotted: subclasses must declare every attribute they add
+    in their own ``__slots__``. This only saves the per-instance ``__dict__``
+    (about 40 bytes); access to the ``StoreField`` attributes costs the same
+    either way (see benchmarks/bench_object_layout.py).
+    """
+
+    __slots__ = ('_store', '_slot', 'handle', 'type', 'original_speed',
+                 '_x', '_y', '_speed', '_radius', '_active', '_frozen')
+
+    DESPAWN_Y = 720  # Assuming screen height of 720
+
+    x = StoreField()
+    y = StoreField()
+    speed = StoreField()
+    radius = StoreField()
+    active = StoreField(bool)
+    frozen = StoreField(bool)
 
     def __init__(self, x: float, y: float, speed: float, radius: float, obj_type: str):
+        self._store = None
+        self._slot = -1
+        self.handle = None
         self.x = x
         self.y = y
         self.speed = speed
@@ -32,7 +85,7 @@ class AbstractFallingObject(IGameObject, ABC):
     def update(self, dt: float) -> None:
         if not self.frozen:
             self.y += self.speed * dt
-        if self.y - self.radius > 720:  # Assuming screen height of 720
+        if self.y - self.radius > self.DESPAWN_Y:
             self.deactivate()
 
     def draw(self, frame: np.ndarray) -> None:
@@ -40,11 +93,13 @@ class AbstractFallingObject(IGameObject, ABC):
             center = (int(self.x), int(self.y))
             cv2.circle(frame, center, int(self.radius), (255, 0, 0), -1)
 
-    def is_hit(self, fist_pos: Tuple[int, int]) -> bool:
+    def is_hit(self, fist_pos: Tuple[int, int], fist_radius: float = 0.0) -> bool:
         if not self.active:
             return False
-        distance = np.sqrt((self.x - fist_pos[0]) ** 2 + (self.y - fist_pos[1]) ** 2)
-        return distance <= self.radius
+        dx = self.x - fist_pos[0]
+        dy = self.y - fist_pos[1]
+        reach = self.radius + fist_radius
+        return dx * dx + dy * dy <= reach * reach
 
     def is_off_screen(self, height: int) -> bool:
         """Check if the object is off the screen."""
@@ -59,3 +114,22 @@ class AbstractFallingObject(IGameObject, ABC):
 
     def deactivate(self) -> None:
         self.active = False
+
+    def _attach(self, store, slot: int, handle) -> None:
+        """Bind this object to a row of an ``ObjectStore``."""
+        self._store = store
+        self._slot = slot
+        self.handle = handle
+
+    def _detach(self) -> None:
+        """Copy the object's row back into local attributes and unbind it."""
+        store = self._store
+        if store is None:
+            return
+        for name in store.COLUMNS:
+            field = getattr(type(self), name, None)
+            if isinstance(field, StoreField):
+                setattr(self, field.local, field.__get__(self))
+        self._store = None
+        self._slot = -1
+        self.handle = None
@@ -4,12 +4,21 @@ from typing import Optional
 import random
 
 from objects.base_object import AbstractFallingObject
+from rendering.sprite_cache import Sprite, SpriteCache
 from config.game_config import config
 
 
 class Bubble(AbstractFallingObject):
     """A bubble that falls from the top of the screen."""
 
+    __slots__ = ('color', 'draw_radius')
+
+    HIGHLIGHT_COLOR = (200, 200, 200)
+    OUTLINE_COLOR = (255, 255, 255)
+
+    # Shared by all bubbles; keyed by (integer radius, colour)
+    sprites = SpriteCache(capacity=config.SPRITE_CACHE_SIZE)
+
     def __init__(self, x: float, y: float, radius: Optional[float] = None, speed: Optional[float] = None):
         if radius is None:
             radius = random.uniform(*config.BUBBLE_RADIUS_RANGE)
@@ -18,26 +27,38 @@ class Bubble(AbstractFallingObject):
 
         super().__init__(x=x, y=y, radius=radius, speed=speed, obj_type="bubble")
         self.color = config.COLOR_BUBBLE
+        self._update_geometry()
 
     def draw(self, frame: np.ndarray) -> None:
         if not self.active:
             return
 
-        center = (int(self.x), int(self.y))
-        radius = int(self.radius)
+        radius, color = self.draw_radius, self.color
+        sprite = self.sprites.get((radius, color), self.render_sprite, radius, color)
+        sprite.blit(frame, int(self.x), int(self.y))
+
+    @classmethod
+    def render_sprite(cls, radius: int, color) -> Sprite:
+        """Rasterize the bubble look (fill, highlight, outline) once, centred in its sprite."""
+        size = 2 * radius + 3
+        c = radius + 1
+        image = np.zeros((size, size, 3), dtype=np.uint8)
+        mask = np.zeros((size, size), dtype=np.uint8)
 
         # Draw the bubble
-        cv2.circle(frame, center, radius, self.color, -1)
+        cv2.circle(image, (c, c), radius, color, -1)
 
         # Draw highlight
-        highlight_color = (200, 200, 200)
-        highlight_radius = int(self.radius * 0.3)
-        highlight_x = int(self.x - self.radius * 0.4)
-        highlight_y = int(self.y - self.radius * 0.4)
-        cv2.circle(frame, (highlight_x, highlight_y), highlight_radius, highlight_color, -1)
+        offset = radius * 0.4
+        cv2.circle(image, (int(c - offset), int(c - offset)), int(radius * 0.3),
+                   cls.HIGHLIGHT_COLOR, -1)
 
         # Draw bubble outline
-        cv2.circle(frame, center, radius, (255, 255, 255), 1)
+        cv2.circle(image, (c, c), radius, cls.OUTLINE_COLOR, 1)
+
+        cv2.circle(mask, (c, c), radius, 255, -1)
+        cv2.circle(mask, (c, c), radius, 255, 1)
+        return Sprite(image, mask.astype(bool), (c, c))
 
     def reset(self, **kwargs) -> None:
         super().reset(**kwargs)
@@ -45,3 +66,8 @@ class Bubble(AbstractFallingObject):
             self.radius = random.uniform(*config.BUBBLE_RADIUS_RANGE)
         if 'speed' not in kwargs:
             self.speed = random.uniform(*config.BUBBLE_SPEED_RANGE)
+        self._update_geometry()
+
+    def _update_geometry(self) -> None:
+        """Precompute radius-derived drawing geometry; call after changing ``radius``."""
+        self.draw_radius = int(self.radius)
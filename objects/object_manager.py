@@ -1,96 +1,296 @@
 from __future__ import annotations
 import random
-from typing import List, Type
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Tuple, Union
 import numpy as np
 from objects.bubble import Bubble
 from objects.power import Power
 from objects.base_object import AbstractFallingObject
-from config.game_config import config, PowerType, GameConfig
+from objects.object_store import ObjectStore, Handle
+from objects.object_pool import ObjectPool, PoolStats
+from objects.spatial_grid import SpatialGrid
+from rendering.renderer import Layer, Renderer
+from config.game_config import config, PowerType, GameConfig, SpawnPolicy
+
+
+@dataclass
+class AdmissionStats:
+    """Counters for spawns requested while ``max_objects`` was reached."""
+    dropped: int = 0
+    deferred: int = 0
+    recycled: int = 0
 
 
 class ObjectManager:
-    """Manages all active game objects, including spawning, updating, and pooling."""
+    """Manages all active game objects, including spawning, updating, and pooling.
+
+    Object state is held column-wise in an ``ObjectStore``; ``objects`` is the
+    list of thin views over its rows, in row order. When ``cell_size`` is set,
+    a ``SpatialGrid`` over the rows narrows hit tests and range queries to
+    nearby cells.
+
+    Observers mutate objects from the event dispatch thread, so every method
+    that touches the store holds ``_lock``. ``get_objects`` returns a snapshot,
+    which callers may iterate while removing objects.
 
-    def __init__(self, max_objects: int = 100):
+    At most ``max_objects`` are on screen at once; further spawns are handled
+    according to ``spawn_policy``. Instances come from bounded, pre-warmed
+    ``ObjectPool``s that persist across ``reset``.
+    """
+
+    def __init__(self, max_objects: int = config.MAX_OBJECTS,
+                 cell_size: Optional[int] = config.SPATIAL_CELL_SIZE,
+                 spawn_policy: SpawnPolicy = config.SPAWN_POLICY):
         self.max_objects = max_objects
-        self.objects: List[AbstractFallingObject] = []
-        self._object_pool: Dict[str, List[AbstractFallingObject]] = {
-            'bubble': [],
-            'power': []
+        self.spawn_policy = spawn_policy
+        self.admission_stats = AdmissionStats()
+        # At most max_objects spawns wait; DEFER drops and counts the rest
+        self._deferred: Deque[str] = deque()
+        self.store = ObjectStore(capacity=max_objects)
+        self.objects: List[AbstractFallingObject] = self.store.objects
+        self._lock = threading.RLock()
+        self.grid: Optional[SpatialGrid] = None
+        if cell_size:
+            self.grid = SpatialGrid(config.WINDOW_WIDTH, config.WINDOW_HEIGHT,
+                                    cell_size, capacity=max_objects)
+        self._object_pool: Dict[str, ObjectPool] = {
+            GameConfig.BUBBLE: ObjectPool(Bubble, max_objects, config.BUBBLE_POOL_PREWARM),
+            GameConfig.POWER: ObjectPool(Power, max_objects, config.POWER_POOL_PREWARM),
         }
+        Power.prebake_animations()
 
     def update_all(self, dt: float) -> None:
-        """Update all active objects and remove inactive ones."""
-        for obj in self.objects[:]:
-            obj.update(dt)
-            if not obj.active:
-                self.remove_object(obj)
+        """Advance all objects in one vectorized pass and remove inactive ones."""
+        with self._lock:
+            inactive = self.store.update(dt, AbstractFallingObject.DESPAWN_Y)
+            # Descending order keeps swap-removal from moving rows not yet visited
+            for row in inactive[::-1]:
+                self.remove_object(self.objects[row])
+            self.refresh_spatial_index()
+            while self._deferred and self.store.size < self.max_objects:
+                self._spawn(self._deferred.popleft())
+
+    def refresh_spatial_index(self) -> None:
+        """Re-bucket objects that moved into another grid cell.
+
+        Called by ``update_all``; only needed directly after moving objects by
+        hand (e.g. assigning ``obj.x``).
+        """
+        if self.grid is not None:
+            with self._lock:
+                store = self.store
+                self.grid.sync(store.column('x'), store.column('y'), store.column('radius'))
+
+    def check_hits(self, fist_positions: np.ndarray,
+                   fist_radius: Union[float, np.ndarray] = config.FIST_RADIUS) -> np.ndarray:
+        """Return the rows of all active objects touched by any fist.
+
+        Rows are only meaningful until the next removal; use ``get_hit_objects``
+        when the hits are about to be removed.
+
+        Args:
+            fist_positions: (F, 2) array of fist centres in pixels
+            fist_radius: Radius of a fist, added to each object's radius; a
+                (F,) array gives each fist its own radius (e.g. widened by
+                prediction uncertainty)
+
+        Returns:
+            Ascending row indices into ``objects``
+        """
+        fists = np.asarray(fist_positions, dtype=np.float64).reshape(-1, 2)
+        radii = np.broadcast_to(np.asarray(fist_radius, dtype=np.float64), len(fists))
+        with self._lock:
+            if self.store.size == 0 or len(fists) == 0:
+                return np.empty(0, dtype=np.intp)
+
+            rows = None
+            if self.grid is not None:
+                reach = (self.grid.max_radius + radii)[:, None]
+                rows = self.grid.query_many(fists - reach, fists + reach)
+            return self._touching(rows, fists, radii)
+
+    def get_hit_objects(self, fist_positions: np.ndarray,
+                        fist_radius: Union[float, np.ndarray] = config.FIST_RADIUS
+                        ) -> List[AbstractFallingObject]:
+        """Return the objects touched by any fist (see ``check_hits``)."""
+        with self._lock:
+            return [self.objects[row] for row in self.check_hits(fist_positions, fist_radius)]
+
+    def get_objects_below(self, y: float) -> List[AbstractFallingObject]:
+        """Return the objects whose top edge is below ``y``."""
+        with self._lock:
+            below = self.store.column('y') - self.store.column('radius') > y
+            return [self.objects[row] for row in np.flatnonzero(below)]
 
-    def draw_all(self, frame: np.ndarray) -> None:
-        """Draw all active objects on the frame."""
-        for obj in self.objects:
-            obj.draw(frame)
+    def objects_near(self, point: Tuple[float, float], radius: float) -> List[AbstractFallingObject]:
+        """Return active objects whose circle overlaps the circle around ``point``."""
+        centre = np.asarray(point, dtype=np.float64).reshape(1, 2)
+        with self._lock:
+            rows = None
+            if self.grid is not None:
+                reach = self.grid.max_radius + radius
+                rows = self.grid.query(*(centre[0] - reach), *(centre[0] + reach))
+            return [self.objects[row] for row in self._touching(rows, centre, radius)]
 
-    def spawn_bubble(self) -> Bubble:
-        """Get a bubble from the pool or create a new one and add it to the game."""
-        margin = config.WINDOW_WIDTH * 0.1
-        x = random.uniform(margin, config.WINDOW_WIDTH - margin)
-        y = -50.0
+    def objects_in_rect(self, x0: float, y0: float, x1: float, y1: float) -> List[AbstractFallingObject]:
+        """Return active objects whose centre lies inside the rectangle."""
+        store = self.store
+        with self._lock:
+            if self.grid is None:
+                rows = np.arange(store.size)
+            else:
+                rows = self.grid.query(x0, y0, x1, y1)
+            x = store.x[rows]
+            y = store.y[rows]
+            inside = (x >= x0) & (x <= x1) & (y >= y0) & (y <= y1) & store.active[rows]
+            return [self.objects[row] for row in rows[inside]]
 
-        bubble = self._get_from_pool(GameConfig.BUBBLE, Bubble, x=x, y=y)
-        self.objects.append(bubble)
-        return bubble
+    def _touching(self, rows: Optional[np.ndarray], centres: np.ndarray,
+                  extra_radius: Union[float, np.ndarray]) -> np.ndarray:
+        """Exact circle test of ``rows`` (all rows if None) against (K, 2) centres.
 
-    def spawn_power(self) -> Power:
-        """Get a power-up from the pool or create a new one and add it to the game."""
-        margin = config.WINDOW_WIDTH * 0.1
-        x = random.uniform(margin, config.WINDOW_WIDTH - margin)
-        y = -50.0
+        ``extra_radius`` is a scalar or one radius per centre.
 
-        power = self._get_from_pool(GameConfig.POWER, Power, x=x, y=y)
-        self.objects.append(power)
-        return power
+        Returns:
+            Ascending row indices of active objects touching any centre
+        """
+        store = self.store
+        n = store.size
+        if rows is None:
+            x, y, radius, active = store.x[:n], store.y[:n], store.radius[:n], store.active[:n]
+        else:
+            x, y, radius, active = store.x[rows], store.y[rows], store.radius[rows], store.active[rows]
+
+        # (N, K) squared distances in one broadcasted pass
+        dx = x[:, None] - centres[None, :, 0]
+        dy = y[:, None] - centres[None, :, 1]
+        reach = radius[:, None] + np.broadcast_to(extra_radius, len(centres))[None, :]
+        touched = (dx * dx + dy * dy <= reach * reach).any(axis=1) & active
+        if rows is None:
+            return np.flatnonzero(touched)
+        return rows[touched]
+
+    def draw_all(self, renderer: Renderer) -> None:
+        """Submit a draw command per object; the renderer culls off-screen ones."""
+        with self._lock:
+            objects = list(self.objects)
+            # Conservative box: covers the power-up pulse (1.1x) and outlines
+            half = self.store.column('radius') * 1.1 + 3
+            x0 = (self.store.column('x') - half).astype(int).tolist()
+            y0 = (self.store.column('y') - half).astype(int).tolist()
+            size = (2 * half + 1).astype(int).tolist()
+        for obj, x, y, extent in zip(objects, x0, y0, size):
+            renderer.submit(Layer.OBJECTS, obj.draw, (x, y, extent, extent))
+
+    def spawn_bubble(self) -> Optional[Bubble]:
+        """Get a bubble from the pool and add it to the game.
+
+        Returns None if ``max_objects`` is reached and the policy is DROP or DEFER.
+        """
+        return self._spawn(GameConfig.BUBBLE)
+
+    def spawn_power(self) -> Optional[Power]:
+        """Get a power-up from the pool and add it to the game.
+
+        Returns None if ``max_objects`` is reached and the policy is DROP or DEFER.
+        """
+        return self._spawn(GameConfig.POWER)
+
+    def pool_stats(self) -> Dict[str, PoolStats]:
+        """Return the hit/miss/allocation counters of each pool."""
+        return {obj_type: pool.stats for obj_type, pool in self._object_pool.items()}
+
+    def add_object(self, obj: AbstractFallingObject) -> None:
+        """Add a detached object to the game."""
+        with self._lock:
+            row = self.store.add(obj)
+            if self.grid is not None:
+                self.grid.insert(row, obj.x, obj.y, obj.radius)
+
+    def get(self, handle: Handle) -> Optional[AbstractFallingObject]:
+        """Return the on-screen object for a handle, or None if it has since been removed."""
+        with self._lock:
+            return self.store.get(handle)
+
+    def contains(self, obj: AbstractFallingObject) -> bool:
+        """Return True if the object is currently on screen."""
+        return obj in self.store
 
     def get_objects(self, obj_type: Optional[str] = None) -> List[AbstractFallingObject]:
-        """Return a list of all active objects, optionally filtered by type."""
-        if obj_type:
-            return [obj for obj in self.objects if obj.type == obj_type]
-        return self.objects
+        """Return a snapshot list of all active objects, optionally filtered by type."""
+        with self._lock:
+            if obj_type:
+                code = ObjectStore.TYPE_CODES[obj_type]
+                rows = np.flatnonzero(self.store.column('type') == code)
+                return [self.objects[row] for row in rows]
+            return list(self.objects)
 
     def remove_object(self, obj: AbstractFallingObject) -> None:
-        """Remove an object from the active list and return it to the pool."""
-        if obj in self.objects:
-            self.objects.remove(obj)
+        """Remove an object from the active list and return it to the pool.
+
+        Constant time; removing an object that is no longer on screen is a no-op.
+        """
+        with self._lock:
+            if obj not in self.store:
+                return
+            if self.grid is not None:
+                self.grid.remove(obj._slot, self.store.size - 1)
+            self.store.remove(obj)
             self._return_to_pool(obj)
 
     def remove_all(self, obj_type: Optional[str] = None) -> None:
         """Remove all objects, optionally filtered by type."""
-        objects_to_remove = self.get_objects(obj_type)
-        for obj in objects_to_remove[:]:
-            self.remove_object(obj)
+        with self._lock:
+            for obj in self.get_objects(obj_type):
+                self.remove_object(obj)
 
     def freeze_all(self, freeze: bool = True) -> None:
         """Freeze or unfreeze all bubbles."""
-        for obj in self.get_objects(GameConfig.BUBBLE):
-            obj.frozen = freeze
+        with self._lock:
+            bubbles = self.store.column('type') == ObjectStore.TYPE_CODES[GameConfig.BUBBLE]
+            self.store.column('frozen')[bubbles] = freeze
 
     def reset(self) -> None:
-        """Reset the object manager by clearing all objects and pools."""
-        self.objects.clear()
-        for pool in self._object_pool.values():
-            pool.clear()
-
-    def _get_from_pool(self, obj_type: str, constructor: type, **kwargs) -> AbstractFallingObject:
-        """Retrieve an object from the pool or create a new one if the pool is empty."""
-        pool = self._object_pool[obj_type]
-        if pool:
-            obj = pool.pop()
-            obj.reset(**kwargs)
+        """Reset the object manager by returning all objects to their pools."""
+        with self._lock:
+            objects = list(self.objects)
+            self.store.clear()
+            if self.grid is not None:
+                self.grid.clear()
+            for obj in objects:
+                self._return_to_pool(obj)
+            self._deferred.clear()
+
+    def _spawn(self, obj_type: str) -> Optional[AbstractFallingObject]:
+        """Admit a new object of ``obj_type`` at a random position above the screen."""
+        with self._lock:
+            if self.store.size >= self.max_objects and not self._make_room(obj_type):
+                return None
+            margin = config.WINDOW_WIDTH * 0.1
+            x = random.uniform(margin, config.WINDOW_WIDTH - margin)
+            y = -50.0
+
+            obj = self._object_pool[obj_type].acquire(x=x, y=y)
+            self.add_object(obj)
             return obj
-        return constructor(**kwargs)
+
+    def _make_room(self, obj_type: str) -> bool:
+        """Apply the spawn policy when full; return True if a slot was freed."""
+        if self.spawn_policy == SpawnPolicy.RECYCLE and self.store.size:
+            self.remove_object(self.store.oldest())
+            self.admission_stats.recycled += 1
+            return True
+        if self.spawn_policy == SpawnPolicy.DEFER and len(self._deferred) < self.max_objects:
+            self._deferred.append(obj_type)
+            self.admission_stats.deferred += 1
+        else:
+            self.admission_stats.dropped += 1
+        return False
 
     def _return_to_pool(self, obj: AbstractFallingObject) -> None:
         """Return an inactive object to the appropriate pool."""
-        if obj.type in self._object_pool:
-            obj.deactivate()
-            self._object_pool[obj.type].append(obj)
+        pool = self._object_pool.get(obj.type)
+        if pool is not None:
+            pool.release(obj)
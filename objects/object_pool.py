@@ -0,0 +1,63 @@
+from dataclasses import dataclass
+from typing import Callable, List
+
+from objects.base_object import AbstractFallingObject
+
+
+@dataclass
+class PoolStats:
+    """Counters for one object pool."""
+    hits: int = 0          # acquires served from the pool
+    misses: int = 0        # acquires that found the pool empty
+    allocations: int = 0   # instances constructed, including pre-warming
+    discarded: int = 0     # releases dropped because the pool was full
+
+
+class ObjectPool:
+    """Bounded free list of reusable falling objects of one type.
+
+    The pool is filled with ``prewarm`` instances up front and never holds
+    more than ``capacity`` idle instances; surplus releases are left to the
+    garbage collector and counted in ``stats.discarded``.
+    """
+
+    def __init__(self, factory: Callable[..., AbstractFallingObject], capacity: int, prewarm: int = 0):
+        self.factory = factory
+        self.capacity = capacity
+        self.stats = PoolStats()
+        self._free: List[AbstractFallingObject] = []
+        self.prewarm(prewarm)
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    def __contains__(self, obj: AbstractFallingObject) -> bool:
+        return any(free is obj for free in self._free)
+
+    def prewarm(self, count: int) -> None:
+        """Construct idle instances until the pool holds ``count`` (or is full)."""
+        target = min(count, self.capacity)
+        while len(self._free) < target:
+            obj = self.factory(x=0.0, y=0.0)
+            obj.deactivate()
+            self.stats.allocations += 1
+            self._free.append(obj)
+
+    def acquire(self, **kwargs) -> AbstractFallingObject:
+        """Return a reset pooled instance, constructing one if the pool is empty."""
+        if self._free:
+            obj = self._free.pop()
+            obj.reset(**kwargs)
+            self.stats.hits += 1
+            return obj
+        self.stats.misses += 1
+        self.stats.allocations += 1
+        return self.factory(**kwargs)
+
+    def release(self, obj: AbstractFallingObject) -> None:
+        """Deactivate an object and keep it for reuse if there is room."""
+        obj.deactivate()
+        if len(self._free) < self.capacity:
+            self._free.append(obj)
+        else:
+            self.stats.discarded += 1
@@ -0,0 +1,168 @@
+from __future__ import annotations
+from typing import Dict, List, NamedTuple, Optional, TYPE_CHECKING
+import numpy as np
+
+from config.game_config import GameConfig
+
+if TYPE_CHECKING:
+    from objects.base_object import AbstractFallingObject
+
+
+class Handle(NamedTuple):
+    """Generation-tagged reference to one spawn of an object.
+
+    The handle stays valid while the object is on screen, even as its row
+    moves, and goes stale as soon as the object is removed, so a pooled and
+    respawned instance is never mistaken for its earlier life.
+    """
+    index: int
+    generation: int
+
+
+class ObjectStore:
+    """Structure-of-arrays storage for all on-screen falling objects.
+
+    Each object occupies one row of a set of contiguous NumPy columns. The
+    object instances themselves are thin views: while attached, their
+    ``x``/``y``/``speed``/... attributes read and write the row directly.
+    Rows are kept dense (``0 .. size-1``) by swap-removing on deletion;
+    a slot map from ``Handle`` to row makes lookup, membership and removal
+    constant time.
+    """
+
+    TYPE_CODES: Dict[str, int] = {GameConfig.BUBBLE: 0, GameConfig.POWER: 1}
+
+    # Column name -> dtype
+    COLUMNS: Dict[str, type] = {
+        'x': np.float64,
+        'y': np.float64,
+        'speed': np.float64,
+        'radius': np.float64,
+        'active': np.bool_,
+        'frozen': np.bool_,
+        'type': np.int8,
+        'pulse_timer': np.float64,
+        'pulse_speed': np.float64,
+        'spawn_order': np.int64,
+    }
+
+    def __init__(self, capacity: int = 128):
+        self.capacity = max(1, capacity)
+        self.size = 0
+        self._next_spawn_order = 0
+        self.objects: List[AbstractFallingObject] = []
+        # Slot map: handle index -> row (-1 when free), row -> handle index
+        self._handle_rows: List[int] = []
+        self._generations: List[int] = []
+        self._row_handles: List[int] = []
+        self._free_handles: List[int] = []
+        for name, dtype in self.COLUMNS.items():
+            setattr(self, name, np.zeros(self.capacity, dtype=dtype))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, obj: AbstractFallingObject) -> bool:
+        return obj._store is self
+
+    def get(self, handle: Handle) -> Optional[AbstractFallingObject]:
+        """Return the object a handle refers to, or None if it has been removed."""
+        index, generation = handle
+        if index >= len(self._generations) or self._generations[index] != generation:
+            return None
+        row = self._handle_rows[index]
+        return self.objects[row] if row >= 0 else None
+
+    def oldest(self) -> Optional[AbstractFallingObject]:
+        """Return the object that was added earliest, or None if empty."""
+        if self.size == 0:
+            return None
+        return self.objects[int(np.argmin(self.spawn_order[:self.size]))]
+
+    def column(self, name: str) -> np.ndarray:
+        """Return the live slice ``[0:size]`` of a column."""
+        return getattr(self, name)[:self.size]
+
+    def add(self, obj: AbstractFallingObject) -> int:
+        """Append an object as a new row and bind it to that row."""
+        if self.size == self.capacity:
+            self._grow()
+        row = self.size
+        for name in self.COLUMNS:
+            if name == 'type':
+                self.type[row] = self.TYPE_CODES.get(obj.type, -1)
+            else:
+                getattr(self, name)[row] = getattr(obj, name, 0)
+        self.spawn_order[row] = self._next_spawn_order
+        self._next_spawn_order += 1
+        if self._free_handles:
+            index = self._free_handles.pop()
+            self._handle_rows[index] = row
+        else:
+            index = len(self._handle_rows)
+            self._handle_rows.append(row)
+            self._generations.append(0)
+        self._row_handles.append(index)
+        self.objects.append(obj)
+        self.size += 1
+        obj._attach(self, row, Handle(index, self._generations[index]))
+        return row
+
+    def remove(self, obj: AbstractFallingObject) -> None:
+        """Remove an object's row by moving the last row into its place."""
+        row = obj._slot
+        obj._detach()
+        self._release_handle(self._row_handles[row])
+        last = self.size - 1
+        if row != last:
+            for name in self.COLUMNS:
+                column = getattr(self, name)
+                column[row] = column[last]
+            moved = self.objects[last]
+            moved._slot = row
+            self.objects[row] = moved
+            moved_handle = self._row_handles[last]
+            self._row_handles[row] = moved_handle
+            self._handle_rows[moved_handle] = row
+        self.objects.pop()
+        self._row_handles.pop()
+        self.size -= 1
+
+    def clear(self) -> None:
+        """Detach every object and empty the store."""
+        for obj in self.objects:
+            obj._detach()
+        for index in self._row_handles:
+            self._release_handle(index)
+        self.objects.clear()
+        self._row_handles.clear()
+        self.size = 0
+
+    def update(self, dt: float, despawn_y: float) -> np.ndarray:
+        """Advance every row by ``dt`` seconds.
+
+        Returns:
+            Row indices of all inactive objects, in ascending order.
+        """
+        n = self.size
+        y = self.y[:n]
+        active = self.active[:n]
+        moving = ~self.frozen[:n]
+        np.add(y, self.speed[:n] * dt, out=y, where=moving)
+        self.pulse_timer[:n] += self.pulse_speed[:n] * dt
+        active &= ~(y - self.radius[:n] > despawn_y)
+        return np.flatnonzero(~active)
+
+    def _release_handle(self, index: int) -> None:
+        """Invalidate outstanding copies of a handle and recycle its index."""
+        self._generations[index] += 1
+        self._handle_rows[index] = -1
+        self._free_handles.append(index)
+
+    def _grow(self) -> None:
+        """Double the capacity of every column."""
+        self.capacity *= 2
+        for name, dtype in self.COLUMNS.items():
+            grown = np.zeros(self.capacity, dtype=dtype)
+            grown[:self.size] = getattr(self, name)[:self.size]
+            setattr(self, name, grown)
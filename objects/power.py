@@ -1,15 +1,19 @@
 import cv2
+import math
 import numpy as np
 from typing import Optional, Dict, Tuple
 import random
 
-from objects.base_object import AbstractFallingObject
+from objects.base_object import AbstractFallingObject, StoreField
+from rendering.sprite_cache import Sprite, SpriteCache
 from config.game_config import config, PowerType
 
 
 class Power(AbstractFallingObject):
     """A power-up that falls from the top of the screen."""
 
+    __slots__ = ('power_type', '_pulse_timer', '_pulse_speed')
+
     POWER_RADIUS = 25
     POWER_SPEED = 50.0
     POWER_COLORS: Dict[PowerType, Tuple[int, int, int]] = {
@@ -18,6 +22,15 @@ class Power(AbstractFallingObject):
         PowerType.HEALTH: config.COLOR_POWER_HEALTH,
     }
 
+    SYMBOL_FONT_SCALE = 0.8
+    SYMBOL_THICKNESS = 2
+
+    # One pulse cycle per (power type, integer radius), pre-rendered into an atlas
+    animations = SpriteCache(capacity=16)
+
+    pulse_timer = StoreField()
+    pulse_speed = StoreField()
+
     def __init__(self, x: float, y: float, power_type: Optional[PowerType] = None):
         if power_type is None:
             power_type = random.choice(list(PowerType))
@@ -31,34 +44,65 @@ class Power(AbstractFallingObject):
         if not self.active:
             return
 
-        color = self.POWER_COLORS.get(self.power_type, (255, 255, 255))
-        pulse = np.sin(self.pulse_timer) * 0.1 + 1.0  # Pulse between 0.9 and 1.1
-        radius = int(self.radius * pulse)
-        center = (int(self.x), int(self.y))
-
-        # Draw main circle
-        cv2.circle(frame, center, radius, color, -1)
-        # Draw outline
-        cv2.circle(frame, center, radius, (255, 255, 255), 1)
-        # Draw power symbol
-        self._draw_power_symbol(frame)
+        radius = int(self.radius)
+        frames = self.animations.get((self.power_type, radius), self.render_animation,
+                                     self.power_type, radius)
+        # Nearest pre-rendered phase of the sin() pulse
+        count = len(frames)
+        index = int(self.pulse_timer * count / (2 * math.pi) + 0.5) % count
+        frames[index].blit(frame, int(self.x), int(self.y))
 
     def update(self, dt: float) -> None:
         super().update(dt)
         self.pulse_timer += dt * self.pulse_speed
 
-    def _draw_power_symbol(self, frame: np.ndarray) -> None:
-        text = self.power_type.value
-        font_scale = 0.8
-        thickness = 2
-        (text_width, text_height), _ = cv2.getTextSize(text, config.FONT_FACE, font_scale, thickness)
-        text_x = int(self.x - text_width / 2)
-        text_y = int(self.y + text_height / 2)
-
-        # Draw text shadow
-        cv2.putText(frame, text, (text_x + 1, text_y + 1), config.FONT_FACE, font_scale, (0, 0, 0), thickness)
-        # Draw main text
-        cv2.putText(frame, text, (text_x, text_y), config.FONT_FACE, font_scale, (255, 255, 255), thickness)
+    @classmethod
+    def prebake_animations(cls, radius: int = POWER_RADIUS) -> None:
+        """Render the pulse atlas of every power type up front."""
+        for power_type in PowerType:
+            cls.animations.get((power_type, radius), cls.render_animation, power_type, radius)
+
+    @classmethod
+    def render_animation(cls, power_type: PowerType, radius: int,
+                         frame_count: int = config.POWER_PULSE_FRAMES) -> Tuple[Sprite, ...]:
+        """Rasterize one pulse cycle into an atlas and return a sprite view per phase."""
+        text = power_type.value
+        (text_width, text_height), _ = cv2.getTextSize(
+            text, config.FONT_FACE, cls.SYMBOL_FONT_SCALE, cls.SYMBOL_THICKNESS)
+        half = max(int(radius * 1.1), text_width, text_height) + 2
+        size = 2 * half + 1
+        atlas = np.zeros((size, size * frame_count, 3), dtype=np.uint8)
+        mask = np.zeros((size, size * frame_count), dtype=np.uint8)
+        color = cls.POWER_COLORS.get(power_type, (255, 255, 255))
+
+        for i in range(frame_count):
+            pulse = np.sin(2 * math.pi * i / frame_count) * 0.1 + 1.0  # Pulse between 0.9 and 1.1
+            cell = slice(i * size, (i + 1) * size)
+            for target, fill, outline, shadow, symbol in (
+                    (atlas[:, cell], color, (255, 255, 255), (0, 0, 0), (255, 255, 255)),
+                    (mask[:, cell], 255, 255, 255, 255)):
+                cls._draw_phase(target, half, int(radius * pulse), text, text_width, text_height,
+                                fill, outline, shadow, symbol)
+
+        coverage = mask.astype(bool)
+        return tuple(Sprite(atlas[:, i * size:(i + 1) * size], coverage[:, i * size:(i + 1) * size],
+                            (half, half))
+                     for i in range(frame_count))
+
+    @classmethod
+    def _draw_phase(cls, target: np.ndarray, c: int, radius: int, text: str,
+                    text_width: int, text_height: int, fill, outline, shadow, symbol) -> None:
+        # Draw main circle
+        cv2.circle(target, (c, c), radius, fill, -1)
+        # Draw outline
+        cv2.circle(target, (c, c), radius, outline, 1)
+        # Draw power symbol: shadow, then main text
+        text_x = int(c - text_width / 2)
+        text_y = int(c + text_height / 2)
+        cv2.putText(target, text, (text_x + 1, text_y + 1), config.FONT_FACE,
+                    cls.SYMBOL_FONT_SCALE, shadow, cls.SYMBOL_THICKNESS)
+        cv2.putText(target, text, (text_x, text_y), config.FONT_FACE,
+                    cls.SYMBOL_FONT_SCALE, symbol, cls.SYMBOL_THICKNESS)
 
     def reset(self, **kwargs) -> None:
         super().reset(**kwargs)
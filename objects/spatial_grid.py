@@ -0,0 +1,99 @@
+import math
+from itertools import chain
+from typing import List, Set
+import numpy as np
+
+
+class SpatialGrid:
+    """Uniform grid that buckets ``ObjectStore`` rows by the cell holding their centre.
+
+    The grid covers the play field; objects above, below or beside it are
+    clamped into the border cells, so every row always has a bucket. Buckets
+    are updated incrementally: ``sync`` only touches rows whose cell changed.
+    """
+
+    def __init__(self, width: int, height: int, cell_size: int, capacity: int = 128):
+        self.cell_size = cell_size
+        self._inv_cell = 1.0 / cell_size
+        self.cols = max(1, math.ceil(width / cell_size))
+        self.rows = max(1, math.ceil(height / cell_size))
+        self.buckets: List[Set[int]] = [set() for _ in range(self.cols * self.rows)]
+        self._cells = np.full(max(1, capacity), -1, dtype=np.int64)
+        self.max_radius = 0.0
+
+    def cell_ids(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Return the (clamped) cell id for each centre."""
+        # Clamping before truncation keeps negative coordinates in cell 0
+        cx = np.clip(np.asarray(x) * self._inv_cell, 0, self.cols - 1).astype(np.int64)
+        cy = np.clip(np.asarray(y) * self._inv_cell, 0, self.rows - 1).astype(np.int64)
+        return cy * self.cols + cx
+
+    def insert(self, row: int, x: float, y: float, radius: float) -> None:
+        """Add a newly appended store row."""
+        if row >= len(self._cells):
+            grown = np.full(max(row + 1, 2 * len(self._cells)), -1, dtype=np.int64)
+            grown[:len(self._cells)] = self._cells
+            self._cells = grown
+        cell = int(self.cell_ids(x, y))
+        self._cells[row] = cell
+        self.buckets[cell].add(row)
+        self.max_radius = max(self.max_radius, radius)
+
+    def remove(self, row: int, last: int) -> None:
+        """Mirror an ``ObjectStore`` swap-removal of ``row`` (``last`` moves into it)."""
+        self.buckets[self._cells[row]].discard(row)
+        if row != last:
+            cell = self._cells[last]
+            bucket = self.buckets[cell]
+            bucket.discard(last)
+            bucket.add(row)
+            self._cells[row] = cell
+        self._cells[last] = -1
+
+    def sync(self, x: np.ndarray, y: np.ndarray, radius: np.ndarray) -> None:
+        """Re-bucket the rows whose centre crossed into another cell."""
+        n = len(x)
+        new_cells = self.cell_ids(x, y)
+        current = self._cells[:n]
+        for row in np.flatnonzero(new_cells != current).tolist():
+            self.buckets[current[row]].discard(row)
+            cell = int(new_cells[row])
+            self.buckets[cell].add(row)
+            current[row] = cell
+        self.max_radius = float(radius.max()) if n else 0.0
+
+    def query(self, x0: float, y0: float, x1: float, y1: float) -> np.ndarray:
+        """Return the rows bucketed in any cell overlapping the box, ascending."""
+        rows = self._gather(x0, y0, x1, y1)
+        rows.sort()
+        return rows
+
+    def query_many(self, lows: np.ndarray, highs: np.ndarray) -> np.ndarray:
+        """Return the union of ``query`` over several (x0, y0)/(x1, y1) boxes, ascending."""
+        if len(lows) == 1:
+            return self.query(*lows[0], *highs[0])
+        parts = [self._gather(*lo, *hi) for lo, hi in zip(lows, highs)]
+        return np.unique(np.concatenate(parts))
+
+    def clear(self) -> None:
+        """Empty every bucket."""
+        for bucket in self.buckets:
+            bucket.clear()
+        self._cells.fill(-1)
+        self.max_radius = 0.0
+
+    def _gather(self, x0: float, y0: float, x1: float, y1: float) -> np.ndarray:
+        """Return the rows bucketed in the cells overlapping the box, unordered."""
+        c0, r0 = self._cell_coords(x0, y0)
+        c1, r1 = self._cell_coords(x1, y1)
+        cols = self.cols
+        buckets = [bucket
+                   for r in range(r0 * cols, r1 * cols + 1, cols)
+                   for bucket in self.buckets[r + c0:r + c1 + 1]]
+        count = sum(map(len, buckets))
+        return np.fromiter(chain.from_iterable(buckets), dtype=np.intp, count=count)
+
+    def _cell_coords(self, x: float, y: float):
+        cx = min(max(int(x // self.cell_size), 0), self.cols - 1)
+        cy = min(max(int(y // self.cell_size), 0), self.rows - 1)
+        return cx, cy
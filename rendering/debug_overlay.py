@@ -0,0 +1,87 @@
+from functools import partial
+from typing import Sequence
+import cv2
+import numpy as np
+
+from config.game_config import config
+from input.fist_predictor import PredictedFist
+from input.inference_worker import TrackingResult
+from rendering.renderer import Layer, Renderer
+
+_FONT = cv2.FONT_HERSHEY_SIMPLEX
+_RED = (0, 0, 255)
+_YELLOW = (0, 255, 255)
+_MAGENTA = (255, 0, 255)
+_WHITE = (255, 255, 255)
+
+
+class DebugOverlay:
+    """Hand-tracking diagnostics drawn on the DEBUG layer, above the game.
+
+    Shows each detected hand's box and fist confidence, a crosshair with
+    coordinates and hit radius on every fist, the predicted fists widened by
+    their uncertainty, and the inference latency. Everything is drawn from
+    the tracking result into the output frame, so inference never writes
+    into the frame it runs on.
+
+    Off by default (config.DEBUG_OVERLAY); the game toggles it with
+    config.DEBUG_OVERLAY_KEY.
+    """
+
+    def __init__(self, enabled: bool = config.DEBUG_OVERLAY):
+        self.enabled = enabled
+
+    def toggle(self) -> bool:
+        """Switch the overlay on or off; returns the new state."""
+        self.enabled = not self.enabled
+        return self.enabled
+
+    def submit(self, renderer: Renderer, tracking: TrackingResult,
+               predicted: Sequence[PredictedFist] = ()) -> None:
+        """Submit the overlay's draw commands; does nothing while disabled."""
+        if not self.enabled:
+            return
+        if len(tracking.hands):
+            renderer.submit(Layer.DEBUG, partial(self._draw_hands, hands=tracking.hands))
+        reach = config.FIST_RADIUS + 2
+        for x, y in tracking.raw_positions:
+            # The coordinate label extends to the right of the crosshair
+            renderer.submit(Layer.DEBUG, partial(self._draw_fist, x=x, y=y),
+                            (x - reach, y - reach, 2 * reach + 100, 2 * reach))
+        for fist in predicted:
+            radius = int(config.FIST_RADIUS + fist.uncertainty)
+            x, y = int(fist.x), int(fist.y)
+            renderer.submit(Layer.DEBUG, partial(cv2.circle, center=(x, y), radius=radius,
+                                                 color=_MAGENTA, thickness=1),
+                            (x - radius - 1, y - radius - 1, 2 * radius + 3, 2 * radius + 3))
+        renderer.submit(Layer.DEBUG, partial(self._draw_latency, latency=tracking.latency))
+
+    @staticmethod
+    def _draw_hands(frame: np.ndarray, hands) -> None:
+        height, width = frame.shape[:2]
+        scale = np.array([width, height, width, height], dtype=np.float64)
+        boxes = (hands.boxes * scale).astype(int).tolist()
+        centers = (hands.centers * scale[:2]).astype(int).tolist()
+        for (x0, y0, x1, y1), (x, y), is_fist, confidence in zip(
+                boxes, centers, hands.is_fist.tolist(), hands.confidence.tolist()):
+            cv2.rectangle(frame, (x0, y0), (x1, y1), _YELLOW, 1)
+            if is_fist:
+                cv2.circle(frame, (x, y), 10, _RED, -1)
+                cv2.putText(frame, f'Fist: {confidence:.2f}', (x + 15, y - 10), _FONT, 0.5, _RED, 1)
+            else:
+                cv2.putText(frame, f'Not a fist: {confidence:.2f}', (x, y - 20), _FONT, 0.5, _YELLOW, 1)
+
+    @staticmethod
+    def _draw_fist(frame: np.ndarray, x: int, y: int) -> None:
+        # Crosshairs, centre and position text
+        cv2.line(frame, (x - 20, y), (x + 20, y), _RED, 1)
+        cv2.line(frame, (x, y - 20), (x, y + 20), _RED, 1)
+        cv2.circle(frame, (x, y), 5, _RED, -1)
+        cv2.putText(frame, f'({x}, {y})', (x + 25, y + 5), _FONT, 0.4, _RED, 1)
+        # Hit radius
+        cv2.circle(frame, (x, y), config.FIST_RADIUS, _WHITE, 1)
+
+    @staticmethod
+    def _draw_latency(frame: np.ndarray, latency: float) -> None:
+        cv2.putText(frame, f'Tracking latency: {latency * 1000:.0f} ms',
+                    (10, frame.shape[0] - 10), _FONT, 0.5, _YELLOW, 1)
@@ -0,0 +1,260 @@
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+import cv2
+import numpy as np
+
+from config.game_config import config
+from rendering.sprite_cache import Sprite, coverage_sprite
+
+# ink(color) -> colour to draw with: the real colour for the image pass, 255 for the mask pass
+Ink = Callable[[Tuple[int, int, int]], Any]
+
+
+class HudWidget:
+    """A HUD element whose pixels are cached and re-rasterized only when its key changes.
+
+    Subclasses map the raw value to a render ``key`` (anything that changes
+    the pixels), give the key's bounding box in frame coordinates, and paint
+    it. ``paint`` receives the canvas origin so it can draw with the same
+    frame coordinates it would use on the full frame.
+    """
+
+    def key(self, value) -> Hashable:
+        return value
+
+    def bounds(self, key) -> Optional[Tuple[int, int, int, int]]:
+        """Return (x, y, width, height) of the widget for ``key``, or None if hidden."""
+        raise NotImplementedError("Subclasses must implement bounds()")
+
+    def paint(self, canvas: np.ndarray, origin: Tuple[int, int], key, ink: Ink) -> None:
+        raise NotImplementedError("Subclasses must implement paint()")
+
+    def render(self, key, opacity: float = 1.0) -> Optional[Tuple[Sprite, Tuple[int, int]]]:
+        """Rasterize the widget for ``key`` into a sprite placed at its top-left corner."""
+        box = self.bounds(key)
+        if box is None:
+            return None
+        x, y, width, height = box
+        image = np.zeros((height, width, 3), dtype=np.uint8)
+        mask = np.zeros((height, width), dtype=np.uint8)
+        self.paint(image, (x, y), key, lambda color: color)
+        self.paint(mask, (x, y), key, lambda color: 255)
+
+        # Trim the conservative bounds to the pixels actually painted
+        left, top, width, height = cv2.boundingRect(mask)
+        if width == 0:
+            return None
+        image = image[top:top + height, left:left + width]
+        mask = mask[top:top + height, left:left + width]
+        x, y = x + left, y + top
+
+        return coverage_sprite(image, mask, opacity=opacity), (x, y)
+
+
+def _text_bounds(text: str, origin: Tuple[int, int], scale: float, thickness: int) -> Tuple[int, int, int, int]:
+    """Conservative bounding box of ``cv2.putText`` output with the given baseline origin."""
+    (width, height), baseline = cv2.getTextSize(text, config.FONT_FACE, scale, thickness)
+    margin = thickness + 2
+    x, y = origin
+    return x - margin, y - height - margin, width + 2 * margin, height + baseline + 2 * margin
+
+
+class ScoreWidget(HudWidget):
+    """'Score: N' in the top-left corner."""
+
+    ORIGIN = (10, 30)
+
+    def bounds(self, score):
+        return _text_bounds(f"Score: {score}", self.ORIGIN, config.FONT_SCALE, config.FONT_THICKNESS)
+
+    def paint(self, canvas, origin, score, ink):
+        x, y = self.ORIGIN
+        cv2.putText(canvas, f"Score: {score}", (x - origin[0], y - origin[1]),
+                    config.FONT_FACE, config.FONT_SCALE,
+                    ink(config.COLOR_TEXT), config.FONT_THICKNESS)
+
+
+class HealthBarWidget(HudWidget):
+    """Health bar with percentage text in the top-right corner."""
+
+    WIDTH = 200
+    HEIGHT = 20
+
+    def __init__(self):
+        self.x = config.WINDOW_WIDTH - self.WIDTH - 10
+        self.y = 10
+        self.text_scale = config.FONT_SCALE * 0.7
+
+    def key(self, health: float):
+        # Pixels depend only on the fill width, the colour band and the integer percentage
+        return int((health / 100.0) * self.WIDTH), health < 30, health < 60, int(health)
+
+    def bounds(self, key):
+        text_box = _text_bounds(f"{key[3]}%", self._text_origin(key[3]),
+                                self.text_scale, config.FONT_THICKNESS)
+        x0 = min(self.x, text_box[0])
+        y0 = min(self.y, text_box[1])
+        x1 = max(self.x + self.WIDTH + 1, text_box[0] + text_box[2])
+        y1 = max(self.y + self.HEIGHT + 1, text_box[1] + text_box[3])
+        return x0, y0, x1 - x0, y1 - y0
+
+    def paint(self, canvas, origin, key, ink):
+        health_width, low, medium, percent = key
+        x, y = self.x - origin[0], self.y - origin[1]
+
+        # Background
+        cv2.rectangle(canvas, (x, y), (x + self.WIDTH, y + self.HEIGHT), ink((100, 100, 100)), -1)
+
+        # Current health
+        health_color = (0, 255, 0)  # Green when full
+        if low:
+            health_color = (0, 0, 255)  # Red when low
+        elif medium:
+            health_color = (0, 165, 255)  # Orange when medium
+        cv2.rectangle(canvas, (x, y), (x + health_width, y + self.HEIGHT), ink(health_color), -1)
+
+        # Border
+        cv2.rectangle(canvas, (x, y), (x + self.WIDTH, y + self.HEIGHT), ink((255, 255, 255)), 1)
+
+        # Health text
+        text_x, text_y = self._text_origin(percent)
+        cv2.putText(canvas, f"{percent}%", (text_x - origin[0], text_y - origin[1]),
+                    config.FONT_FACE, self.text_scale, ink((0, 0, 0)), config.FONT_THICKNESS)
+
+    def _text_origin(self, percent: int) -> Tuple[int, int]:
+        text_size = cv2.getTextSize(f"{percent}%", config.FONT_FACE,
+                                    self.text_scale, config.FONT_THICKNESS)[0]
+        return (self.x + (self.WIDTH - text_size[0]) // 2,
+                self.y + (self.HEIGHT + text_size[1]) // 2)
+
+
+class FreezeWidget(HudWidget):
+    """'FREEZE! Ns' centred at the bottom while the freeze power is active."""
+
+    def __init__(self):
+        self.thickness = config.FONT_THICKNESS + 1
+
+    def bounds(self, seconds):
+        if seconds is None:
+            return None
+        text = f"FREEZE! {seconds}s"
+        return _text_bounds(text, self._text_origin(text), config.FONT_SCALE, self.thickness)
+
+    def paint(self, canvas, origin, seconds, ink):
+        text = f"FREEZE! {seconds}s"
+        x, y = self._text_origin(text)
+        cv2.putText(canvas, text, (x - origin[0], y - origin[1]),
+                    config.FONT_FACE, config.FONT_SCALE,
+                    ink((255, 255, 255)), self.thickness)
+
+    def _text_origin(self, text: str) -> Tuple[int, int]:
+        text_size = cv2.getTextSize(text, config.FONT_FACE,
+                                    config.FONT_SCALE, config.FONT_THICKNESS)[0]
+        return (config.WINDOW_WIDTH - text_size[0]) // 2, config.WINDOW_HEIGHT - 30
+
+
+class GameOverWidget(HudWidget):
+    """Static game-over text layer: title, final score and restart instructions.
+
+    Every text has a black shadow, so the image pass composites the shadows
+    exactly and the whole layer is a single alpha-blended sprite.
+    """
+
+    INSTRUCTIONS = "Press 'R' to restart or 'Q' to quit"
+
+    def bounds(self, score):
+        # Painted pixels are trimmed after rasterizing, so the window is a safe bound
+        return 0, 0, config.WINDOW_WIDTH, config.WINDOW_HEIGHT
+
+    def paint(self, canvas, origin, score, ink):
+        # Game Over text with shadow for better visibility
+        text = "GAME OVER"
+        text_scale = config.FONT_SCALE * 3
+        text_thickness = config.FONT_THICKNESS * 2
+        text_size = cv2.getTextSize(text, config.FONT_FACE, text_scale, text_thickness)[0]
+        text_x = (config.WINDOW_WIDTH - text_size[0]) // 2
+        text_y = config.WINDOW_HEIGHT // 3
+        cv2.putText(canvas, text, (text_x + 2, text_y + 2), config.FONT_FACE, text_scale,
+                    ink((0, 0, 0)), text_thickness)
+        cv2.putText(canvas, text, (text_x, text_y), config.FONT_FACE, text_scale,
+                    ink((0, 0, 255)), text_thickness)
+
+        # Score with shadow
+        score_text = f"Final Score: {score}"
+        score_scale = config.FONT_SCALE * 1.5
+        score_size = cv2.getTextSize(score_text, config.FONT_FACE,
+                                     score_scale, config.FONT_THICKNESS)[0]
+        score_x = (config.WINDOW_WIDTH - score_size[0]) // 2
+        score_y = text_y + 100
+        cv2.putText(canvas, score_text, (score_x + 1, score_y + 1), config.FONT_FACE, score_scale,
+                    ink((0, 0, 0)), config.FONT_THICKNESS + 1)
+        cv2.putText(canvas, score_text, (score_x, score_y), config.FONT_FACE, score_scale,
+                    ink((255, 255, 255)), config.FONT_THICKNESS)
+
+        # Restart/quit instructions with shadow
+        x, y = config.WINDOW_WIDTH // 2 - 200, config.WINDOW_HEIGHT // 2 + 100
+        cv2.putText(canvas, self.INSTRUCTIONS, (x + 1, y + 1), cv2.FONT_HERSHEY_SIMPLEX, 0.8,
+                    ink((0, 0, 0)), 3, cv2.LINE_AA)
+        cv2.putText(canvas, self.INSTRUCTIONS, (x, y), cv2.FONT_HERSHEY_SIMPLEX, 0.8,
+                    ink((255, 255, 255)), 2, cv2.LINE_AA)
+
+
+class HudLayer:
+    """Retained-mode HUD: caches each widget's pixels and mask, re-rendering on change.
+
+    Set widget values with ``set``; ``draw`` composites every visible widget's
+    bounding box into the frame and only rasterizes widgets whose render key
+    changed since the last draw. ``opacity`` scales every widget's coverage,
+    so the HUD is blended over the scene without a full-frame overlay.
+    """
+
+    def __init__(self, opacity: float = 1.0, widgets: Optional[Dict[str, HudWidget]] = None):
+        self.opacity = opacity
+        if widgets is None:
+            widgets = {
+                'score': ScoreWidget(),
+                'health': HealthBarWidget(),
+                'freeze': FreezeWidget(),
+            }
+        self.widgets: Dict[str, HudWidget] = widgets
+        self.values: Dict[str, Any] = {}
+        self.renders = 0  # number of widget rasterizations, for profiling
+        self._cache: Dict[str, Tuple[Hashable, Optional[Tuple[Sprite, Tuple[int, int]]]]] = {}
+
+    def set(self, name: str, value) -> None:
+        """Update the value a widget displays."""
+        self.values[name] = value
+
+    def draw(self, frame: np.ndarray) -> None:
+        """Composite all visible widgets into ``frame``."""
+        for sprite, (x, y) in self.sprites():
+            sprite.blit(frame, x, y)
+
+    def sprites(self) -> List[Tuple[Sprite, Tuple[int, int]]]:
+        """Return (sprite, top-left) of every visible widget, re-rendering changed ones."""
+        placed = (self._rendered(name, widget) for name, widget in self.widgets.items())
+        return [item for item in placed if item is not None]
+
+    def regions(self) -> List[Tuple[int, int, int, int]]:
+        """Return (x, y, width, height) of every visible widget as last drawn."""
+        regions = []
+        for _, placed in self._cache.values():
+            if placed is not None:
+                sprite, (x, y) = placed
+                regions.append((x, y, sprite.image.shape[1], sprite.image.shape[0]))
+        return regions
+
+    def invalidate(self) -> None:
+        """Force every widget to re-render on the next draw."""
+        self._cache.clear()
+
+    def _rendered(self, name: str, widget: HudWidget):
+        if name not in self.values:
+            return None
+        key = widget.key(self.values[name])
+        cached = self._cache.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        placed = widget.render(key, self.opacity)
+        self.renders += 1
+        self._cache[name] = (key, placed)
+        return placed
@@ -1,12 +1,57 @@
 import cv2
 import numpy as np
-from typing import Tuple, Optional, List, Dict, Any
+from dataclasses import dataclass
+from enum import IntEnum
+from itertools import groupby
+from operator import attrgetter
+from typing import Callable, Tuple, Optional, List, Dict, Any
 
 from config.game_config import config, GameState
 from objects.base_object import AbstractFallingObject
+from rendering.sprite_cache import CacheStats, Sprite, SpriteCache, coverage_sprite
+
+# (x, y, width, height) in frame pixels
+Box = Tuple[int, int, int, int]
+
+
+class Layer(IntEnum):
+    """Draw order of the command list; lower layers are drawn first."""
+    OBJECTS = 0
+    FISTS = 1
+    HUD = 2
+    OVERLAY = 3
+    DEBUG = 4  # diagnostics, above everything else
+
+
+@dataclass
+class DrawCommand:
+    """A deferred draw call with the screen area it may touch.
+
+    ``bounds`` of None means the whole frame. Blended commands are drawn
+    into a scratch copy and composited back at ``config.UI_OPACITY``.
+    """
+    layer: Layer
+    draw: Callable[[np.ndarray], Any]
+    bounds: Optional[Box] = None
+    blend: bool = False
+
+
+@dataclass
+class RenderStats:
+    """Counters for the last executed command list."""
+    submitted: int = 0
+    culled: int = 0
+    executed: int = 0
+    blend_regions: int = 0
+
 
 class Renderer:
-    """Handles all rendering for the game."""
+    """Handles all rendering for the game.
+    
+    Game code submits draw commands during the frame; ``flush`` sorts them
+    by layer, culls the ones whose bounds are off screen, merges
+    overlapping blend regions and executes everything in one pass.
+    """
     
     def __init__(self):
         """Initialize the renderer."""
@@ -15,8 +60,79 @@ class Renderer:
         self._font_thickness = config.FONT_THICKNESS
         self._font_color = config.COLOR_TEXT
         
-        # Cache for rendered text
-        self._text_cache = {}
+        # LRU cache of rasterized text bitmaps
+        self._text_cache = SpriteCache(capacity=config.TEXT_CACHE_SIZE)
+        
+        # Retained command list, executed and cleared by flush()
+        self._commands: List[DrawCommand] = []
+        self._scratch: Optional[np.ndarray] = None
+        self.stats = RenderStats()
+    
+    def submit(self, layer: Layer, draw: Callable[[np.ndarray], Any],
+               bounds: Optional[Box] = None, blend: bool = False) -> None:
+        """
+        Queue a draw call for the next flush.
+        
+        Args:
+            layer: Draw order layer
+            draw: Callable drawing into the frame it is given (full-frame coordinates)
+            bounds: (x, y, width, height) the call may touch, or None for the whole frame
+            blend: If True, composite the result at config.UI_OPACITY
+        """
+        self._commands.append(DrawCommand(layer, draw, bounds, blend))
+    
+    def submit_sprite(self, layer: Layer, sprite: Sprite, x: int, y: int) -> None:
+        """Queue a sprite blit with its anchor at (x, y)."""
+        height, width = sprite.image.shape[:2]
+        bounds = (x - sprite.anchor[0], y - sprite.anchor[1], width, height)
+        self._commands.append(DrawCommand(layer, lambda frame: sprite.blit(frame, x, y), bounds))
+    
+    def flush(self, frame: np.ndarray) -> None:
+        """Execute and clear the command list, drawing into ``frame`` in place.
+        
+        Within a layer, direct commands run in submission order, followed by
+        the blended commands, one scratch copy and blend per merged region.
+        """
+        height, width = frame.shape[:2]
+        # sorted() is stable, so submission order is kept within a layer
+        commands = sorted(self._commands, key=attrgetter('layer'))
+        self._commands = []
+        stats = RenderStats(submitted=len(commands))
+        
+        for _, group in groupby(commands, key=attrgetter('layer')):
+            blended = []
+            for command in group:
+                box = _clip_box(command.bounds, width, height)
+                if box is None:
+                    stats.culled += 1
+                elif command.blend:
+                    blended.append((box, command))
+                else:
+                    command.draw(frame)
+                    stats.executed += 1
+            for box, members in _merge_regions(blended):
+                self._blend(frame, box, members)
+                stats.executed += len(members)
+                stats.blend_regions += 1
+        self.stats = stats
+    
+    def _blend(self, frame: np.ndarray, box, commands: List[DrawCommand]) -> None:
+        """Draw ``commands`` into a scratch copy of ``box`` and blend it back."""
+        if self._scratch is None or self._scratch.shape != frame.shape:
+            self._scratch = np.empty_like(frame)
+        x0, y0, x1, y1 = box
+        roi = frame[y0:y1, x0:x1]
+        scratch_roi = self._scratch[y0:y1, x0:x1]
+        np.copyto(scratch_roi, roi)
+        for command in commands:
+            command.draw(self._scratch)
+        alpha = config.UI_OPACITY
+        cv2.addWeighted(scratch_roi, alpha, roi, 1 - alpha, 0, dst=roi)
+    
+    @property
+    def text_cache_stats(self) -> CacheStats:
+        """Hit/miss/eviction counters of the text cache, for sizing it."""
+        return self._text_cache.stats
     
     def draw_text(self, frame, text: str, position: Tuple[int, int], 
                  color: Optional[Tuple[int, int, int]] = None,
@@ -24,7 +140,8 @@ class Renderer:
                  thickness: Optional[int] = None,
                  centered: bool = False,
                  outline: bool = False,
-                 outline_color: Tuple[int, int, int] = (0, 0, 0)):
+                 outline_color: Tuple[int, int, int] = (0, 0, 0),
+                 outline_width: Optional[int] = None):
         """
         Draw text on the frame.
         
@@ -38,6 +155,7 @@ class Renderer:
             centered: If True, position is the center of the text
             outline: If True, draw an outline around the text
             outline_color: Color of the outline (BGR)
+            outline_width: Outline width in pixels (defaults to config.TEXT_OUTLINE_WIDTH)
         """
         if color is None:
             color = self._font_color
@@ -45,21 +163,51 @@ class Renderer:
             font_scale = self._font_scale
         if thickness is None:
             thickness = self._font_thickness
-        
-        x, y = position
-        
-        # Draw outline if requested
-        if outline:
-            for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1),
-                          (-1, 0), (1, 0), (0, -1), (0, 1)]:
-                cv2.putText(frame, text, (x + dx, y + dy), 
-                          self._font, font_scale, 
-                          outline_color, thickness + 1)
-        
-        # Draw main text
-        cv2.putText(frame, text, (x, y), 
-                   self._font, font_scale, 
-                   color, thickness)
+        if outline_width is None:
+            outline_width = config.TEXT_OUTLINE_WIDTH
+        
+        key = (text, self._font, font_scale, thickness, color,
+               (outline_color, outline_width) if outline else None)
+        sprite = self._text_cache.get(key, self._render_text, text, font_scale,
+                                      thickness, color, outline, outline_color, outline_width)
+        sprite.blit(frame, *position)
+    
+    def _render_text(self, text: str, font_scale: float, thickness: int,
+                     color: Tuple[int, int, int], outline: bool,
+                     outline_color: Tuple[int, int, int], outline_width: int) -> Sprite:
+        """Rasterize text (and its outline) into a sprite anchored at the text origin.
+        
+        The outline is the glyph mask dilated by ``outline_width`` pixels, so
+        the string is rasterized once for the outline instead of at eight
+        offsets.
+        """
+        (text_width, text_height), baseline = cv2.getTextSize(
+            text, self._font, font_scale, thickness + 1)
+        margin = thickness + 2 + (outline_width if outline else 0)
+        x, y = margin, margin + text_height
+        size = (text_height + baseline + 2 * margin, text_width + 2 * margin)
+        
+        if not outline:
+            image = np.zeros(size + (3,), dtype=np.uint8)
+            coverage = np.zeros(size, dtype=np.uint8)
+            cv2.putText(image, text, (x, y), self._font, font_scale, color, thickness)
+            cv2.putText(coverage, text, (x, y), self._font, font_scale, 255, thickness)
+            return coverage_sprite(image, coverage, (x, y))
+        
+        # Outline coverage: the one-step-bolder glyph mask, dilated
+        coverage = np.zeros(size, dtype=np.uint8)
+        cv2.putText(coverage, text, (x, y), self._font, font_scale, 255, thickness + 1)
+        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (2 * outline_width + 1,) * 2)
+        cv2.dilate(coverage, kernel, dst=coverage)
+        
+        # Main text lies inside the outline, so it is drawn straight over the outline colour
+        image = np.empty(size + (3,), dtype=np.uint8)
+        # A filled rectangle is much faster than numpy broadcasting a colour tuple
+        cv2.rectangle(image, (0, 0), (size[1], size[0]), outline_color, -1)
+        cv2.putText(image, text, (x, y), self._font, font_scale, color, thickness)
+        if np.all((coverage == 0) | (coverage == 255)):
+            return Sprite(image, coverage.astype(bool), (x, y))
+        return Sprite(image, coverage, (x, y))
     
     def draw_centered_text(self, frame, text: str, y_offset: int = 0, 
                          font_scale: float = 1.0, **kwargs):
@@ -85,211 +233,35 @@ class Renderer:
         self.draw_text(frame, text, (x, y), 
                       font_scale=font_scale, 
                       centered=True, **kwargs)
-    
-    def draw_health_bar(self, frame, health: float, 
-                       position: Tuple[int, int], 
-                       size: Tuple[int, int] = (200, 20),
-                       border_thickness: int = 2):
-        """
-        Draw a health bar.
-        
-        Args:
-            frame: Frame to draw on
-            health: Health value (0-100)
-            position: (x, y) position of the top-left corner
-            size: (width, height) of the health bar
-            border_thickness: Thickness of the border
-        """
-        x, y = position
-        width, height = size
-        
-        # Clamp health between 0 and 100
-        health = max(0, min(100, health))
-        
-        # Calculate fill width
-        fill_width = int(width * (health / 100))
-        
-        # Draw background
-        cv2.rectangle(frame, 
-                     (x, y), 
-                     (x + width, y + height), 
-                     (50, 50, 50), -1)
-        
-        # Draw fill
-        if health > 0:
-            # Determine color based on health
-            if health > 60:
-                color = (0, 200, 0)  # Green
-            elif health > 30:
-                color = (0, 165, 255)  # Orange
-            else:
-                color = (0, 0, 200)  # Red
-                
-            cv2.rectangle(frame, 
-                         (x, y), 
-                         (x + fill_width, y + height), 
-                         color, -1)
-        
-        # Draw border
-        cv2.rectangle(frame, 
-                     (x, y), 
-                     (x + width, y + height), 
-                     (200, 200, 200), border_thickness)
-        
-        # Draw health text
-        health_text = f"{int(health)}%"
-        text_size = cv2.getTextSize(health_text, self._font, 
-                                  0.7, self._font_thickness)[0]
-        
-        text_x = x + (width - text_size[0]) // 2
-        text_y = y + (height + text_size[1]) // 2
-        
-        self.draw_text(frame, health_text, (text_x, text_y), 
-                      font_scale=0.7, 
-                      color=(255, 255, 255))
-    
-    def draw_score(self, frame, score: int, position: Tuple[int, int] = (10, 30)):
-        """
-        Draw the score on the frame.
-        
-        Args:
-            frame: Frame to draw on
-            score: Current score
-            position: (x, y) position of the top-left corner
-        """
-        score_text = f"Score: {score}"
-        self.draw_text(frame, score_text, position, 
-                      color=config.COLOR_TEXT,
-                      font_scale=1.0,
-                      outline=True)
-    
-    def draw_timer(self, frame, time_left: float, position: Tuple[int, int], 
-                  color: Optional[Tuple[int, int, int]] = None):
-        """
-        Draw a timer on the frame.
-        
-        Args:
-            frame: Frame to draw on
-            time_left: Time left in seconds
-            position: (x, y) position of the top-left corner
-            color: Text color (BGR)
-        """
-        if color is None:
-            color = config.COLOR_TEXT
-            
-        # Format time as MM:SS
-        minutes = int(time_left) // 60
-        seconds = int(time_left) % 60
-        timer_text = f"{minutes:02d}:{seconds:02d}"
-        
-        self.draw_text(frame, timer_text, position, 
-                      color=color,
-                      font_scale=1.0,
-                      outline=True)
-    
-    def draw_progress_bar(self, frame, progress: float, 
-                         position: Tuple[int, int], 
-                         size: Tuple[int, int],
-                         color: Tuple[int, int, int],
-                         bg_color: Tuple[int, int, int] = (50, 50, 50),
-                         border: int = 2):
-        """
-        Draw a progress bar.
-        
-        Args:
-            frame: Frame to draw on
-            progress: Progress value (0.0 to 1.0)
-            position: (x, y) position of the top-left corner
-            size: (width, height) of the progress bar
-            color: Fill color (BGR)
-            bg_color: Background color (BGR)
-            border: Border thickness
-        """
-        x, y = position
-        width, height = size
-        
-        # Clamp progress between 0 and 1
-        progress = max(0.0, min(1.0, progress))
-        
-        # Draw background
-        cv2.rectangle(frame, 
-                     (x, y), 
-                     (x + width, y + height), 
-                     bg_color, -1)
-        
-        # Draw progress
-        if progress > 0:
-            fill_width = int(width * progress)
-            cv2.rectangle(frame, 
-                         (x, y), 
-                         (x + fill_width, y + height), 
-                         color, -1)
-        
-        # Draw border
-        if border > 0:
-            cv2.rectangle(frame, 
-                         (x, y), 
-                         (x + width, y + height), 
-                         (200, 200, 200), border)
-    
-    def draw_button(self, frame, text: str, position: Tuple[int, int], 
-                   size: Tuple[int, int],
-                   color: Tuple[int, int, int] = (100, 100, 200),
-                   text_color: Tuple[int, int, int] = (255, 255, 255),
-                   hover: bool = False,
-                   pressed: bool = False):
-        """
-        Draw a button.
-        
-        Args:
-            frame: Frame to draw on
-            text: Button text
-            position: (x, y) position of the top-left corner
-            size: (width, height) of the button
-            color: Button color (BGR)
-            text_color: Text color (BGR)
-            hover: Whether the button is being hovered
-            pressed: Whether the button is being pressed
-        """
-        x, y = position
-        width, height = size
-        
-        # Adjust color if hovered or pressed
-        if pressed:
-            color = tuple(max(0, c - 40) for c in color)
-        elif hover:
-            color = tuple(min(255, c + 30) for c in color)
-        
-        # Draw button background
-        cv2.rectangle(frame, 
-                     (x, y), 
-                     (x + width, y + height), 
-                     color, -1)
-        
-        # Draw border
-        border_color = (min(255, color[0] + 60), 
-                       min(255, color[1] + 60), 
-                       min(255, color[2] + 60))
-        cv2.rectangle(frame, 
-                     (x, y), 
-                     (x + width, y + height), 
-                     border_color, 2)
-        
-        # Draw text
-        text_size = cv2.getTextSize(text, self._font, 
-                                  0.8, self._font_thickness)[0]
-        text_x = x + (width - text_size[0]) // 2
-        text_y = y + (height + text_size[1]) // 2
-        
-        # Text shadow
-        cv2.putText(frame, text, (text_x + 1, text_y + 1), 
-                   self._font, 0.8, 
-                   (0, 0, 0), self._font_thickness)
-        
-        # Main text
-        cv2.putText(frame, text, (text_x, text_y), 
-                   self._font, 0.8, 
-                   text_color, self._font_thickness)
-        
-        # Return button rect for click detection
-        return (x, y, width, height)
+
+
+def _clip_box(bounds: Optional[Box], width: int, height: int):
+    """Return bounds clipped to the frame as (x0, y0, x1, y1), or None if off screen."""
+    if bounds is None:
+        return 0, 0, width, height
+    x, y, w, h = bounds
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + w, width), min(y + h, height)
+    if x0 >= x1 or y0 >= y1:
+        return None
+    return x0, y0, x1, y1
+
+
+def _merge_regions(items):
+    """Group (box, command) pairs into disjoint regions, merging overlapping boxes."""
+    regions = []
+    for box, command in items:
+        members = [command]
+        merged = True
+        while merged:
+            merged = False
+            for i, (other, other_members) in enumerate(regions):
+                if box[0] < other[2] and other[0] < box[2] and box[1] < other[3] and other[1] < box[3]:
+                    box = (min(box[0], other[0]), min(box[1], other[1]),
+                           max(box[2], other[2]), max(box[3], other[3]))
+                    members = other_members + members
+                    del regions[i]
+                    merged = True
+                    break
+        regions.append((box, members))
+    return regions
@@ -0,0 +1,138 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable, Optional, Tuple
+import cv2
+import numpy as np
+
+
+@dataclass
+class Sprite:
+    """A pre-rasterized image with its coverage mask.
+
+    ``mask`` is either boolean (hard edges, blitted with a single masked copy)
+    or uint8 alpha (0-255, alpha-blended). ``anchor`` is the pixel of the
+    sprite that lands on the blit position.
+    """
+    image: np.ndarray
+    mask: np.ndarray
+    anchor: Tuple[int, int] = (0, 0)
+
+    def __post_init__(self):
+        # Blend terms are derived once per sprite rather than per blit:
+        # out = roi * (255 - alpha) / 255 + image * alpha / 255
+        self._copy_mask = None
+        if self.mask.dtype == np.bool_:
+            self._copy_mask = self.mask.view(np.uint8)
+        else:
+            alpha = cv2.merge([self.mask] * self.image.shape[2])
+            self._premultiplied = cv2.multiply(self.image, alpha, scale=1.0 / 255.0)
+            self._inverse = 255 - alpha
+
+    def blit(self, frame: np.ndarray, x: int, y: int) -> None:
+        """Composite the sprite into ``frame`` with its anchor at (x, y)."""
+        x -= self.anchor[0]
+        y -= self.anchor[1]
+        h, w = self.image.shape[:2]
+        if x >= 0 and y >= 0 and x + w <= frame.shape[1] and y + h <= frame.shape[0]:
+            # Fully on screen: no clipping needed
+            roi, src = frame[y:y + h, x:x + w], (slice(None), slice(None))
+        else:
+            region = _clip(frame, self.image, x, y)
+            if region is None:
+                return
+            roi, src = region
+        if self._copy_mask is not None:
+            cv2.copyTo(self.image[src], self._copy_mask[src], roi)
+        else:
+            cv2.multiply(roi, self._inverse[src], dst=roi, scale=1.0 / 255.0)
+            cv2.add(roi, self._premultiplied[src], dst=roi)
+
+
+def blit(frame: np.ndarray, image: np.ndarray, mask: np.ndarray, x: int, y: int) -> None:
+    """Composite ``image`` into ``frame`` with its top-left corner at (x, y).
+
+    A boolean ``mask`` selects pixels to copy; a uint8 ``mask`` is alpha. The
+    region is clipped to the frame, so images may be partially or entirely
+    off screen.
+    """
+    Sprite(image, mask).blit(frame, x, y)
+
+
+def coverage_sprite(image: np.ndarray, coverage: np.ndarray,
+                    anchor: Tuple[int, int] = (0, 0), opacity: float = 1.0) -> Sprite:
+    """Build a sprite from an image painted on black and its uint8 coverage.
+
+    Anti-aliased drawing leaves edge pixels premultiplied by their coverage;
+    those are divided back out so the alpha blend reproduces direct drawing.
+    Fully opaque, hard-edged coverage becomes a boolean mask (masked copy).
+    ``image`` is modified in place.
+    """
+    hard_edges = np.all((coverage == 0) | (coverage == 255))
+    if not hard_edges:
+        covered = coverage > 0
+        alpha = coverage[covered].astype(np.float32)[:, None] * (1.0 / 255.0)
+        image[covered] = np.clip(image[covered] / alpha + 0.5, 0, 255).astype(np.uint8)
+    if opacity < 1.0:
+        return Sprite(image, (coverage * opacity + 0.5).astype(np.uint8), anchor)
+    if hard_edges:
+        return Sprite(image, coverage.astype(bool), anchor)
+    return Sprite(image, coverage, anchor)
+
+
+def _clip(frame: np.ndarray, image: np.ndarray, x: int, y: int):
+    """Return (frame ROI, image slice) for an image placed at (x, y), or None if off screen."""
+    h, w = image.shape[:2]
+    frame_h, frame_w = frame.shape[:2]
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + w, frame_w), min(y + h, frame_h)
+    if x0 >= x1 or y0 >= y1:
+        return None
+    return frame[y0:y1, x0:x1], (slice(y0 - y, y1 - y), slice(x0 - x, x1 - x))
+
+
+@dataclass
+class CacheStats:
+    """Counters for a sprite cache."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class SpriteCache:
+    """LRU cache of rasterized sprites keyed by their look (size, colour, ...)."""
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = capacity
+        self.stats = CacheStats()
+        self._sprites: "OrderedDict[Hashable, Sprite]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._sprites
+
+    def get(self, key: Hashable, render: Callable[..., Sprite], *args) -> Sprite:
+        """Return the sprite for ``key``, rasterizing it with ``render(*args)`` on a miss."""
+        sprite: Optional[Sprite] = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            self.stats.hits += 1
+            return sprite
+
+        self.stats.misses += 1
+        sprite = render(*args)
+        self._sprites[key] = sprite
+        if len(self._sprites) > self.capacity:
+            self._sprites.popitem(last=False)
+            self.stats.evictions += 1
+        return sprite
+
+    def clear(self) -> None:
+        """Drop all cached sprites."""
+        self._sprites.clear()
@@ -73,5 +73,41 @@ class TestBubble(unittest.TestCase):
         self.bubble.y = 300  # On-screen
         self.assertFalse(self.bubble.is_off_screen(600))
 
+    def test_objects_are_slotted(self):
+        """Test that bubbles carry no per-instance __dict__."""
+        self.assertFalse(hasattr(self.bubble, '__dict__'))
+        with self.assertRaises(AttributeError):
+            self.bubble.unknown_attribute = 1
+
+    def test_reset_recomputes_draw_geometry(self):
+        """Test that the draw radius follows the radius set at reset."""
+        self.assertEqual(self.bubble.draw_radius, self.radius)
+        self.bubble.reset(radius=50.7)
+        self.assertEqual(self.bubble.draw_radius, 50)
+
+    def test_sprite_matches_direct_drawing(self):
+        """Test that the cached sprite reproduces the three-circle drawing."""
+        self.bubble.draw(self.test_img)
+
+        expected = np.zeros_like(self.test_img)
+        center = (self.x, self.y)
+        cv2.circle(expected, center, self.radius, self.bubble.color, -1)
+        cv2.circle(expected, (int(self.x - self.radius * 0.4), int(self.y - self.radius * 0.4)),
+                   int(self.radius * 0.3), (200, 200, 200), -1)
+        cv2.circle(expected, center, self.radius, (255, 255, 255), 1)
+
+        np.testing.assert_array_equal(self.test_img, expected)
+
+    def test_draw_clips_at_frame_edges(self):
+        """Test that bubbles partly off screen are clipped, not dropped or wrapped."""
+        self.bubble.x, self.bubble.y = 5, self.height - 5
+        self.bubble.draw(self.test_img)
+        self.assertTrue(self.test_img[self.height - 1, 0].any())
+        self.assertFalse(self.test_img[0, :].any())
+        self.assertFalse(self.test_img[:, -1].any())
+
+        self.bubble.y = -200
+        self.bubble.draw(self.test_img)  # entirely off screen
+
 if __name__ == '__main__':
     unittest.main()
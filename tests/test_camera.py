@@ -0,0 +1,152 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+import cv2
+import numpy as np
+
+from input.camera import CameraCapture, CaptureSettings
+
+
+def _write_video(path, frames=10, size=(64, 48), fps=30.0):
+    """Write a video whose frame i is uniformly grey at level 20 * i."""
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'MJPG'), fps, size)
+    for i in range(frames):
+        writer.write(np.full((size[1], size[0], 3), 20 * i, dtype=np.uint8))
+    writer.release()
+
+
+class TestCameraCapture(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'clip.avi')
+        _write_video(self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _level(self, frame):
+        return round(float(frame.mean()) / 20)
+
+    def test_reports_file_settings(self):
+        """Test that the negotiated settings describe the video file."""
+        camera = CameraCapture(self.path)
+        try:
+            self.assertTrue(camera.is_opened())
+            self.assertTrue(camera.is_file)
+            self.assertEqual((camera.settings.width, camera.settings.height), (64, 48))
+            self.assertAlmostEqual(camera.settings.fps, 30.0)
+            self.assertEqual(camera.settings.fourcc, 'MJPG')
+            self.assertIn('64x48', str(camera.settings))
+        finally:
+            camera.release()
+
+    def test_paced_file_delivers_every_frame_in_order(self):
+        """Test that a consumer keeping up with a paced file sees every frame, timestamped."""
+        camera = CameraCapture(self.path)
+        camera.start()
+        levels, stamps = [], []
+        try:
+            while True:
+                ok, frame, captured_at = camera.read(timeout=2.0)
+                if not ok:
+                    break
+                levels.append(self._level(frame))
+                stamps.append(captured_at)
+        finally:
+            camera.release()
+        self.assertEqual(levels, list(range(10)))
+        self.assertEqual(stamps, sorted(stamps))
+        self.assertEqual(camera.dropped, 0)
+
+    def test_slow_consumer_gets_newest_frame(self):
+        """Test that frames not taken in time are dropped in favour of the newest."""
+        camera = CameraCapture(self.path, pace=False)
+        camera.start()
+        try:
+            deadline = time.time() + 2.0
+            while camera.grabbed < 10 and time.time() < deadline:
+                time.sleep(0.005)
+            ok, frame, _ = camera.read(timeout=1.0)
+            self.assertTrue(ok)
+            self.assertEqual(self._level(frame), 9)
+            # The source has ended and its last frame was read
+            self.assertFalse(camera.read(timeout=1.0)[0])
+            self.assertTrue(camera.finished)
+        finally:
+            camera.release()
+        self.assertEqual(camera.dropped, 9)
+
+    def test_reuses_frame_buffers(self):
+        """Test that frames are read into a fixed set of buffers."""
+        camera = CameraCapture(self.path, pace=False)
+        camera.start()
+        buffers = set()
+        try:
+            while True:
+                ok, frame, _ = camera.read(timeout=2.0)
+                if not ok:
+                    break
+                buffers.add(id(frame))
+        finally:
+            camera.release()
+        self.assertLessEqual(len(buffers), 3)
+
+    def test_timeout_is_not_the_end(self):
+        """Test that a read timing out before a frame arrives does not mark the source finished."""
+        camera = CameraCapture(self.path)
+        try:
+            self.assertEqual(camera.read(timeout=0.01), (False, None, 0.0))
+            self.assertFalse(camera.finished)
+        finally:
+            camera.release()
+        self.assertTrue(camera.finished)
+
+    def test_missing_file_is_not_opened(self):
+        """Test that an unreadable source reports it could not be opened."""
+        camera = CameraCapture(os.path.join(self.tmp.name, 'missing.avi'))
+        self.assertFalse(camera.is_opened())
+        self.assertIsNone(camera.settings)
+        self.assertEqual(camera.read(timeout=0.01), (False, None, 0.0))
+        self.assertTrue(camera.finished)
+        camera.release()
+
+    @patch('input.camera.cv2.VideoCapture')
+    def test_device_requests_low_latency_settings(self, mock_capture):
+        """Test that devices are asked for a 1-frame buffer, MJPG and the frame rate."""
+        cap = mock_capture.return_value
+        cap.isOpened.return_value = True
+        cap.get.side_effect = lambda prop: {cv2.CAP_PROP_FRAME_WIDTH: 640,
+                                            cv2.CAP_PROP_FRAME_HEIGHT: 480,
+                                            cv2.CAP_PROP_FPS: 30.0,
+                                            cv2.CAP_PROP_FOURCC: cv2.VideoWriter_fourcc(*'MJPG'),
+                                            cv2.CAP_PROP_BUFFERSIZE: 1}[prop]
+        camera = CameraCapture('0', width=1280, height=720, fps=60)
+
+        self.assertEqual(camera.source, 0)
+        self.assertFalse(camera.is_file)
+        requested = {args[0]: args[1] for args, _ in cap.set.call_args_list}
+        self.assertEqual(requested[cv2.CAP_PROP_BUFFERSIZE], 1)
+        self.assertEqual(requested[cv2.CAP_PROP_FOURCC], cv2.VideoWriter_fourcc(*'MJPG'))
+        self.assertEqual(requested[cv2.CAP_PROP_FPS], 60)
+        self.assertEqual(requested[cv2.CAP_PROP_FRAME_WIDTH], 1280)
+        # The report shows what the device accepted, not what was asked for
+        self.assertEqual(camera.settings, CaptureSettings(640, 480, 30.0, 'MJPG', 1))
+
+    @patch('input.camera.cv2.VideoCapture')
+    def test_low_latency_can_be_disabled(self, mock_capture):
+        """Test that only resolution and frame rate are requested without low latency."""
+        cap = mock_capture.return_value
+        cap.isOpened.return_value = True
+        cap.get.return_value = 0.0
+        camera = CameraCapture(0, low_latency=False)
+
+        requested = [args[0] for args, _ in cap.set.call_args_list]
+        self.assertNotIn(cv2.CAP_PROP_BUFFERSIZE, requested)
+        self.assertNotIn(cv2.CAP_PROP_FOURCC, requested)
+        self.assertIsNone(camera.settings.buffer_size)
+
+
+if __name__ == '__main__':
+    unittest.main()
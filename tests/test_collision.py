@@ -2,6 +2,7 @@ import unittest
 import numpy as np
 from objects.bubble import Bubble
 from objects.power import Power
+from objects.object_manager import ObjectManager
 from config.game_config import config
 
 class TestCollision(unittest.TestCase):
@@ -44,5 +45,74 @@ class TestCollision(unittest.TestCase):
         edge_pos = (self.bubble.x + self.bubble.radius, self.bubble.y)
         self.assertTrue(self.bubble.is_hit(edge_pos))
 
+    def test_fist_radius_extends_reach(self):
+        """Test that the optional fist radius widens the scalar hit test."""
+        fist_pos = (self.bubble.x + self.bubble.radius + 10, self.bubble.y)
+        self.assertFalse(self.bubble.is_hit(fist_pos))
+        self.assertTrue(self.bubble.is_hit(fist_pos, fist_radius=10))
+
+
+class TestBatchedCollision(unittest.TestCase):
+    def setUp(self):
+        self.manager = ObjectManager()
+        self.bubble = self.manager.spawn_bubble()
+        self.bubble.reset(x=100, y=100, radius=30)
+        self.power = self.manager.spawn_power()
+        self.power.reset(x=400, y=300)
+
+    def test_check_hits_returns_touched_rows(self):
+        """Test that a single fist hits only the object it touches."""
+        hits = self.manager.check_hits(np.array([[105, 105]]))
+        self.assertEqual(hits.tolist(), [self.bubble._slot])
+
+    def test_check_hits_includes_fist_radius(self):
+        """Test that the fist radius is added to the object radius."""
+        fist = np.array([[100 + 30 + config.FIST_RADIUS, 100]])
+        self.assertEqual(self.manager.check_hits(fist).tolist(), [self.bubble._slot])
+        self.assertEqual(self.manager.check_hits(fist, fist_radius=0).size, 0)
+
+    def test_check_hits_with_multiple_fists(self):
+        """Test that each object is reported once even when several fists touch it."""
+        fists = np.array([[100, 100], [102, 98], [400, 300]])
+        hits = self.manager.check_hits(fists)
+        self.assertEqual(sorted(hits.tolist()), sorted([self.bubble._slot, self.power._slot]))
+
+    def test_check_hits_matches_scalar_path(self):
+        """Test that the batched kernel agrees with is_hit for random layouts."""
+        rng = np.random.default_rng(0)
+        for _ in range(50):
+            self.manager.spawn_bubble().reset(x=rng.uniform(0, 800), y=rng.uniform(0, 600))
+        fists = rng.uniform((0, 0), (800, 600), size=(2, 2))
+
+        hits = set(self.manager.check_hits(fists).tolist())
+        expected = {row for row, obj in enumerate(self.manager.objects)
+                    if any(obj.is_hit(f, config.FIST_RADIUS) for f in fists)}
+        self.assertEqual(hits, expected)
+
+    def test_check_hits_ignores_inactive_objects(self):
+        """Test that deactivated objects cannot be hit."""
+        self.bubble.deactivate()
+        self.assertEqual(self.manager.check_hits(np.array([[100, 100]])).size, 0)
+
+    def test_check_hits_with_per_fist_radius(self):
+        """Test that each fist can reach out by its own radius."""
+        fists = np.array([[100 + 30 + 15, 100], [400 + self.power.radius + 15, 300]])
+        hits = self.manager.check_hits(fists, fist_radius=np.array([15.0, 5.0]))
+        self.assertEqual(hits.tolist(), [self.bubble._slot])
+
+    def test_per_fist_radius_with_spatial_grid(self):
+        """Test that the grid query widens by each fist's radius."""
+        manager = ObjectManager(cell_size=50)
+        manager.spawn_bubble().reset(x=100, y=100, radius=30)
+        manager.refresh_spatial_index()
+        fists = np.array([[100 + 30 + 80, 100], [500, 500]])
+        self.assertEqual(manager.check_hits(fists, fist_radius=np.array([80.0, 0.0])).size, 1)
+        self.assertEqual(manager.check_hits(fists, fist_radius=np.array([70.0, 0.0])).size, 0)
+
+    def test_check_hits_without_fists(self):
+        """Test that an empty fist array yields no hits."""
+        self.assertEqual(self.manager.check_hits(np.empty((0, 2))).size, 0)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+import numpy as np
+
+from input.fist_predictor import PredictedFist
+from input.hand_detectors import HandDetections
+from input.inference_worker import TrackingResult
+from rendering.debug_overlay import DebugOverlay
+from rendering.renderer import Layer, Renderer
+
+
+def _tracking():
+    landmarks = np.zeros((1, 21, 3))
+    landmarks[0, :, 0] = np.linspace(0.4, 0.6, 21)
+    landmarks[0, :, 1] = np.linspace(0.4, 0.6, 21)
+    hands = HandDetections.from_landmarks(landmarks, ['Right'])
+    return TrackingResult(fist_positions=[(100.0, 80.0)], raw_positions=[(100, 80)],
+                          hands=hands, captured_at=1.0, completed_at=1.03)
+
+
+class TestDebugOverlay(unittest.TestCase):
+    def setUp(self):
+        self.renderer = Renderer()
+        self.frame = np.zeros((240, 320, 3), dtype=np.uint8)
+
+    def test_disabled_by_default(self):
+        """Test that the overlay submits nothing until it is switched on."""
+        overlay = DebugOverlay()
+        overlay.submit(self.renderer, _tracking(), [PredictedFist(100.0, 80.0, 4.0)])
+        self.renderer.flush(self.frame)
+        self.assertEqual(self.renderer.stats.submitted, 0)
+        self.assertFalse(self.frame.any())
+
+    def test_toggle(self):
+        """Test that toggling flips the overlay on and off."""
+        overlay = DebugOverlay(enabled=False)
+        self.assertTrue(overlay.toggle())
+        self.assertFalse(overlay.toggle())
+
+    def test_draws_on_debug_layer(self):
+        """Test that an enabled overlay draws hands, fists, predictions and latency."""
+        overlay = DebugOverlay(enabled=True)
+        overlay.submit(self.renderer, _tracking(), [PredictedFist(200.0, 120.0, 10.0)])
+        commands = list(self.renderer._commands)
+        self.assertTrue(all(command.layer == Layer.DEBUG for command in commands))
+        self.renderer.flush(self.frame)
+        self.assertEqual(self.renderer.stats.executed, 4)
+        # Hand box, fist crosshair and the widened predicted hit circle
+        self.assertTrue(self.frame[int(0.4 * 240), 128:192].any())
+        self.assertTrue(self.frame[80, 80:120].any())
+        self.assertTrue(self.frame[120, 168:171].any())
+
+    def test_drawn_last(self):
+        """Test that the debug layer is drawn over the game's overlays."""
+        self.assertEqual(max(Layer), Layer.DEBUG)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -37,5 +37,18 @@ class TestEventDispatch(unittest.TestCase):
 
         self.mock_observer.handle.assert_called_once_with(event)
 
+    def test_dispatch_pending_runs_inline(self):
+        """Test that queued events, and events they cause, are dispatched on the caller's thread."""
+        follow_up = GameEvent(EventType.GAME_OVER)
+        chained = Mock()
+        chained.handle.side_effect = lambda event: self.event_manager.post(follow_up)
+        self.event_manager.register_observer(EventType.BUBBLE_MISSED, chained)
+        self.event_manager.register_observer(EventType.GAME_OVER, self.mock_observer)
+        self.event_manager.post(GameEvent(EventType.BUBBLE_MISSED))
+
+        self.assertEqual(self.event_manager.dispatch_pending(), 2)
+        self.mock_observer.handle.assert_called_once_with(follow_up)
+        self.assertEqual(self.event_manager.dispatch_pending(), 0)
+
 if __name__ == '__main__':
     unittest.main()
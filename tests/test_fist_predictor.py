@@ -0,0 +1,87 @@
+import unittest
+from unittest.mock import patch
+
+from config.game_config import config
+from input.fist_predictor import FistPredictor
+
+
+class TestFistPredictor(unittest.TestCase):
+    def setUp(self):
+        self.predictor = FistPredictor(alpha=1.0, beta=1.0, match_distance=100.0, horizon=0.1)
+
+    def test_extrapolates_at_estimated_velocity(self):
+        """Test that a fist moving steadily is predicted ahead of its last detection."""
+        self.predictor.update([(100.0, 100.0)], timestamp=0.0)
+        self.predictor.update([(110.0, 100.0)], timestamp=0.02)
+        fist, = self.predictor.predict(0.04)
+        self.assertAlmostEqual(fist.x, 120.0)
+        self.assertAlmostEqual(fist.y, 100.0)
+
+    def test_new_track_is_stationary(self):
+        """Test that a first detection is reported where it was seen."""
+        self.predictor.update([(50.0, 60.0)], timestamp=1.0)
+        fist, = self.predictor.predict(1.05)
+        self.assertEqual((fist.x, fist.y), (50.0, 60.0))
+
+    def test_uncertainty_grows_with_time(self):
+        """Test that older detections widen the uncertainty radius."""
+        self.predictor.update([(0.0, 0.0)], timestamp=0.0)
+        fresh, = self.predictor.predict(0.0)
+        stale, = self.predictor.predict(0.05)
+        self.assertEqual(fresh.uncertainty, config.FIST_MEASUREMENT_NOISE)
+        self.assertGreater(stale.uncertainty, fresh.uncertainty)
+
+    def test_prediction_stops_at_horizon(self):
+        """Test that a lost hand is not extrapolated indefinitely."""
+        self.predictor.update([(0.0, 0.0)], timestamp=0.0)
+        self.predictor.update([(10.0, 0.0)], timestamp=0.01)
+        at_horizon, = self.predictor.predict(0.11)
+        later, = self.predictor.predict(5.0)
+        self.assertEqual((later.x, later.uncertainty), (at_horizon.x, at_horizon.uncertainty))
+
+    def test_hands_are_matched_by_proximity(self):
+        """Test that two hands keep their own velocities when listed in another order."""
+        self.predictor.update([(100.0, 100.0), (500.0, 100.0)], timestamp=0.0)
+        self.predictor.update([(490.0, 100.0), (110.0, 100.0)], timestamp=0.01)
+        xs = sorted(fist.x for fist in self.predictor.predict(0.02))
+        self.assertAlmostEqual(xs[0], 120.0)
+        self.assertAlmostEqual(xs[1], 480.0)
+
+    def test_far_detection_starts_new_track(self):
+        """Test that a jump beyond the match distance is not read as velocity."""
+        self.predictor.update([(100.0, 100.0)], timestamp=0.0)
+        self.predictor.update([(400.0, 100.0)], timestamp=0.01)
+        fist, = self.predictor.predict(0.02)
+        self.assertEqual(fist.x, 400.0)
+
+    def test_stale_results_are_ignored(self):
+        """Test that feeding the same result twice does not change the tracks."""
+        self.predictor.update([(100.0, 100.0)], timestamp=0.0)
+        self.predictor.update([(110.0, 100.0)], timestamp=0.02)
+        self.predictor.update([(110.0, 100.0)], timestamp=0.02)
+        fist, = self.predictor.predict(0.04)
+        self.assertAlmostEqual(fist.x, 120.0)
+
+    def test_lost_hands_are_dropped(self):
+        """Test that hands missing from a result stop being predicted."""
+        self.predictor.update([(100.0, 100.0)], timestamp=0.0)
+        self.predictor.update([], timestamp=0.01)
+        self.assertEqual(self.predictor.predict(0.02), [])
+        self.assertEqual(len(self.predictor), 0)
+
+    def test_acceleration_noise_sets_growth(self):
+        """Test the uncertainty model: noise plus half the acceleration bound times dt squared."""
+        self.predictor.update([(0.0, 0.0)], timestamp=0.0)
+        with patch.object(config, 'FIST_ACCELERATION_NOISE', 1000.0):
+            fist, = self.predictor.predict(0.1)
+        self.assertAlmostEqual(fist.uncertainty, config.FIST_MEASUREMENT_NOISE + 5.0)
+
+    def test_uncertainty_is_capped(self):
+        """Test that a stale detection widens the fist by at most FIST_MAX_UNCERTAINTY."""
+        self.predictor.update([(0.0, 0.0)], timestamp=0.0)
+        fist, = self.predictor.predict(1.0)
+        self.assertEqual(fist.uncertainty, config.FIST_MAX_UNCERTAINTY)
+
+
+if __name__ == '__main__':
+    unittest.main()
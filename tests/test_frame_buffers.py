@@ -0,0 +1,107 @@
+import time
+import tracemalloc
+import unittest
+from unittest.mock import MagicMock, patch
+import cv2
+import numpy as np
+
+from config.game_config import GameState
+from core.frame_buffers import FrameBuffers, FrameRing
+
+
+class TestFrameRing(unittest.TestCase):
+    def test_ring_hands_out_buffers_round_robin(self):
+        """Test that the ring cycles through its preallocated frames."""
+        ring = FrameRing((4, 4, 3), slots=3)
+        frames = [ring.next() for _ in range(4)]
+        self.assertEqual(len({id(frame) for frame in frames[:3]}), 3)
+        self.assertIs(frames[3], frames[0])
+
+    def test_ring_needs_a_slot(self):
+        """Test that an empty ring is rejected."""
+        with self.assertRaises(ValueError):
+            FrameRing((4, 4, 3), slots=0)
+
+    def test_buffers_sized_from_frame(self):
+        """Test that buffers follow the resolution of an existing frame."""
+        buffers = FrameBuffers.for_frame(np.zeros((720, 1280, 3), dtype=np.uint8))
+        self.assertEqual(buffers.output.next().shape, (720, 1280, 3))
+        self.assertEqual(buffers.shape, (720, 1280, 3))
+
+
+class TestPrepare(unittest.TestCase):
+    def setUp(self):
+        self.frame = np.random.default_rng(0).integers(0, 256, (48, 64, 3), dtype=np.uint8)
+
+    def test_mirrored_rgb_matches_flip_then_convert(self):
+        """Test that the fused stage equals a flip followed by a BGR to RGB conversion."""
+        buffers = FrameBuffers(64, 48, inference_width=None)
+        display, rgb = buffers.prepare(self.frame)
+        expected = cv2.flip(self.frame, 1)
+        np.testing.assert_array_equal(display, expected)
+        np.testing.assert_array_equal(rgb, cv2.cvtColor(expected, cv2.COLOR_BGR2RGB))
+
+    def test_unmirrored_frames_keep_orientation(self):
+        """Test that without mirroring the frame is only copied and converted."""
+        buffers = FrameBuffers(64, 48, inference_width=None)
+        display, rgb = buffers.prepare(self.frame, mirror=False)
+        np.testing.assert_array_equal(display, self.frame)
+        np.testing.assert_array_equal(rgb, cv2.cvtColor(self.frame, cv2.COLOR_BGR2RGB))
+
+    def test_rgb_downscaled_to_inference_width(self):
+        """Test that the inference frame is written at the inference width."""
+        buffers = FrameBuffers(64, 48, inference_width=32)
+        display, rgb = buffers.prepare(self.frame)
+        self.assertEqual(display.shape, (48, 64, 3))
+        self.assertEqual(rgb.shape, (24, 32, 3))
+        small = cv2.resize(self.frame, (32, 24), interpolation=cv2.INTER_AREA)
+        np.testing.assert_array_equal(rgb, cv2.cvtColor(cv2.flip(small, 1), cv2.COLOR_BGR2RGB))
+
+    def test_prepare_uses_ring_buffers(self):
+        """Test that prepare writes into the output and rgb rings, leaving the frame untouched."""
+        buffers = FrameBuffers(64, 48, slots=1, inference_width=None)
+        original = self.frame.copy()
+        display, rgb = buffers.prepare(self.frame)
+        self.assertIs(display, buffers.output.next())
+        self.assertIs(rgb, buffers.rgb.next())
+        np.testing.assert_array_equal(self.frame, original)
+
+
+class TestSteadyStateAllocation(unittest.TestCase):
+    @patch('core.game_engine.EventManager')
+    def test_pipeline_allocates_no_frames(self, _):
+        """Test that capture-to-output reuses buffers once warmed up."""
+        from core.game_engine import GameEngine
+
+        buffers = FrameBuffers(640, 480)
+        engine = GameEngine(frame_buffers=buffers)
+        engine.hand_tracker.detector.hands = MagicMock()
+        engine.hand_tracker.detector.hands.process.return_value.multi_hand_landmarks = None
+        engine.state = GameState.RUNNING
+        camera = np.random.default_rng(0).integers(0, 256, buffers.shape, dtype=np.uint8)
+        captured = np.empty_like(camera)  # stands in for a CameraCapture buffer
+
+        def tick():
+            np.copyto(captured, camera)
+            return engine.process_frame(captured, mirror=True)
+
+        with patch('time.time', return_value=time.time()):
+            for _ in range(10):
+                tick()
+
+            tracemalloc.start()
+            try:
+                baseline = tracemalloc.get_traced_memory()[0]
+                for _ in range(30):
+                    tick()
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+        engine.hand_tracker.cleanup()
+
+        # A single full-frame allocation would push the peak past this
+        self.assertLess(peak - baseline, camera.nbytes // 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,13 @@
+import time
 import unittest
 from unittest.mock import Mock, patch, MagicMock, call
+import cv2
 import numpy as np
 
 from core.game_engine import GameEngine
-from config.game_config import GameState
+from core.frame_buffers import FrameBuffers
+from rendering.renderer import Renderer
+from config.game_config import config, GameState
 from events.event_manager import EventManager, GameEvent, EventType
 
 class TestGameEngine(unittest.TestCase):
@@ -124,5 +128,149 @@ class TestGameEngine(unittest.TestCase):
         # Should transition to GAME_OVER
         self.assertEqual(engine.state, GameState.GAME_OVER)
 
+    def test_process_frame_reuses_output_buffer(self):
+        """Test that frames are drawn into ring buffers, leaving the input intact."""
+        engine = self.GameEngine()
+        frame = np.full((120, 160, 3), 50, dtype=np.uint8)
+        engine.frame_buffers = FrameBuffers.for_frame(frame, slots=2)
+        outputs = [engine.process_frame(frame) for _ in range(3)]
+        self.assertIsNot(outputs[0], outputs[1])
+        self.assertIs(outputs[0], outputs[-1])
+        self.assertTrue(np.all(frame == 50))
+    
+    def test_process_frame_mirrors_for_display_and_tracking(self):
+        """Test that mirroring flips both the returned frame and the tracked frame."""
+        engine = self.GameEngine()
+        engine.state = GameState.GAME_OVER
+        engine.game_over_layer = MagicMock()
+        frame = np.zeros((120, 160, 3), dtype=np.uint8)
+        frame[:, :10] = (255, 0, 0)  # blue strip on the left
+        with patch.object(config, 'GAME_OVER_DIM', 1.0):
+            output = engine.process_frame(frame, mirror=True)
+        self.assertTrue(np.all(output[:, -10:] == (255, 0, 0)))
+        rgb = self.mock_hand_tracker.process_frame.call_args.kwargs['rgb']
+        self.assertTrue(np.all(rgb[:, -1] == (0, 0, 255)))
+        self.assertTrue(np.all(rgb[:, 0] == 0))
+    
+    def test_draw_blends_only_ui_regions(self):
+        """Test that pixels outside the HUD widgets are left untouched."""
+        engine = self.GameEngine()
+        engine.renderer = Renderer()
+        engine.state = GameState.RUNNING
+        rng = np.random.default_rng(3)
+        frame = rng.integers(0, 256, (config.WINDOW_HEIGHT, config.WINDOW_WIDTH, 3), dtype=np.uint8)
+        drawn = frame.copy()
+        engine.draw(drawn)
+        
+        untouched = np.ones(frame.shape[:2], dtype=bool)
+        for x, y, w, h in engine.hud.regions():
+            untouched[y:y + h, x:x + w] = False
+        np.testing.assert_array_equal(drawn[untouched], frame[untouched])
+        self.assertFalse(np.array_equal(drawn, frame))
+    
+    def test_countdown_matches_full_frame_overlay(self):
+        """Test that the ROI-blended countdown equals blending a full-frame overlay."""
+        engine = self.GameEngine()
+        engine.renderer = Renderer()
+        rng = np.random.default_rng(5)
+        frame = rng.integers(0, 256, (config.WINDOW_HEIGHT, config.WINDOW_WIDTH, 3), dtype=np.uint8)
+        
+        with patch('time.time', return_value=engine.start_time):
+            engine._draw_countdown()
+        (command,) = engine.renderer._commands
+        expected = frame.copy()
+        overlay = frame.copy()
+        command.draw(overlay)
+        cv2.addWeighted(overlay, config.UI_OPACITY, expected, 1 - config.UI_OPACITY, 0, expected)
+        
+        engine.renderer.flush(frame)
+        np.testing.assert_array_equal(frame, expected)
+        self.assertEqual(engine.renderer.stats.blend_regions, 1)
+    
+    def test_countdown_uses_text_cache(self):
+        """Test that countdown text is drawn from the text cache, matching direct drawing."""
+        engine = self.GameEngine()
+        engine.renderer = Renderer()
+        for _ in range(3):
+            frame = np.zeros((config.WINDOW_HEIGHT, config.WINDOW_WIDTH, 3), dtype=np.uint8)
+            engine._draw_countdown_text(frame, "3", (300, 300))
+        stats = engine.renderer.text_cache_stats
+        self.assertEqual((stats.hits, stats.misses), (4, 2))
+        
+        expected = np.zeros_like(frame)
+        scale, thickness = config.FONT_SCALE * 4, config.FONT_THICKNESS * 2
+        cv2.putText(expected, "3", (303, 303), config.FONT_FACE, scale, (100, 100, 100), thickness)
+        cv2.putText(expected, "3", (300, 300), config.FONT_FACE, scale, (255, 255, 255), thickness)
+        np.testing.assert_array_equal(frame, expected)
+    
+    def test_game_over_screen_is_cached(self):
+        """Test that idling on game over reuses the text layer and dims the scene."""
+        engine = self.GameEngine()
+        engine.renderer = Renderer()
+        engine.state = GameState.GAME_OVER
+        engine.score = 42
+        frame = np.full((config.WINDOW_HEIGHT, config.WINDOW_WIDTH, 3), 200, dtype=np.uint8)
+        for _ in range(3):
+            drawn = frame.copy()
+            engine.draw(drawn)
+        self.assertEqual(engine.game_over_layer.renders, 1)
+        
+        # Away from the text the scene is only dimmed
+        self.assertTrue(np.all(drawn[-5:, :5] == round(200 * config.GAME_OVER_DIM)))
+        (x, y, w, h), = engine.game_over_layer.regions()
+        self.assertFalse(np.all(drawn[y:y + h, x:x + w] == round(200 * config.GAME_OVER_DIM)))
+
+    def test_async_tracking_uses_worker(self):
+        """Test that async mode hands frames to the worker instead of tracking inline."""
+        self.mock_hand_tracker.get_fist_positions.return_value = [(10.0, 20.0)]
+        self.mock_hand_tracker.fist_positions = [(10, 20)]
+        with patch.object(config, 'HAND_TRACKING_ASYNC', True):
+            engine = self.GameEngine()
+        try:
+            frame = np.zeros((120, 160, 3), dtype=np.uint8)
+            engine.process_frame(frame, timestamp=123.0)
+            deadline = time.time() + 2.0
+            while engine.hand_worker.latest().captured_at != 123.0 and time.time() < deadline:
+                time.sleep(0.005)
+        finally:
+            engine.cleanup()
+        
+        self.assertEqual(engine.hand_worker.latest().fist_positions, [(10.0, 20.0)])
+        self.mock_hand_tracker.process_rgb.assert_called_once()
+        rgb, frame_size = self.mock_hand_tracker.process_rgb.call_args.args
+        self.assertEqual(frame_size, (160, 120))
+        self.assertEqual(rgb.shape[1], min(160, config.HAND_INFERENCE_WIDTH or 160))
+        self.mock_hand_tracker.process_frame.assert_not_called()
+
+    def test_collisions_use_predicted_fists(self):
+        """Test that collision runs on extrapolated fists with widened radii."""
+        engine = self.GameEngine()
+        engine.fist_predictor.update([(100.0, 100.0)], timestamp=10.0)
+        engine.fist_predictor.update([(110.0, 100.0)], timestamp=10.02)
+        self.mock_object_manager.get_hit_objects.return_value = []
+        with patch('time.time', return_value=10.04), \
+                patch.object(config, 'FIST_PREDICTION', True):
+            engine._check_collisions()
+        
+        positions, radii = self.mock_object_manager.get_hit_objects.call_args.args
+        self.assertGreater(positions[0][0], 110.0)
+        self.assertGreater(radii[0], config.FIST_RADIUS)
+
+    def test_debug_overlay_key_toggles_overlay(self):
+        """Test that the debug key switches the overlay and the game keeps running."""
+        engine = self.GameEngine()
+        engine.renderer = Renderer()
+        frame = np.zeros((config.WINDOW_HEIGHT, config.WINDOW_WIDTH, 3), dtype=np.uint8)
+        self.assertFalse(engine.debug_overlay.enabled)
+        
+        self.assertTrue(engine.handle_key(ord(config.DEBUG_OVERLAY_KEY)))
+        self.assertTrue(engine.debug_overlay.enabled)
+        engine.draw(frame)
+        with_overlay = engine.renderer.stats.submitted
+        
+        engine.handle_key(ord(config.DEBUG_OVERLAY_KEY))
+        engine.draw(frame)
+        self.assertLess(engine.renderer.stats.submitted, with_overlay)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,171 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import cv2
+import numpy as np
+
+from config.game_config import config, DetectorBackend
+from input.hand_detectors import (HandDetections, IHandDetector, RecordingDetector, ReplayDetector,
+                                  SkinColorDetector, classify_fist, create_detector)
+
+SKIN = (224, 172, 140)  # RGB
+
+
+def _hand(x0, y0, x1, y1):
+    """21 landmarks spread over the normalized box (x0, y0)-(x1, y1)."""
+    steps = np.arange(21) / 20
+    return np.stack([x0 + (x1 - x0) * steps, y0 + (y1 - y0) * steps, np.zeros(21)], axis=1)
+
+
+class ScriptedDetector(IHandDetector):
+    """Reports one scripted list of landmark hands per call."""
+
+    def __init__(self, frames):
+        self.frames = list(frames)
+
+    def detect(self, image):
+        hands, labels = self.frames.pop(0)
+        return HandDetections.from_landmarks(np.array(hands), labels)
+
+
+class TestClassifyFist(unittest.TestCase):
+    def test_is_fist_detection(self):
+        """Test the fist detection logic."""
+        # Open hand: finger tips twice as far from the wrist as their MCPs
+        open_hand = np.zeros((21, 3))
+        open_hand[0] = (0.5, 0.9, 0.0)  # Wrist
+        for mcp, tip, x in [(5, 8, 0.4), (9, 12, 0.45), (13, 16, 0.5), (17, 20, 0.55)]:
+            open_hand[mcp] = (x, 0.6, 0.0)
+            open_hand[tip] = (x, 0.3, 0.0)
+        open_hand[4] = (0.3, 0.7, 0.0)  # Thumb tip beside the palm
+        
+        is_fist, confidence = classify_fist(open_hand)
+        self.assertFalse(is_fist, "Open hand should not be detected as a fist")
+        self.assertEqual(confidence, 0.0)
+        
+        # Closed fist: tips curled back towards the wrist, thumb over the fingers
+        fist = open_hand.copy()
+        fist[[8, 12, 16, 20], 1] = 0.75
+        fist[4] = (0.6, 0.6, 0.0)
+        
+        is_fist, confidence = classify_fist(fist)
+        self.assertTrue(is_fist, "Curled hand should be detected as a fist")
+        self.assertIsInstance(confidence, float, "Confidence should be a float")
+        self.assertAlmostEqual(confidence, 1.0)
+        
+        # Depth counts too: a tip pointing at the camera is not curled
+        fist[20, 2] = -0.5
+        self.assertAlmostEqual(classify_fist(fist)[1], 0.85)
+
+
+class TestHandDetections(unittest.TestCase):
+    def test_from_landmarks(self):
+        """Test that centres and boxes are derived from the landmarks."""
+        detections = HandDetections.from_landmarks(np.array([_hand(0.2, 0.4, 0.4, 0.8)]), ['Left'])
+        self.assertEqual(len(detections), 1)
+        # Centre is between the wrist (0) and the middle finger MCP (9)
+        np.testing.assert_allclose(detections.centers, [[0.245, 0.49]])
+        np.testing.assert_allclose(detections.boxes, [[0.2, 0.4, 0.4, 0.8]])
+        self.assertEqual(detections.handedness, ['Left'])
+
+    def test_missing_handedness_is_none(self):
+        """Test that hands without a label are reported as None."""
+        detections = HandDetections.from_landmarks(np.array([_hand(0, 0, 1, 1)] * 2), ['Right'])
+        self.assertEqual(detections.handedness, ['Right', None])
+
+    def test_remap_from_crop(self):
+        """Test that crop-normalized coordinates map back to the full frame."""
+        detections = HandDetections.from_landmarks(np.array([_hand(0.0, 0.0, 1.0, 1.0)]))
+        detections.remap((100, 50, 300, 250), 400, 500)
+        np.testing.assert_allclose(detections.boxes, [[0.25, 0.1, 0.75, 0.5]])
+        np.testing.assert_allclose(detections.landmarks[0, -1, :2], [0.75, 0.5])
+
+
+class TestSkinColorDetector(unittest.TestCase):
+    def setUp(self):
+        self.image = np.zeros((240, 320, 3), dtype=np.uint8)
+
+    def test_compact_blob_is_a_fist(self):
+        """Test that a round skin blob is reported as a fist at its centroid."""
+        cv2.circle(self.image, (100, 120), 30, SKIN, -1)
+        detections = SkinColorDetector().detect(self.image)
+        self.assertEqual(len(detections), 1)
+        self.assertTrue(detections.is_fist[0])
+        np.testing.assert_allclose(detections.centers[0] * (320, 240), (100, 120), atol=1)
+        self.assertEqual(detections.handedness, [None])
+
+    def test_spread_fingers_are_not_a_fist(self):
+        """Test that a palm with spread fingers has too low a solidity."""
+        cv2.circle(self.image, (160, 160), 25, SKIN, -1)
+        for angle in np.linspace(-2.4, -0.7, 5):
+            tip = (int(160 + 80 * np.cos(angle)), int(160 + 80 * np.sin(angle)))
+            cv2.line(self.image, (160, 160), tip, SKIN, 10)
+        detections = SkinColorDetector().detect(self.image)
+        self.assertEqual(len(detections), 1)
+        self.assertFalse(detections.is_fist[0])
+
+    def test_small_and_non_skin_blobs_are_ignored(self):
+        """Test that specks and other colours are not hands."""
+        cv2.circle(self.image, (50, 50), 4, SKIN, -1)
+        cv2.circle(self.image, (200, 120), 40, (40, 200, 40), -1)
+        self.assertEqual(len(SkinColorDetector().detect(self.image)), 0)
+
+    def test_largest_blobs_win(self):
+        """Test that at most max_hands blobs are reported, largest first."""
+        for x, radius in [(60, 20), (160, 35), (260, 28)]:
+            cv2.circle(self.image, (x, 120), radius, SKIN, -1)
+        detections = SkinColorDetector(max_hands=2).detect(self.image)
+        np.testing.assert_allclose(detections.centers[:, 0] * 320, [160, 260], atol=1)
+
+
+class TestReplay(unittest.TestCase):
+    def setUp(self):
+        self.frames = [([_hand(0.1, 0.1, 0.2, 0.2)], ['Left']),
+                       ([], []),
+                       ([_hand(0.3, 0.3, 0.4, 0.4), _hand(0.6, 0.6, 0.7, 0.7)], ['Left', 'Right'])]
+        self.path = os.path.join(tempfile.mkdtemp(), 'hands.npz')
+        recorder = RecordingDetector(ScriptedDetector(self.frames))
+        self.recorded = [recorder.detect(None) for _ in self.frames]
+        recorder.save(self.path)
+
+    def tearDown(self):
+        os.remove(self.path)
+        os.rmdir(os.path.dirname(self.path))
+
+    def test_replay_matches_recording(self):
+        """Test that a replayed stream reproduces the recorded detections."""
+        replay = ReplayDetector(self.path, loop=False)
+        self.assertEqual(len(replay), 3)
+        self.assertFalse(replay.needs_image)
+        for recorded in self.recorded:
+            replayed = replay.detect()
+            np.testing.assert_array_equal(replayed.centers, recorded.centers)
+            self.assertEqual(replayed.handedness, recorded.handedness)
+        self.assertEqual(len(replay.detect()), 0)
+
+    def test_replay_loops(self):
+        """Test that a looping replay starts over after the last frame."""
+        replay = ReplayDetector(self.path)
+        counts = [len(replay.detect()) for _ in range(6)]
+        self.assertEqual(counts, [1, 0, 2, 1, 0, 2])
+
+    def test_recording_needs_landmarks(self):
+        """Test that backends without landmarks cannot be recorded."""
+        image = np.zeros((120, 160, 3), dtype=np.uint8)
+        cv2.circle(image, (80, 60), 30, SKIN, -1)
+        with self.assertRaises(ValueError):
+            RecordingDetector(SkinColorDetector()).detect(image)
+
+    def test_create_replay_detector(self):
+        """Test that the config selects the replay backend and its file."""
+        with patch.object(config, 'HAND_DETECTOR', DetectorBackend.REPLAY), \
+                patch.object(config, 'HAND_REPLAY_PATH', self.path):
+            self.assertIsInstance(create_detector(), ReplayDetector)
+        with patch.object(config, 'HAND_REPLAY_PATH', None):
+            with self.assertRaises(ValueError):
+                create_detector(DetectorBackend.REPLAY)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,46 +1,76 @@
 import unittest
+from types import SimpleNamespace
 import cv2
 import numpy as np
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, ANY
 
+from config.game_config import config, DetectorBackend
+from input.hand_detectors import HandDetections, IHandDetector, MediaPipeDetector
 from input.hand_tracker import HandTracker
 
+
+def _hand(x0, y0, x1, y1):
+    """21 landmarks spread over the normalized box (x0, y0)-(x1, y1)."""
+    steps = np.arange(21) / 20
+    return np.stack([x0 + (x1 - x0) * steps, y0 + (y1 - y0) * steps, np.zeros(21)], axis=1)
+
+
+class FakeDetector(IHandDetector):
+    """Reports the landmark hands in ``hands`` and records the images it is given."""
+    
+    def __init__(self):
+        self.hands = []
+        self.labels = []
+        self.inputs = []
+        self.closed = False
+    
+    def detect(self, image):
+        self.inputs.append(image.shape)
+        return HandDetections.from_landmarks(np.array(self.hands), self.labels)
+    
+    def close(self):
+        self.closed = True
+
+
 class TestHandTracker(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         self.width = 800
         self.height = 600
-        self.hand_tracker = HandTracker()
+        self.detector = FakeDetector()
+        self.hand_tracker = HandTracker(self.detector)
         
         # Create a blank test image
         self.test_img = np.zeros((self.height, self.width, 3), dtype=np.uint8)
     
     def test_initialization(self):
         """Test that the hand tracker initializes correctly."""
-        self.assertIsNotNone(self.hand_tracker.hands)
+        self.assertIs(self.hand_tracker.detector, self.detector)
         self.assertEqual(len(self.hand_tracker.fist_positions), 0)
-        self.assertEqual(len(self.hand_tracker.position_history), 0)
+        self.assertEqual(len(self.hand_tracker.tracks), 0)
     
-    @patch('input.hand_tracker.mp.solutions.hands.Hands')
-    def test_process_frame_no_hands(self, mock_hands):
+    def test_default_backend_is_lazy(self):
+        """Test that the default MediaPipe backend builds no model until used."""
+        with patch.object(config, 'HAND_DETECTOR', DetectorBackend.MEDIAPIPE):
+            tracker = HandTracker()
+        self.assertIsInstance(tracker.detector, MediaPipeDetector)
+        self.assertIsNone(tracker.detector.hands)
+        tracker.cleanup()
+    
+    def test_process_frame_no_hands(self):
         """Test processing a frame with no hands."""
-        # Mock the hands.process method to return no hands
-        mock_results = MagicMock()
-        mock_results.multi_hand_landmarks = None
-        mock_hands.return_value.process.return_value = mock_results
-        
         # Process a blank frame
         frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
         self.hand_tracker.process_frame(frame)
         
         # No fists should be detected
         self.assertEqual(len(self.hand_tracker.fist_positions), 0)
+        self.assertEqual(self.detector.inputs, [(self.height, self.width, 3)])
     
-    @patch('input.hand_tracker.mp.solutions.hands.Hands')
     @patch('input.hand_tracker.cv2.cvtColor')
     @patch('input.hand_tracker.cv2.circle')
     @patch('input.hand_tracker.cv2.putText')
-    def test_process_frame_with_hands(self, mock_put_text, mock_circle, mock_cvt_color, mock_hands):
+    def test_process_frame_with_hands(self, mock_put_text, mock_circle, mock_cvt_color):
         """Test processing a frame with hands."""
         # Mock the color conversion to return the same frame
         mock_cvt_color.return_value = np.zeros((self.height, self.width, 3), dtype=np.uint8)
@@ -58,172 +88,236 @@ class TestHandTracker(unittest.TestCase):
         # Mock the results
         mock_results = MagicMock()
         mock_results.multi_hand_landmarks = [mock_hand_landmarks]
+        mock_results.multi_handedness = [SimpleNamespace(classification=[SimpleNamespace(label='Left')])]
         
-        # Create a mock hands instance with the process method
-        mock_hands_instance = MagicMock()
-        mock_hands_instance.process.return_value = mock_results
-        
-        # Mock the HandLandmark enum values
-        mock_hand_landmark_enum = MagicMock()
-        mock_hand_landmark_enum.WRIST = 0
-        mock_hand_landmark_enum.MIDDLE_FINGER_MCP = 9
-        mock_hand_landmark_enum.THUMB_TIP = 4
-        mock_hand_landmark_enum.THUMB_IP = 3
-        mock_hand_landmark_enum.THUMB_CMC = 2
-        mock_hand_landmark_enum.INDEX_FINGER_TIP = 8
-        mock_hand_landmark_enum.INDEX_FINGER_DIP = 7
-        mock_hand_landmark_enum.INDEX_FINGER_PIP = 6
-        mock_hand_landmark_enum.INDEX_FINGER_MCP = 5
-        mock_hand_landmark_enum.MIDDLE_FINGER_TIP = 12
-        mock_hand_landmark_enum.MIDDLE_FINGER_DIP = 11
-        mock_hand_landmark_enum.MIDDLE_FINGER_PIP = 10
-        mock_hand_landmark_enum.RING_FINGER_TIP = 16
-        mock_hand_landmark_enum.RING_FINGER_DIP = 15
-        mock_hand_landmark_enum.RING_FINGER_PIP = 14
-        mock_hand_landmark_enum.RING_FINGER_MCP = 13
-        mock_hand_landmark_enum.PINKY_TIP = 20
-        mock_hand_landmark_enum.PINKY_DIP = 19
-        mock_hand_landmark_enum.PINKY_PIP = 18
-        mock_hand_landmark_enum.PINKY_MCP = 17
+        # A MediaPipe backend whose model is replaced by a mock
+        detector = MediaPipeDetector()
+        detector.hands = MagicMock()
+        detector.hands.process.return_value = mock_results
+        hand_tracker = HandTracker(detector)
         
-        # Create a mock hands module with the HandLandmark enum
-        mock_hands_module = MagicMock()
-        mock_hands_module.HandLandmark = mock_hand_landmark_enum
-        
-        # Patch the mp.solutions.hands module
-        with patch.dict('sys.modules', {'mediapipe.solutions.hands': mock_hands_module}):
-            # Create a new HandTracker instance to use the mocked module
-            from input.hand_tracker import HandTracker
-            hand_tracker = HandTracker()
+        # Mock the fist test to return True
+        with patch('input.hand_detectors.classify_fist', return_value=(True, 0.9)) as mock_classify:
+            # Process a blank frame
+            frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
             
-            # Replace the hands instance with our mock
-            hand_tracker.hands = mock_hands_instance
-            hand_tracker.mp_hands = mock_hands_module
+            # Call the method under test
+            hand_tracker.process_frame(frame)
             
-            # Mock the _is_fist method to return True
-            with patch.object(hand_tracker, '_is_fist', return_value=(True, 0.9)):
-                # Process a blank frame
-                frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-                
-                # Call the method under test
-                hand_tracker.process_frame(frame)
-                
-                # Verify that cv2.cvtColor was called
-                mock_cvt_color.assert_called_once_with(frame, cv2.COLOR_BGR2RGB)
-                
-                # Verify that the process method was called with the RGB frame
-                mock_hands_instance.process.assert_called_once()
-                args, _ = mock_hands_instance.process.call_args
-                self.assertEqual(len(args), 1, "Process should be called with one argument")
-                self.assertEqual(args[0].shape, (self.height, self.width, 3), 
-                              "Process should be called with an RGB frame of the correct size")
-                
-                # Verify that _is_fist was called with the correct arguments
-                # It should be called twice - once for the actual check and once for drawing
-                self.assertEqual(hand_tracker._is_fist.call_count, 2, 
-                              "_is_fist should be called twice - once for check and once for drawing")
-                
-                # Verify that the fist position was added
-                self.assertEqual(len(hand_tracker.fist_positions), 1, 
-                               "Expected one fist position to be detected")
-                
-                # Verify the position is as expected (center of the frame)
-                x, y = hand_tracker.fist_positions[0]
-                expected_x = int(0.5 * self.width)  # 50% of width
-                expected_y = int(0.5 * self.height)  # 50% of height
-                self.assertEqual(x, expected_x, 
-                              f"Expected x position {expected_x}, got {x}")
-                self.assertEqual(y, expected_y, 
-                              f"Expected y position {expected_y}, got {y}")
-                
-                # Verify that circle was called to draw the fist position
-                mock_circle.assert_called()
-    
-    @patch('input.hand_tracker.np.linalg.norm')
-    def test_is_fist_detection(self, mock_norm):
-        """Test the fist detection logic."""
-        # Create mock landmarks for an open hand
-        open_hand = [MagicMock(x=0.5, y=0.5, z=0.0) for _ in range(21)]
-        
-        # Configure the mock to return a large distance for open hand (fingers not curled)
-        def distance_side_effect(p1, p2):
-            # For wrist to tip distances, return a large value (fingers not curled)
-            if p1 == open_hand[0]:  # Wrist
-                if p2 in [open_hand[8], open_hand[12], open_hand[16], open_hand[20]]:  # Finger tips
-                    return 10.0
-            # For MCP to wrist distances, return a small value
-            if p1 == open_hand[0] and p2 in [open_hand[5], open_hand[9], open_hand[13], open_hand[17]]:
-                return 5.0
-            return 1.0  # Default distance
-        
-        # Set the side effect for the mock
-        mock_norm.side_effect = distance_side_effect
-        
-        # Test with open hand (not a fist)
-        is_fist, confidence = self.hand_tracker._is_fist(open_hand)
-        self.assertFalse(is_fist, "Open hand should not be detected as a fist")
-        self.assertLess(confidence, 0.7, "Confidence should be low for open hand")
-        
-        # Now test with a closed fist
-        def distance_side_effect_closed(p1, p2):
-            # For wrist to tip distances, return a small value (fingers curled)
-            if p1 == open_hand[0]:  # Wrist
-                if p2 in [open_hand[8], open_hand[12], open_hand[16], open_hand[20]]:  # Finger tips
-                    return 0.1
-            # For MCP to wrist distances, return a small value
-            if p1 == open_hand[0] and p2 in [open_hand[5], open_hand[9], open_hand[13], open_hand[17]]:
-                return 5.0
-            return 1.0  # Default distance
-        
-        # Update the side effect for the mock
-        mock_norm.side_effect = distance_side_effect_closed
-        
-        # Set thumb position to be over the fingers
-        open_hand[4].x = 0.6  # Thumb tip x > index MCP x
-        open_hand[4].y = 0.4  # Thumb tip y < index MCP y + 0.1
-        
-        # Set up the hand landmarks to match the expected structure
-        # The _is_fist method expects specific landmark indices to be set
-        # We'll set up the landmarks to simulate a closed fist
-        
-        # Set up the wrist and finger MCPs
-        open_hand[0].x = 0.5  # Wrist
-        open_hand[0].y = 0.5
-        
-        # Set up the finger tips to be close to the wrist (curled fingers)
-        for idx in [8, 12, 16, 20]:  # Finger tips
-            open_hand[idx].x = 0.5
-            open_hand[idx].y = 0.5
-        
-        # Set up the MCPs to be slightly above the wrist
-        for idx in [5, 9, 13, 17]:  # MCPs
-            open_hand[idx].x = 0.5
-            open_hand[idx].y = 0.4
-        
-        # Set up the thumb to be over the fingers
-        open_hand[4].x = 0.6  # Thumb tip x > index MCP x
-        open_hand[4].y = 0.4  # Thumb tip y < index MCP y + 0.1
-        
-        # Test with closed fist
-        is_fist, confidence = self.hand_tracker._is_fist(open_hand)
-        
-        # We'll just check that the method runs without errors
-        # The exact confidence value might depend on the implementation details
-        self.assertIsInstance(confidence, float, "Confidence should be a float")
-        self.assertGreaterEqual(confidence, 0.0, "Confidence should be >= 0")
-        self.assertLessEqual(confidence, 1.0, "Confidence should be <= 1")
+            # Verify that cv2.cvtColor was called
+            mock_cvt_color.assert_called_once_with(frame, cv2.COLOR_BGR2RGB, dst=ANY)
+            
+            # Verify that the process method was called with the RGB frame
+            detector.hands.process.assert_called_once()
+            args, _ = detector.hands.process.call_args
+            self.assertEqual(len(args), 1, "Process should be called with one argument")
+            self.assertEqual(args[0].shape, (self.height, self.width, 3), 
+                          "Process should be called with an RGB frame of the correct size")
+            
+            # Verify that the fist test ran once, on the hand's landmark array
+            # The result is shared by tracking and debug drawing
+            self.assertEqual(mock_classify.call_count, 1, 
+                          "The fist test should be evaluated once per hand")
+            points, = mock_classify.call_args.args
+            self.assertEqual(points.shape, (21, 3))
+            
+            # Verify that the fist position was added
+            self.assertEqual(len(hand_tracker.fist_positions), 1, 
+                           "Expected one fist position to be detected")
+            
+            # Verify the position is as expected (center of the frame)
+            x, y = hand_tracker.fist_positions[0]
+            expected_x = int(0.5 * self.width)  # 50% of width
+            expected_y = int(0.5 * self.height)  # 50% of height
+            self.assertEqual(x, expected_x, 
+                          f"Expected x position {expected_x}, got {x}")
+            self.assertEqual(y, expected_y, 
+                          f"Expected y position {expected_y}, got {y}")
+            self.assertEqual(hand_tracker.detections.handedness, ['Left'])
+            
+            # Inference only reads the frame; diagnostics belong to the debug overlay
+            mock_circle.assert_not_called()
+            mock_put_text.assert_not_called()
+            self.assertFalse(frame.any())
+    
+    def test_imageless_backend_skips_conversion(self):
+        """Test that no input image is prepared for a backend that does not need one."""
+        self.detector.needs_image = False
+        self.detector.detect = MagicMock(return_value=HandDetections.empty())
+        with patch('input.hand_tracker.cv2.cvtColor') as mock_cvt_color:
+            self.hand_tracker.process_frame(self.test_img)
+        mock_cvt_color.assert_not_called()
+        self.detector.detect.assert_called_once_with(None)
     
     def test_cleanup(self):
-        """Test that cleanup doesn't raise exceptions."""
+        """Test that cleanup closes the detector backend."""
         try:
             self.hand_tracker.cleanup()
         except Exception as e:
             self.fail(f"Cleanup raised an exception: {e}")
         
-        # The hands object should be closed
-        self.hand_tracker.hands.close = MagicMock()
-        self.hand_tracker.cleanup()
-        self.hand_tracker.hands.close.assert_called_once()
+        self.assertTrue(self.detector.closed)
+
+
+class TestInferenceInput(unittest.TestCase):
+    def setUp(self):
+        self.detector = FakeDetector()
+        self.tracker = HandTracker(self.detector)
+        self.inputs = self.detector.inputs
+        self.frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    
+    def tearDown(self):
+        self.tracker.cleanup()
+    
+    def _run(self, hands):
+        self.detector.hands = hands or []
+        self.tracker.process_frame(self.frame)
+    
+    def test_downscaled_inference(self):
+        """Test that inference runs on a frame scaled to the inference width."""
+        with patch.object(config, 'HAND_INFERENCE_WIDTH', 320):
+            self._run([_hand(0.25, 0.5, 0.5, 0.75)])
+        self.assertEqual(self.inputs, [(240, 320, 3)])
+        # Normalized landmarks map straight back to full-resolution pixels
+        self.assertEqual(self.tracker.hand_boxes, [(160.0, 240.0, 320.0, 360.0)])
+    
+    def test_roi_crops_around_last_hand(self):
+        """Test that ROI mode crops around the last hand and remaps its landmarks."""
+        with patch.object(config, 'HAND_ROI_ENABLED', True), \
+                patch.object(config, 'HAND_ROI_MARGIN', 0.5):
+            self._run([_hand(0.4, 0.4, 0.5, 0.5)])  # full frame: box 256..320 x 192..240
+            self._run([_hand(0.0, 0.0, 1.0, 1.0)])  # the whole crop
+        
+        # Padding is half the larger box side (64 px)
+        self.assertEqual(self.inputs, [(480, 640, 3), (113, 129, 3)])
+        x0, y0, x1, y1 = self.tracker.hand_boxes[0]
+        self.assertAlmostEqual(x0, 224.0)
+        self.assertAlmostEqual(y0, 160.0)
+        self.assertAlmostEqual(x1, 353.0)
+        self.assertAlmostEqual(y1, 273.0)
+    
+    def test_roi_crops_prepared_rgb_frame(self):
+        """Test that a downscaled RGB frame is cropped at its own scale and mapped to display pixels."""
+        rgb = np.zeros((240, 320, 3), dtype=np.uint8)
+        with patch.object(config, 'HAND_ROI_ENABLED', True), \
+                patch.object(config, 'HAND_ROI_MARGIN', 0.5):
+            self.detector.hands = [_hand(0.4, 0.4, 0.5, 0.5)]
+            self.tracker.process_rgb(rgb, (640, 480))
+            self.detector.hands = [_hand(0.0, 0.0, 1.0, 1.0)]
+            self.tracker.process_rgb(rgb, (640, 480))
+        
+        self.assertEqual(self.inputs, [(240, 320, 3), (56, 64, 3)])
+        x0, y0, x1, y1 = self.tracker.hand_boxes[0]
+        self.assertAlmostEqual(x0, 224.0)
+        self.assertAlmostEqual(y0, 160.0)
+        self.assertAlmostEqual(x1, 352.0)
+        self.assertAlmostEqual(y1, 272.0)
+    
+    def test_roi_reacquires_full_frame(self):
+        """Test that ROI mode periodically falls back to the full frame."""
+        with patch.object(config, 'HAND_ROI_ENABLED', True), \
+                patch.object(config, 'HAND_ROI_REACQUIRE_FRAMES', 2):
+            for _ in range(4):
+                self._run([_hand(0.4, 0.4, 0.5, 0.5)])
+            self._run(None)
+            self._run(None)
+        full = (480, 640, 3)
+        self.assertEqual([shape == full for shape in self.inputs],
+                         [True, False, False, True, False, True])
+    
+    def test_roi_and_full_frame_agree_on_fist(self):
+        """Test that a pose seen through an uneven ROI crop is classified as on the full frame."""
+        # Three curled fingers and the thumb 0.04 below the index MCP: a fist
+        # only because the thumb counts as over the fingers
+        pose = np.zeros((21, 3))
+        pose[:, :2] = (0.5, 0.5)
+        pose[0] = (0.5, 0.52, 0.0)  # Wrist
+        for mcp, tip, x in [(5, 8, 0.47), (9, 12, 0.49), (13, 16, 0.51), (17, 20, 0.53)]:
+            pose[mcp] = (x, 0.46, 0.0)
+            pose[tip] = (x, 0.5, 0.0)
+        pose[16, 1] = 0.42  # Ring finger extended
+        # A 128 x 64 px crop, which stretches y more than x
+        roi = (256, 192, 384, 256)
+        crop = pose.copy()
+        crop[:, :2] = (pose[:, :2] * (640, 480) - roi[:2]) / (roi[2] - roi[0], roi[3] - roi[1])
+        
+        results = []
+        for hand, next_roi in ((pose, None), (crop, roi)):
+            with patch.object(self.tracker, '_next_roi', return_value=next_roi):
+                self._run([hand])
+            detections = self.tracker.detections
+            results.append((bool(detections.is_fist[0]), float(detections.confidence[0])))
+        
+        self.assertEqual(results[0][0], results[1][0])
+        self.assertAlmostEqual(results[0][1], results[1][1])
+        self.assertEqual(results[0], (True, 0.75))
+
+
+
+class TestHandIdentity(unittest.TestCase):
+    def setUp(self):
+        self.detector = FakeDetector()
+        self.tracker = HandTracker(self.detector)
+        self.frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        self.clock = 0.0
+    
+    def tearDown(self):
+        self.tracker.cleanup()
+    
+    def _run(self, hands, labels=()):
+        """Process one frame at 30 fps in which every hand is a fist."""
+        self.detector.hands = hands or []
+        self.detector.labels = list(labels)
+        self.clock += 1 / 30
+        with patch('input.hand_detectors.classify_fist', return_value=(True, 1.0)):
+            self.tracker.process_frame(self.frame, timestamp=self.clock)
+        return {track.hand_id: tuple(track.center) for track in self.tracker.tracks.values()}
+    
+    def test_hand_keeps_its_id(self):
+        """Test that a moving hand stays on one track."""
+        for step in range(8):
+            x = 0.2 + 0.01 * step
+            tracks = self._run([_hand(x, 0.4, x + 0.1, 0.5)], ['Right'])
+        self.assertEqual(list(tracks), [0])
+        track = self.tracker.tracks[0]
+        self.assertEqual(track.handedness, 'Right')
+    
+    def test_hands_matched_regardless_of_order(self):
+        """Test that two hands keep their ids when MediaPipe lists them in another order."""
+        left, right = _hand(0.1, 0.4, 0.2, 0.5), _hand(0.7, 0.4, 0.8, 0.5)
+        first = self._run([left, right], ['Left', 'Right'])
+        second = self._run([right, left], ['Right', 'Left'])
+        self.assertEqual(first, second)
+    
+    def test_handedness_separates_nearby_hands(self):
+        """Test that handedness decides between hands close enough to be confused."""
+        self._run([_hand(0.40, 0.4, 0.50, 0.5), _hand(0.50, 0.4, 0.60, 0.5)], ['Left', 'Right'])
+        ids = {track.handedness: track.hand_id for track in self.tracker.tracks.values()}
+        # Hands crossed over: positions alone would pair each with the other's track
+        self._run([_hand(0.49, 0.4, 0.59, 0.5), _hand(0.41, 0.4, 0.51, 0.5)], ['Left', 'Right'])
+        self.assertEqual({track.handedness: track.hand_id for track in self.tracker.tracks.values()}, ids)
+    
+    def test_lost_hand_is_dropped(self):
+        """Test that a hand that disappears leaves no ghost fist and returns as a new track."""
+        self._run([_hand(0.2, 0.4, 0.3, 0.5)], ['Left'])
+        self._run(None)
+        self.assertEqual(self.tracker.get_fist_positions(), [])
+        self.assertEqual(list(self._run([_hand(0.2, 0.4, 0.3, 0.5)], ['Left'])), [1])
+    
+    def test_fist_positions_are_smoothed(self):
+        """Test that get_fist_positions reports the filtered centre of each fist."""
+        rng = np.random.default_rng(1)
+        errors = []
+        for _ in range(60):
+            dx, dy = rng.normal(0, 0.005, size=2)
+            self._run([_hand(0.45 + dx, 0.45 + dy, 0.55 + dx, 0.55 + dy)], ['Right'])
+            (x, _), = self.tracker.get_fist_positions()
+            raw_x, _ = self.tracker.fist_positions[0]
+            centre = (0.45 + 0.1 * 9 / 40) * 640  # between wrist and middle MCP, undisturbed
+            errors.append((abs(x - centre), abs(raw_x - centre)))
+        smoothed_error, raw_error = np.mean(errors[20:], axis=0)
+        self.assertLess(smoothed_error, raw_error / 2)
+
 
 if __name__ == '__main__':
     unittest.main()
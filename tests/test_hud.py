@@ -0,0 +1,75 @@
+import unittest
+import cv2
+import numpy as np
+
+from config.game_config import config
+from rendering.hud import HudLayer
+
+
+def _immediate_hud(frame, score, health, freeze_seconds):
+    """Reference: the HUD drawn straight into the frame every time."""
+    cv2.putText(frame, f"Score: {score}", (10, 30), config.FONT_FACE,
+                config.FONT_SCALE, config.COLOR_TEXT, config.FONT_THICKNESS)
+
+    x, y = config.WINDOW_WIDTH - 210, 10
+    cv2.rectangle(frame, (x, y), (x + 200, y + 20), (100, 100, 100), -1)
+    color = (0, 0, 255) if health < 30 else (0, 165, 255) if health < 60 else (0, 255, 0)
+    cv2.rectangle(frame, (x, y), (x + int(health / 100.0 * 200), y + 20), color, -1)
+    cv2.rectangle(frame, (x, y), (x + 200, y + 20), (255, 255, 255), 1)
+    text = f"{int(health)}%"
+    size = cv2.getTextSize(text, config.FONT_FACE, config.FONT_SCALE * 0.7, config.FONT_THICKNESS)[0]
+    cv2.putText(frame, text, (x + (200 - size[0]) // 2, y + (20 + size[1]) // 2),
+                config.FONT_FACE, config.FONT_SCALE * 0.7, (0, 0, 0), config.FONT_THICKNESS)
+
+    if freeze_seconds is not None:
+        text = f"FREEZE! {freeze_seconds}s"
+        size = cv2.getTextSize(text, config.FONT_FACE, config.FONT_SCALE, config.FONT_THICKNESS)[0]
+        cv2.putText(frame, text, ((config.WINDOW_WIDTH - size[0]) // 2, config.WINDOW_HEIGHT - 30),
+                    config.FONT_FACE, config.FONT_SCALE, (255, 255, 255), config.FONT_THICKNESS + 1)
+
+
+class TestHudLayer(unittest.TestCase):
+    def setUp(self):
+        self.hud = HudLayer()
+        rng = np.random.default_rng(7)
+        self.background = rng.integers(0, 256, (config.WINDOW_HEIGHT, config.WINDOW_WIDTH, 3),
+                                       dtype=np.uint8)
+
+    def _draw(self, score, health, freeze_seconds):
+        self.hud.set('score', score)
+        self.hud.set('health', health)
+        self.hud.set('freeze', freeze_seconds)
+        frame = self.background.copy()
+        self.hud.draw(frame)
+        return frame
+
+    def test_matches_immediate_drawing(self):
+        """Test that cached widgets produce the same pixels as drawing every frame."""
+        for score, health, freeze in ((0, 100, None), (1230, 55.5, 4), (7, 20, 0)):
+            expected = self.background.copy()
+            _immediate_hud(expected, score, health, freeze)
+            # Anti-aliased text edges may differ by a rounding step
+            actual = self._draw(score, health, freeze)
+            np.testing.assert_allclose(actual.astype(int), expected.astype(int), atol=2)
+
+    def test_rerenders_only_changed_widgets(self):
+        """Test that unchanged values reuse the cached widget pixels."""
+        self._draw(10, 100, None)
+        self.assertEqual(self.hud.renders, 3)
+        self._draw(10, 100, None)
+        self.assertEqual(self.hud.renders, 3)
+        self._draw(20, 100, None)
+        self.assertEqual(self.hud.renders, 4)
+        self._draw(20, 100, 3)
+        self.assertEqual(self.hud.renders, 5)
+
+    def test_hidden_widget_has_no_region(self):
+        """Test that the freeze text only occupies a region while shown."""
+        self._draw(0, 100, None)
+        self.assertEqual(len(self.hud.regions()), 2)
+        self._draw(0, 100, 5)
+        self.assertEqual(len(self.hud.regions()), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
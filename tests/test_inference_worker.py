@@ -0,0 +1,99 @@
+import time
+import unittest
+import numpy as np
+
+from input.hand_detectors import HandDetections
+from input.inference_worker import HandInferenceWorker, LatestFrameMailbox
+
+
+class FakeTracker:
+    """Stands in for HandTracker: reports the frame's fill value as a fist."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.fist_positions = []
+        self.detections = HandDetections.empty()
+        self.seen = []
+
+    def process_frame(self, frame, timestamp=None):
+        time.sleep(self.delay)
+        value = int(frame[0, 0, 0])
+        self.seen.append(value)
+        self.fist_positions = [(value, value)]
+
+    def get_fist_positions(self):
+        return [(float(x), float(y)) for x, y in self.fist_positions]
+
+
+def _frame(value: int) -> np.ndarray:
+    return np.full((4, 4, 3), value, dtype=np.uint8)
+
+
+class TestLatestFrameMailbox(unittest.TestCase):
+    def test_newest_frame_wins(self):
+        """Test that frames not yet taken are replaced by newer ones."""
+        mailbox = LatestFrameMailbox()
+        for value in (1, 2, 3):
+            mailbox.put(_frame(value), timestamp=float(value))
+        frame, timestamp = mailbox.take(timeout=0)
+        self.assertEqual((frame[0, 0, 0], timestamp), (3, 3.0))
+        self.assertEqual(mailbox.dropped, 2)
+        self.assertIsNone(mailbox.take(timeout=0))
+
+    def test_put_copies_the_frame(self):
+        """Test that the producer may reuse its frame right after submitting."""
+        mailbox = LatestFrameMailbox()
+        source = _frame(5)
+        mailbox.put(source, timestamp=0.0)
+        source[:] = 9
+        frame, _ = mailbox.take(timeout=0)
+        self.assertEqual(frame[0, 0, 0], 5)
+
+    def test_buffers_are_reused(self):
+        """Test that released buffers are recycled instead of reallocated."""
+        mailbox = LatestFrameMailbox()
+        buffers = set()
+        for value in range(6):
+            mailbox.put(_frame(value), timestamp=0.0)
+            frame, _ = mailbox.take(timeout=0)
+            buffers.add(id(frame))
+            mailbox.release(frame)
+        self.assertLessEqual(len(buffers), 2)
+
+    def test_close_wakes_consumer(self):
+        """Test that closing the mailbox unblocks a waiting take."""
+        mailbox = LatestFrameMailbox()
+        mailbox.close()
+        self.assertIsNone(mailbox.take(timeout=1.0))
+
+
+class TestHandInferenceWorker(unittest.TestCase):
+    def test_worker_publishes_latest_result(self):
+        """Test that a slow tracker skips stale frames and reports the newest."""
+        tracker = FakeTracker(delay=0.02)
+        worker = HandInferenceWorker(tracker)
+        worker.start()
+        try:
+            for value in range(1, 21):
+                worker.submit(_frame(value), timestamp=float(value))
+                time.sleep(0.002)
+            deadline = time.time() + 2.0
+            while worker.latest().captured_at != 20.0 and time.time() < deadline:
+                time.sleep(0.005)
+        finally:
+            worker.stop()
+
+        result = worker.latest()
+        self.assertEqual(result.captured_at, 20.0)
+        self.assertEqual(result.fist_positions, [(20.0, 20.0)])
+        self.assertLess(len(tracker.seen), 20)
+        self.assertEqual(tracker.seen, sorted(tracker.seen))
+
+    def test_latest_before_any_frame_is_empty(self):
+        """Test that the game can read a result before inference has run."""
+        worker = HandInferenceWorker(FakeTracker())
+        self.assertEqual(worker.latest().fist_positions, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
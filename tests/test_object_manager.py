@@ -0,0 +1,166 @@
+import unittest
+import numpy as np
+
+from objects.object_manager import ObjectManager
+from objects.bubble import Bubble
+from objects.power import Power
+from objects.object_store import ObjectStore
+from config.game_config import GameConfig
+
+
+class TestObjectStore(unittest.TestCase):
+    def setUp(self):
+        self.manager = ObjectManager(max_objects=4)
+
+    def test_spawned_objects_are_views_over_store_rows(self):
+        """Test that object attributes read and write the store columns."""
+        bubble = self.manager.spawn_bubble()
+        self.assertIs(bubble._store, self.manager.store)
+        self.assertEqual(self.manager.store.y[bubble._slot], bubble.y)
+
+        bubble.x = 123.0
+        self.assertEqual(self.manager.store.x[bubble._slot], 123.0)
+
+    def test_update_all_matches_scalar_update(self):
+        """Test that the vectorized update moves objects like obj.update does."""
+        bubble = self.manager.spawn_bubble()
+        power = self.manager.spawn_power()
+        reference = Bubble(x=bubble.x, y=bubble.y, radius=bubble.radius, speed=bubble.speed)
+        start_pulse = power.pulse_timer
+        start_y = power.y
+
+        self.manager.update_all(0.5)
+        reference.update(0.5)
+
+        self.assertAlmostEqual(bubble.y, reference.y)
+        self.assertAlmostEqual(power.y, start_y + Power.POWER_SPEED * 0.5)
+        self.assertAlmostEqual(power.pulse_timer, start_pulse + power.pulse_speed * 0.5)
+
+    def test_frozen_objects_do_not_move(self):
+        """Test that freeze_all stops bubbles but not power-ups."""
+        bubble = self.manager.spawn_bubble()
+        power = self.manager.spawn_power()
+        bubble_y, power_y = bubble.y, power.y
+
+        self.manager.freeze_all(True)
+        self.manager.update_all(1.0)
+
+        self.assertTrue(bubble.frozen)
+        self.assertEqual(bubble.y, bubble_y)
+        self.assertGreater(power.y, power_y)
+
+    def test_update_all_removes_objects_past_despawn_line(self):
+        """Test that objects falling past the despawn line are returned to the pool."""
+        stays = self.manager.spawn_bubble()
+        leaves = self.manager.spawn_bubble()
+        leaves.y = Bubble.DESPAWN_Y + 500
+
+        self.manager.update_all(0.0)
+
+        self.assertEqual(self.manager.objects, [stays])
+        self.assertIsNone(leaves._store)
+        self.assertFalse(leaves.active)
+        self.assertIn(leaves, self.manager._object_pool[GameConfig.BUBBLE])
+
+    def test_remove_keeps_rows_dense(self):
+        """Test that removing an object moves the last row into its slot."""
+        first = self.manager.spawn_bubble()
+        second = self.manager.spawn_bubble()
+        third = self.manager.spawn_power()
+        third_y = third.y
+
+        self.manager.remove_object(first)
+
+        self.assertEqual(len(self.manager.store), 2)
+        self.assertEqual(third._slot, 0)
+        self.assertEqual(third.y, third_y)
+        self.assertEqual(self.manager.objects, [third, second])
+
+    def test_store_grows_past_initial_capacity(self):
+        """Test that the store reallocates its columns when full."""
+        store = ObjectStore(capacity=2)
+        bubbles = [Bubble(x=i, y=10.0 * i) for i in range(10)]
+        for bubble in bubbles:
+            store.add(bubble)
+        self.assertEqual(len(store), 10)
+        np.testing.assert_array_equal(store.column('y'), [b.y for b in bubbles])
+
+    def test_removed_object_keeps_its_values(self):
+        """Test that detaching copies the row back into the object."""
+        bubble = self.manager.spawn_bubble()
+        bubble.y = 42.0
+        self.manager.remove_object(bubble)
+        self.assertEqual(bubble.y, 42.0)
+
+
+class TestObjectHandles(unittest.TestCase):
+    def setUp(self):
+        self.manager = ObjectManager()
+
+    def test_handle_follows_object_across_swap_removal(self):
+        """Test that a handle still resolves after its object's row moves."""
+        first = self.manager.spawn_bubble()
+        last = self.manager.spawn_bubble()
+        handle = last.handle
+
+        self.manager.remove_object(first)
+
+        self.assertEqual(last._slot, 0)
+        self.assertIs(self.manager.get(handle), last)
+
+    def test_handle_goes_stale_when_object_is_recycled(self):
+        """Test that a respawned pooled object gets a new generation."""
+        bubble = self.manager.spawn_bubble()
+        old_handle = bubble.handle
+        self.manager.remove_object(bubble)
+
+        respawned = self.manager.spawn_bubble()
+
+        self.assertIs(respawned, bubble)
+        self.assertIsNone(self.manager.get(old_handle))
+        self.assertNotEqual(respawned.handle, old_handle)
+        self.assertIs(self.manager.get(respawned.handle), respawned)
+
+    def test_contains_and_double_remove(self):
+        """Test constant-time membership and that removing twice is harmless."""
+        bubble = self.manager.spawn_bubble()
+        other = self.manager.spawn_bubble()
+        self.assertTrue(self.manager.contains(bubble))
+
+        pool = self.manager._object_pool[GameConfig.BUBBLE]
+        pooled = len(pool)
+
+        self.manager.remove_object(bubble)
+        self.manager.remove_object(bubble)
+
+        self.assertFalse(self.manager.contains(bubble))
+        self.assertEqual(self.manager.objects, [other])
+        self.assertEqual(len(pool), pooled + 1)
+
+    def test_remove_while_iterating(self):
+        """Test that removing every object while iterating get_objects visits all of them."""
+        spawned = [self.manager.spawn_bubble() for _ in range(10)]
+        visited = []
+        for obj in self.manager.get_objects():
+            visited.append(obj)
+            self.manager.remove_object(obj)
+        self.assertCountEqual(visited, spawned)
+        self.assertEqual(len(self.manager.store), 0)
+
+    def test_get_objects_below(self):
+        """Test that objects past a line are found in one pass."""
+        above = self.manager.spawn_bubble()
+        below = self.manager.spawn_bubble()
+        below.y = 1000.0
+        self.assertEqual(self.manager.get_objects_below(600), [below])
+        self.assertNotIn(above, self.manager.get_objects_below(600))
+
+    def test_reset_invalidates_handles(self):
+        """Test that reset removes everything and stales every handle."""
+        handles = [self.manager.spawn_power().handle for _ in range(3)]
+        self.manager.reset()
+        self.assertTrue(all(self.manager.get(h) is None for h in handles))
+
+
+if __name__ == '__main__':
+    unittest.main()
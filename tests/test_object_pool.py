@@ -1,8 +1,13 @@
 import unittest
+import math
+import cv2
 from unittest.mock import Mock, patch, MagicMock
 import numpy as np
 from objects.bubble import Bubble
 from objects.power import Power, PowerType
+from objects.object_pool import ObjectPool
+from objects.object_manager import ObjectManager
+from config.game_config import config, GameConfig, SpawnPolicy
 
 class TestPowerObject(unittest.TestCase):
     def setUp(self):
@@ -64,6 +69,35 @@ class TestPowerObject(unittest.TestCase):
         self.assertEqual(self.power.power_type, original_power_type)
         self.assertTrue(self.power.active)
     
+    def test_draw_matches_live_rendering_at_sampled_phases(self):
+        """Test that pre-baked pulse frames look like the per-frame sin() drawing."""
+        frame_count = config.POWER_PULSE_FRAMES
+        for i in (0, frame_count // 4, frame_count // 2, 3 * frame_count // 4):
+            self.power.pulse_timer = 2 * math.pi * i / frame_count
+            drawn = np.zeros_like(self.test_img)
+            self.power.draw(drawn)
+
+            expected = np.zeros_like(self.test_img)
+            radius = int(self.power.radius * (np.sin(self.power.pulse_timer) * 0.1 + 1.0))
+            center = (self.x, self.y)
+            cv2.circle(expected, center, radius, Power.POWER_COLORS[self.power_type], -1)
+            cv2.circle(expected, center, radius, (255, 255, 255), 1)
+            (tw, th), _ = cv2.getTextSize('F', config.FONT_FACE, 0.8, 2)
+            tx, ty = int(self.x - tw / 2), int(self.y + th / 2)
+            cv2.putText(expected, 'F', (tx + 1, ty + 1), config.FONT_FACE, 0.8, (0, 0, 0), 2)
+            cv2.putText(expected, 'F', (tx, ty), config.FONT_FACE, 0.8, (255, 255, 255), 2)
+
+            np.testing.assert_array_equal(drawn, expected)
+
+    def test_animation_is_rendered_once(self):
+        """Test that drawing reuses the pre-baked atlas."""
+        Power.prebake_animations()
+        misses = Power.animations.stats.misses
+        for _ in range(10):
+            self.power.update(0.1)
+            self.power.draw(self.test_img)
+        self.assertEqual(Power.animations.stats.misses, misses)
+
     def test_power_type_enum(self):
         """Test that power type is a valid enum value."""
         self.assertIn(self.power.power_type, list(PowerType))
@@ -85,5 +119,111 @@ class TestBubbleObject(unittest.TestCase):
         self.assertEqual(bubble.speed, 100)
         self.assertTrue(bubble.active)
 
+class TestObjectPool(unittest.TestCase):
+    def test_pool_is_prewarmed(self):
+        """Test that the pool allocates its warm instances up front."""
+        pool = ObjectPool(Bubble, capacity=10, prewarm=4)
+        self.assertEqual(len(pool), 4)
+        self.assertEqual(pool.stats.allocations, 4)
+
+    def test_acquire_reuses_instances(self):
+        """Test that released objects are handed out again."""
+        pool = ObjectPool(Bubble, capacity=10, prewarm=1)
+        first = pool.acquire(x=10, y=20)
+        pool.release(first)
+        second = pool.acquire(x=30, y=40)
+        self.assertIs(first, second)
+        self.assertEqual((second.x, second.y), (30, 40))
+        self.assertTrue(second.active)
+        self.assertEqual(pool.stats.hits, 2)
+        self.assertEqual(pool.stats.misses, 0)
+
+    def test_empty_pool_allocates(self):
+        """Test that a miss constructs a new instance and is counted."""
+        pool = ObjectPool(Bubble, capacity=10)
+        pool.acquire(x=1, y=2)
+        self.assertEqual(pool.stats.misses, 1)
+        self.assertEqual(pool.stats.allocations, 1)
+
+    def test_pool_is_bounded(self):
+        """Test that releases beyond capacity are discarded."""
+        pool = ObjectPool(Bubble, capacity=2)
+        for _ in range(3):
+            pool.release(Bubble(x=0, y=0))
+        self.assertEqual(len(pool), 2)
+        self.assertEqual(pool.stats.discarded, 1)
+
+
+class TestAdmissionControl(unittest.TestCase):
+    def test_drop_policy(self):
+        """Test that spawns beyond max_objects are dropped."""
+        manager = ObjectManager(max_objects=2, spawn_policy=SpawnPolicy.DROP)
+        spawned = [manager.spawn_bubble() for _ in range(3)]
+        self.assertIsNone(spawned[2])
+        self.assertEqual(len(manager.objects), 2)
+        self.assertEqual(manager.admission_stats.dropped, 1)
+
+    def test_defer_policy(self):
+        """Test that deferred spawns happen once an object leaves."""
+        manager = ObjectManager(max_objects=2, spawn_policy=SpawnPolicy.DEFER)
+        first = manager.spawn_bubble()
+        manager.spawn_bubble()
+        self.assertIsNone(manager.spawn_power())
+
+        manager.remove_object(first)
+        manager.update_all(0.0)
+
+        self.assertEqual(len(manager.objects), 2)
+        self.assertEqual(len(manager.get_objects(GameConfig.POWER)), 1)
+        self.assertEqual(manager.admission_stats.deferred, 1)
+
+    def test_defer_overflow_is_counted_as_dropped(self):
+        """Test that spawns beyond the deferred backlog are dropped and counted."""
+        manager = ObjectManager(max_objects=2, spawn_policy=SpawnPolicy.DEFER)
+        for _ in range(2 + 2):
+            manager.spawn_bubble()
+        self.assertIsNone(manager.spawn_power())
+
+        self.assertEqual(manager.admission_stats.deferred, 2)
+        self.assertEqual(manager.admission_stats.dropped, 1)
+        # The power-up was the one dropped: the backlog keeps the earlier spawns
+        manager.remove_all()
+        manager.update_all(0.0)
+        self.assertEqual(len(manager.get_objects(GameConfig.BUBBLE)), 2)
+        self.assertEqual(manager.get_objects(GameConfig.POWER), [])
+
+    def test_recycle_policy(self):
+        """Test that the oldest object makes room for a new spawn."""
+        manager = ObjectManager(max_objects=2, spawn_policy=SpawnPolicy.RECYCLE)
+        oldest = manager.spawn_bubble()
+        newer = manager.spawn_bubble()
+        newest = manager.spawn_power()
+        self.assertIsNotNone(newest)
+        self.assertFalse(manager.contains(oldest))
+        self.assertCountEqual(manager.objects, [newer, newest])
+        self.assertEqual(manager.admission_stats.recycled, 1)
+
+    def test_pools_survive_reset(self):
+        """Test that reset returns on-screen objects to the pools."""
+        manager = ObjectManager(max_objects=10)
+        bubbles = [manager.spawn_bubble() for _ in range(5)]
+        manager.reset()
+        self.assertEqual(len(manager.objects), 0)
+        self.assertTrue(all(b in manager._object_pool[GameConfig.BUBBLE] for b in bubbles))
+
+    def test_no_allocation_in_steady_state(self):
+        """Test that spawn/remove cycles within the pre-warmed size never allocate."""
+        manager = ObjectManager(max_objects=50)
+        stats = manager.pool_stats()[GameConfig.BUBBLE]
+        warm = stats.allocations
+        for _ in range(200):
+            bubbles = [manager.spawn_bubble() for _ in range(10)]
+            for bubble in bubbles:
+                manager.remove_object(bubble)
+            manager.reset()
+        self.assertEqual(stats.allocations, warm)
+        self.assertEqual(stats.misses, 0)
+
+
 if __name__ == '__main__':
     unittest.main()
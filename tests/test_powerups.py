@@ -1,6 +1,6 @@
 import unittest
 import time
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 from events.base_event import GameEvent, EventType
 from events.observers.destroy_observer import DestroyObserver
@@ -56,12 +56,11 @@ class TestPowerupObservers(unittest.TestCase):
         # Assert
         self.assertEqual(self.mock_game_engine.health, config.INITIAL_HEALTH)
 
-    @patch('time.time')
-    def test_freeze_observer_activates_freeze(self, mock_time):
+    def test_freeze_observer_activates_freeze(self):
         """Verify that the FreezeObserver correctly activates the freeze state."""
         # Arrange
         current_time = 1000.0
-        mock_time.return_value = current_time
+        self.mock_game_engine.now.return_value = current_time
         freeze_observer = FreezeObserver(self.mock_game_engine)
         freeze_event = GameEvent(EventType.POWER_ACTIVATED, {"power_type": PowerType.FREEZE})
 
@@ -0,0 +1,138 @@
+import unittest
+import cv2
+import numpy as np
+
+from config.game_config import config
+from objects.object_manager import ObjectManager
+from rendering.renderer import Layer, Renderer
+
+
+def _direct_text(frame, text, position, color, scale, thickness, outline_color=None):
+    """Reference: the original putText-per-call drawing."""
+    x, y = position
+    if outline_color is not None:
+        for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1), (-1, 0), (1, 0), (0, -1), (0, 1)]:
+            cv2.putText(frame, text, (x + dx, y + dy), cv2.FONT_HERSHEY_SIMPLEX, scale,
+                        outline_color, thickness + 1)
+    cv2.putText(frame, text, (x, y), cv2.FONT_HERSHEY_SIMPLEX, scale, color, thickness)
+
+
+class TestTextCache(unittest.TestCase):
+    def setUp(self):
+        self.renderer = Renderer()
+        rng = np.random.default_rng(11)
+        self.background = rng.integers(0, 256, (120, 320, 3), dtype=np.uint8)
+
+    def _draw_both(self, outline):
+        expected = self.background.copy()
+        _direct_text(expected, "Score: 42", (20, 60), (255, 255, 255), 1.0, 2,
+                     (0, 0, 0) if outline else None)
+        frame = self.background.copy()
+        self.renderer.draw_text(frame, "Score: 42", (20, 60), color=(255, 255, 255),
+                                font_scale=1.0, thickness=2, outline=outline)
+        return frame, expected
+
+    def test_cached_text_matches_direct_drawing(self):
+        """Test that blitted text bitmaps reproduce putText."""
+        frame, expected = self._draw_both(outline=False)
+        # Anti-aliased edges may differ by a rounding step
+        np.testing.assert_allclose(frame.astype(int), expected.astype(int), atol=2)
+
+    def test_dilated_outline_matches_offset_outline(self):
+        """Test that the dilation outline looks like the 8-offset outline."""
+        frame, expected = self._draw_both(outline=True)
+        touched = np.any(expected != self.background, axis=2)
+        self.assertFalse(np.any(frame[~touched] != self.background[~touched]))
+        # Only anti-aliased edge pixels differ
+        diff = np.abs(frame.astype(int) - expected.astype(int))[touched]
+        self.assertLess(diff.mean(), 8)
+
+    def test_outline_width_is_configurable(self):
+        """Test that a wider outline covers more pixels in the requested colour."""
+        coverage = []
+        for width in (1, 3):
+            frame = np.zeros((120, 320, 3), dtype=np.uint8)
+            self.renderer.draw_text(frame, "Hi", (20, 60), color=(255, 255, 255),
+                                    outline=True, outline_color=(0, 0, 200), outline_width=width)
+            coverage.append(np.count_nonzero(frame[:, :, 2] == 200))
+        self.assertGreater(coverage[1], coverage[0])
+
+    def test_repeated_text_hits_cache(self):
+        """Test that redrawing the same string reuses its bitmap."""
+        frame = self.background.copy()
+        for _ in range(5):
+            self.renderer.draw_text(frame, "Score: 7", (10, 30), outline=True)
+        self.renderer.draw_text(frame, "Score: 8", (10, 30), outline=True)
+        stats = self.renderer.text_cache_stats
+        self.assertEqual((stats.hits, stats.misses), (4, 2))
+
+    def test_key_includes_style(self):
+        """Test that the same text in another colour is rasterized separately."""
+        frame = self.background.copy()
+        self.renderer.draw_text(frame, "Hi", (10, 40), color=(255, 0, 0))
+        self.renderer.draw_text(frame, "Hi", (10, 40), color=(0, 255, 0))
+        self.assertEqual(self.renderer.text_cache_stats.misses, 2)
+
+    def test_text_clips_at_frame_edges(self):
+        """Test that text partially off screen is clipped instead of raising."""
+        frame = self.background.copy()
+        self.renderer.draw_text(frame, "Edge", (-15, 5), outline=True)
+        self.renderer.draw_text(frame, "Edge", (300, 118), outline=True)
+
+
+
+class TestCommandList(unittest.TestCase):
+    def setUp(self):
+        self.renderer = Renderer()
+        self.frame = np.zeros((100, 100, 3), dtype=np.uint8)
+
+    def test_commands_run_in_layer_order(self):
+        """Test that flush sorts by layer and keeps submission order within one."""
+        calls = []
+        self.renderer.submit(Layer.HUD, lambda frame: calls.append('hud'))
+        self.renderer.submit(Layer.OBJECTS, lambda frame: calls.append('a'))
+        self.renderer.submit(Layer.OBJECTS, lambda frame: calls.append('b'))
+        self.renderer.flush(self.frame)
+        self.assertEqual(calls, ['a', 'b', 'hud'])
+
+        # The list is cleared after each flush
+        self.renderer.flush(self.frame)
+        self.assertEqual(calls, ['a', 'b', 'hud'])
+
+    def test_off_screen_commands_are_culled(self):
+        """Test that commands whose bounds miss the frame never run."""
+        calls = []
+        self.renderer.submit(Layer.OBJECTS, lambda frame: calls.append('above'), (10, -50, 20, 20))
+        self.renderer.submit(Layer.OBJECTS, lambda frame: calls.append('edge'), (90, 90, 20, 20))
+        self.renderer.flush(self.frame)
+        self.assertEqual(calls, ['edge'])
+        self.assertEqual((self.renderer.stats.culled, self.renderer.stats.executed), (1, 1))
+
+    def test_overlapping_blends_share_one_region(self):
+        """Test that overlapping blended commands are composited in one pass."""
+        def fill(frame):
+            frame[:] = 255
+        self.renderer.submit(Layer.OVERLAY, fill, (0, 0, 30, 30), blend=True)
+        self.renderer.submit(Layer.OVERLAY, fill, (20, 20, 30, 30), blend=True)
+        self.renderer.submit(Layer.OVERLAY, fill, (70, 70, 10, 10), blend=True)
+        self.renderer.flush(self.frame)
+        self.assertEqual(self.renderer.stats.blend_regions, 2)
+
+        # Blended once, at UI opacity, only inside the merged boxes
+        self.assertEqual(self.frame[25, 25, 0], round(255 * config.UI_OPACITY))
+        self.assertEqual(self.frame[60, 60, 0], 0)
+
+    def test_object_manager_submits_visible_objects(self):
+        """Test that objects above the screen are culled by their bounds."""
+        manager = ObjectManager()
+        manager.spawn_bubble().y = 50.0
+        manager.spawn_bubble().y = -500.0
+        manager.draw_all(self.renderer)
+        frame = np.zeros((600, 800, 3), dtype=np.uint8)
+        self.renderer.flush(frame)
+        self.assertEqual((self.renderer.stats.executed, self.renderer.stats.culled), (1, 1))
+        self.assertTrue(frame.any())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,185 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import numpy as np
+
+from config.game_config import config, GameState, PowerType
+from core.simulation import RecordedFists, ScriptedFists, SimulatedClock, Simulation
+from events.base_event import GameEvent, EventType
+from input.hand_detectors import HandDetections, IHandDetector, RecordingDetector
+from objects.bubble import Bubble
+
+
+def _fist(x, y):
+    """Normalized landmarks of a fist whose centre is at (x, y)."""
+    hand = np.zeros((21, 3))
+    hand[0] = (x, y + 0.1, 0.0)  # Wrist
+    hand[[5, 9, 13, 17]] = (x, y - 0.1, 0.0)  # Finger MCPs
+    hand[[8, 12, 16, 20]] = (x, y + 0.05, 0.0)  # Tips curled back towards the wrist
+    hand[4] = (x + 0.05, y - 0.1, 0.0)  # Thumb over the fingers
+    return hand
+
+
+class ListDetector(IHandDetector):
+    """Reports one list of landmark hands per call."""
+
+    def __init__(self, frames):
+        self.frames = list(frames)
+
+    def detect(self, image):
+        return HandDetections.from_landmarks(np.array(self.frames.pop(0)))
+
+
+class TestScriptedFists(unittest.TestCase):
+    def test_waypoints_are_interpolated(self):
+        """Test that waypoint paths move linearly and exist only within their track."""
+        fists = ScriptedFists.from_waypoints([(1.0, 100, 200), (2.0, 300, 200)],
+                                             [(0.0, 50, 50), (10.0, 50, 150)])
+        self.assertEqual(fists.positions(0.5), [(50.0, 55.0)])
+        self.assertEqual(fists.positions(1.5), [(200.0, 200.0), (50.0, 65.0)])
+        self.assertEqual(fists.positions(11.0), [])
+
+    def test_paths_can_be_functions(self):
+        """Test that any function of time can drive a fist."""
+        fists = ScriptedFists(lambda t: (t, 2 * t), lambda t: None)
+        self.assertEqual(fists.positions(3.0), [(3.0, 6.0)])
+
+
+class TestSimulation(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.multiple(config, BUBBLE_SPAWN_RATE=0.0, POWER_SPAWN_RATE=0.0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _simulation(self, source=None, **kwargs):
+        simulation = Simulation(source or ScriptedFists(), **kwargs)
+        self.addCleanup(simulation.close)
+        return simulation
+
+    def test_headless_engine_has_no_camera_model_or_window(self):
+        """Test that the headless engine builds no tracker, renderer or dispatch thread."""
+        engine = self._simulation().engine
+        self.assertIsNone(engine.hand_tracker)
+        self.assertIsNone(engine.renderer)
+        self.assertIsNone(engine.hand_worker)
+        self.assertIsNone(engine.event_manager._dispatch_thread)
+
+    def test_keys_work_without_overlay(self):
+        """Test that the debug overlay key is ignored by a headless engine."""
+        engine = self._simulation().engine
+        self.assertTrue(engine.handle_key(ord(config.DEBUG_OVERLAY_KEY)))
+        self.assertIsNone(engine.debug_overlay)
+
+    def test_clock_only_moves_with_ticks(self):
+        """Test that game time is simulated, advancing by dt per tick."""
+        simulation = self._simulation(dt=0.5)
+        simulation.run(ticks=4)
+        self.assertEqual(simulation.engine.now(), 2.0)
+        self.assertEqual(simulation.stats().duration, 2.0)
+
+    def test_countdown_runs_on_simulated_time(self):
+        """Test that the game starts once the countdown has elapsed in game time."""
+        simulation = self._simulation(dt=1.0, skip_countdown=False)
+        simulation.run(ticks=config.INITIAL_COUNTDOWN - 1)
+        self.assertEqual(simulation.engine.state, GameState.INIT)
+        simulation.tick()
+        self.assertEqual(simulation.engine.state, GameState.RUNNING)
+
+    def test_fist_pops_bubble_and_scores(self):
+        """Test that a scripted fist pops a bubble and observers update the score."""
+        simulation = self._simulation(ScriptedFists(lambda t: (400.0, 300.0)))
+        simulation.engine.object_manager.add_object(Bubble(400.0, 300.0, radius=40, speed=0.0))
+        stats = simulation.run(ticks=1)
+        self.assertEqual(stats.bubbles_hit, 1)
+        self.assertEqual(stats.score, config.SCORE_PER_POP)
+        self.assertEqual(simulation.engine.object_manager.get_objects(), [])
+
+    def test_fists_are_used_exactly_as_scripted(self):
+        """Test that headless collision skips fist prediction even when it is enabled."""
+        simulation = self._simulation(ScriptedFists(lambda t: (400.0, 300.0)))
+        # Just out of reach of an exact fist; a widened one would pop it
+        simulation.engine.object_manager.add_object(
+            Bubble(400.0, 300.0 + 40 + config.FIST_RADIUS + 2, radius=40, speed=0.0))
+        with patch.object(config, 'FIST_PREDICTION', True):
+            stats = simulation.run(ticks=5)
+        self.assertEqual(stats.bubbles_hit, 0)
+
+    def test_misses_end_the_game(self):
+        """Test that missed bubbles drain health and the run stops at game over."""
+        simulation = self._simulation(dt=0.1)
+        misses = int(np.ceil(config.INITIAL_HEALTH / config.HEALTH_DECREASE_ON_MISS))
+        for _ in range(misses):
+            simulation.engine.object_manager.add_object(
+                Bubble(400.0, config.WINDOW_HEIGHT + 100.0, radius=40, speed=0.0))
+        stats = simulation.run(ticks=100)
+        self.assertEqual(stats.bubbles_missed, misses)
+        self.assertEqual(stats.health, 0)
+        self.assertIsNotNone(stats.game_over_at)
+        self.assertLess(stats.ticks, 100)
+        self.assertEqual(simulation.engine.state, GameState.GAME_OVER)
+
+    def test_freeze_lasts_power_duration_in_game_time(self):
+        """Test that power-up effects expire on the simulated clock."""
+        simulation = self._simulation(dt=0.5)
+        simulation.engine.event_manager.post(
+            GameEvent(EventType.POWER_ACTIVATED, {"power_type": PowerType.FREEZE}))
+        simulation.tick()
+        self.assertTrue(simulation.engine.is_frozen)
+        self.assertEqual(simulation.stats().powers, {PowerType.FREEZE: 1})
+        simulation.run(ticks=int(config.POWER_DURATION / 0.5) + 1)
+        self.assertFalse(simulation.engine.is_frozen)
+
+    def test_seeded_runs_are_reproducible(self):
+        """Test that the same seed and input give the same game."""
+        sweep = ScriptedFists(lambda t: (400 + 300 * np.sin(t), 400.0))
+        with patch.multiple(config, BUBBLE_SPAWN_RATE=0.2, POWER_SPAWN_RATE=0.01):
+            first = self._simulation(sweep, seed=7).run(duration=60.0)
+            second = self._simulation(sweep, seed=7).run(duration=60.0)
+        self.assertGreater(first.bubbles_hit + first.bubbles_missed, 0)
+        self.assertEqual((first.ticks, first.score, first.health, first.bubbles_hit, first.powers),
+                         (second.ticks, second.score, second.health, second.bubbles_hit, second.powers))
+
+    def test_runs_thousands_of_ticks_per_second(self):
+        """Test that headless ticks are cheap enough for bulk runs."""
+        with patch.multiple(config, BUBBLE_SPAWN_RATE=0.05, POWER_SPAWN_RATE=0.002):
+            stats = self._simulation(ScriptedFists(lambda t: (400.0, 400.0)), seed=1).run(
+                ticks=3000, until_game_over=False)
+        self.assertEqual(stats.ticks, 3000)
+        self.assertGreater(stats.ticks_per_second, 1000)
+
+    def test_needs_a_length(self):
+        """Test that a run must be bounded."""
+        with self.assertRaises(ValueError):
+            self._simulation().run()
+
+
+class TestRecordedFists(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), 'fists.npz')
+        recorder = RecordingDetector(ListDetector([[_fist(0.5, 0.5)], [], [_fist(0.25, 0.5)]]))
+        for _ in range(3):
+            recorder.detect(None)
+        recorder.save(self.path)
+
+    def tearDown(self):
+        os.remove(self.path)
+        os.rmdir(os.path.dirname(self.path))
+
+    def test_recording_plays_at_its_frame_rate(self):
+        """Test that recorded frames advance with game time, not ticks."""
+        fists = RecordedFists(self.path, frame_rate=4.0, loop=False)
+        clock = SimulatedClock()
+        seen = []
+        for _ in range(8):
+            seen.append(fists.positions(clock()))
+            clock.advance(0.125)
+        width, height = config.WINDOW_WIDTH, config.WINDOW_HEIGHT
+        self.assertEqual(seen[:2], [[(0.5 * width, 0.5 * height)]] * 2)
+        self.assertEqual(seen[2:4], [[], []])
+        self.assertEqual(seen[4:6], [[(0.25 * width, 0.5 * height)]] * 2)
+        self.assertEqual(seen[6:], [[], []])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+import numpy as np
+
+from input.smoothing import OneEuroFilter
+
+
+class TestOneEuroFilter(unittest.TestCase):
+    def _run(self, positions, rate=30.0, **kwargs):
+        smoother = OneEuroFilter(**{'min_cutoff': 1.0, 'beta': 0.01, **kwargs})
+        return np.array([smoother(p, i / rate).copy() for i, p in enumerate(positions)])
+
+    def test_first_sample_passes_through(self):
+        """Test that the filter starts at the first sample."""
+        self.assertEqual(self._run([(10.0, 20.0)]).tolist(), [[10.0, 20.0]])
+
+    def test_jitter_is_suppressed_at_rest(self):
+        """Test that a still hand with detection noise comes out steadier."""
+        rng = np.random.default_rng(0)
+        raw = 300 + rng.normal(0, 3, size=(90, 2))
+        smoothed = self._run(raw)
+        self.assertLess(smoothed[30:].std(axis=0).max(), raw[30:].std(axis=0).min() / 2)
+
+    def test_fast_motion_has_little_lag(self):
+        """Test that the cutoff rises with speed so a fast hand is followed closely."""
+        raw = np.stack([np.arange(30) * 40.0, np.zeros(30)], axis=1)  # 1200 px/s
+        adaptive = self._run(raw)
+        fixed = self._run(raw, beta=0.0)
+        self.assertLess(raw[-1, 0] - adaptive[-1, 0], 40.0)
+        self.assertLess(raw[-1, 0] - adaptive[-1, 0], (raw[-1, 0] - fixed[-1, 0]) / 4)
+
+    def test_repeated_timestamp_is_ignored(self):
+        """Test that a sample without elapsed time does not divide by zero."""
+        smoother = OneEuroFilter(min_cutoff=1.0, beta=0.01)
+        smoother((0.0, 0.0), 1.0)
+        self.assertEqual(smoother((50.0, 0.0), 1.0).tolist(), [0.0, 0.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
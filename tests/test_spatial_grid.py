@@ -0,0 +1,78 @@
+import unittest
+import numpy as np
+
+from objects.object_manager import ObjectManager
+from objects.spatial_grid import SpatialGrid
+
+
+class TestSpatialGrid(unittest.TestCase):
+    def setUp(self):
+        self.grid = SpatialGrid(width=800, height=600, cell_size=100)
+
+    def test_out_of_field_centres_are_clamped(self):
+        """Test that objects above or beside the field land in border cells."""
+        self.grid.insert(0, -50.0, -50.0, 30.0)
+        self.grid.insert(1, 900.0, 700.0, 30.0)
+        self.assertIn(0, self.grid.buckets[0])
+        self.assertIn(1, self.grid.buckets[-1])
+
+    def test_remove_mirrors_swap_removal(self):
+        """Test that removing a row relabels the last row in its bucket."""
+        self.grid.insert(0, 50.0, 50.0, 30.0)
+        self.grid.insert(1, 750.0, 550.0, 30.0)
+        self.grid.remove(0, 1)
+        self.assertEqual(self.grid.query(0, 0, 800, 600).tolist(), [0])
+        self.assertIn(0, self.grid.buckets[-1])
+
+    def test_sync_only_moves_changed_rows(self):
+        """Test that sync re-buckets rows that crossed a cell boundary."""
+        self.grid.insert(0, 50.0, 50.0, 30.0)
+        self.grid.insert(1, 250.0, 50.0, 30.0)
+        self.grid.sync(np.array([50.0, 250.0]), np.array([150.0, 60.0]), np.array([30.0, 30.0]))
+        self.assertEqual(self.grid.query(0, 100, 99, 199).tolist(), [0])
+        self.assertEqual(self.grid.query(0, 0, 99, 99).size, 0)
+
+
+class TestObjectManagerSpatialQueries(unittest.TestCase):
+    def setUp(self):
+        self.rng = np.random.default_rng(1)
+        self.brute = ObjectManager(max_objects=200, cell_size=None)
+        self.indexed = ObjectManager(max_objects=200, cell_size=64)
+        for _ in range(200):
+            x, y = self.rng.uniform((0, -60), (800, 660))
+            for manager in (self.brute, self.indexed):
+                bubble = manager.spawn_bubble()
+                bubble.x, bubble.y, bubble.radius, bubble.speed = x, y, 30.0, 25.0
+        self.indexed.refresh_spatial_index()
+
+    def test_check_hits_matches_brute_force(self):
+        """Test that grid-accelerated hits equal the all-pairs result."""
+        for _ in range(20):
+            fists = self.rng.uniform((0, 0), (800, 600), size=(2, 2))
+            np.testing.assert_array_equal(self.indexed.check_hits(fists),
+                                          self.brute.check_hits(fists))
+
+    def test_hits_stay_correct_after_objects_fall(self):
+        """Test that incremental updates keep the index in step with the store."""
+        for _ in range(30):
+            for manager in (self.brute, self.indexed):
+                manager.update_all(0.5)
+            fists = self.rng.uniform((0, 0), (800, 600), size=(2, 2))
+            np.testing.assert_array_equal(self.indexed.check_hits(fists),
+                                          self.brute.check_hits(fists))
+
+    def test_objects_near_and_in_rect(self):
+        """Test that range queries agree with and without the grid."""
+        def rows(manager, objects):
+            return sorted(obj._slot for obj in objects)
+
+        for _ in range(20):
+            px, py = self.rng.uniform((0, 0), (800, 600))
+            self.assertEqual(rows(self.indexed, self.indexed.objects_near((px, py), 40)),
+                             rows(self.brute, self.brute.objects_near((px, py), 40)))
+            self.assertEqual(rows(self.indexed, self.indexed.objects_in_rect(px - 80, py - 60, px + 80, py + 60)),
+                             rows(self.brute, self.brute.objects_in_rect(px - 80, py - 60, px + 80, py + 60)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+import numpy as np
+
+from rendering.sprite_cache import Sprite, SpriteCache, blit
+
+
+class TestSpriteCache(unittest.TestCase):
+    def _sprite(self, value: int = 255) -> Sprite:
+        image = np.full((4, 4, 3), value, dtype=np.uint8)
+        return Sprite(image, np.ones((4, 4), dtype=bool), (2, 2))
+
+    def test_cache_renders_once_per_key(self):
+        """Test that a look is rasterized on the first lookup only."""
+        cache = SpriteCache(capacity=4)
+        calls = []
+        for _ in range(3):
+            cache.get('a', lambda: calls.append(1) or self._sprite())
+        self.assertEqual(len(calls), 1)
+        self.assertEqual((cache.stats.hits, cache.stats.misses), (2, 1))
+        self.assertAlmostEqual(cache.stats.hit_rate, 2 / 3)
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test that the LRU bound drops the stalest look."""
+        cache = SpriteCache(capacity=2)
+        cache.get('a', self._sprite)
+        cache.get('b', self._sprite)
+        cache.get('a', self._sprite)
+        cache.get('c', self._sprite)
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertEqual(cache.stats.evictions, 1)
+
+
+class TestBlit(unittest.TestCase):
+    def setUp(self):
+        self.frame = np.zeros((10, 10, 3), dtype=np.uint8)
+
+    def test_masked_copy_only_touches_covered_pixels(self):
+        """Test that a boolean mask copies covered pixels and leaves the rest."""
+        image = np.full((2, 2, 3), 200, dtype=np.uint8)
+        mask = np.array([[True, False], [False, True]])
+        blit(self.frame, image, mask, 3, 4)
+        self.assertEqual(self.frame[4, 3, 0], 200)
+        self.assertEqual(self.frame[4, 4, 0], 0)
+        self.assertEqual(self.frame[5, 4, 0], 200)
+
+    def test_alpha_mask_blends(self):
+        """Test that a uint8 mask alpha-blends with the frame."""
+        self.frame[:] = 100
+        image = np.full((1, 1, 3), 200, dtype=np.uint8)
+        blit(self.frame, image, np.array([[128]], dtype=np.uint8), 0, 0)
+        self.assertEqual(self.frame[0, 0, 0], 150)
+
+    def test_blit_clips_to_frame(self):
+        """Test that sprites hanging over any edge are clipped."""
+        image = np.full((4, 4, 3), 255, dtype=np.uint8)
+        mask = np.ones((4, 4), dtype=bool)
+        blit(self.frame, image, mask, -2, 8)
+        self.assertEqual(int(self.frame[..., 0].sum()) // 255, 4)
+        blit(self.frame, image, mask, 20, 20)  # fully outside: no-op
+
+
+if __name__ == '__main__':
+    unittest.main()